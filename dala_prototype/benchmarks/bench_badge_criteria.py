@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Badge Criteria Dispatch Overhead
+
+Measures the per-evaluation cost of running a badge criteria function three ways:
+
+* legacy     - resolve the function through `sys.modules` and `inspect.signature` on every
+               call (the previous `_execute_badge_criteria_check`);
+* by name    - look the name up in `badge_criteria_registry` (the current
+               `_execute_badge_criteria_check`);
+* bound      - call the `BoundBadgeCriteria` resolved up front (what `BadgeEngine` does).
+
+Usage:
+    python benchmarks/bench_badge_criteria.py [--evaluations 100000]
+"""
+
+import argparse
+import inspect
+import sys
+
+from bench_common import quiet_logging, time_callable
+import hlp_module
+from hlp_module import BADGE_DEFINITIONS, LearnerProfile, badge_criteria_registry, _execute_badge_criteria_check
+
+
+def legacy_execute(check_function_name, learner_profile, curriculum_store=None):
+    """The previous dynamic dispatch, kept here as the baseline."""
+    if not hasattr(sys.modules[hlp_module.__name__], check_function_name):
+        return False
+    check_function = getattr(sys.modules[hlp_module.__name__], check_function_name)
+    sig = inspect.signature(check_function)
+    try:
+        if "curriculum_store" in sig.parameters:
+            return check_function(learner_profile, curriculum_store=curriculum_store)
+        return check_function(learner_profile)
+    except Exception:
+        return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--evaluations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    quiet_logging()
+    profile = LearnerProfile("bench_student")
+    names = [definition["criteria_check_function"] for definition in BADGE_DEFINITIONS.values()]
+    bound = [badge_criteria_registry.get(name) for name in names]
+    rounds = max(1, args.evaluations // len(names))
+    evaluations = rounds * len(names)
+
+    def run_legacy():
+        return [legacy_execute(name, profile) for _ in range(rounds) for name in names]
+
+    def run_by_name():
+        return [_execute_badge_criteria_check(name, profile) for _ in range(rounds) for name in names]
+
+    def run_bound():
+        return [criteria(profile) for _ in range(rounds) for criteria in bound]
+
+    print(f"evaluations={evaluations} badges={len(names)}")
+    results = {}
+    for label, func in (("legacy", run_legacy), ("by name", run_by_name), ("bound", run_bound)):
+        seconds, results[label] = time_callable(func)
+        print(f"{label:8s}: {seconds / evaluations * 1e9:8.0f} ns/evaluation")
+    print(f"parity  : {results['legacy'] == results['by name'] == results['bound']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Badge Evaluation per Mutation
+
+Compares the per-mutation cost of re-checking the whole badge catalogue (what every HLP task
+and `mark_lo_completed` used to do) with the `BadgeEngine`, which only re-evaluates the badges
+subscribed to the changed field. Synthetic catalogues of growing size are spread evenly over the
+profile fields; their criteria never pass, so every badge is evaluated on every run.
+
+Usage:
+    python benchmarks/bench_badge_engine.py [--sizes 5,50,500] [--mutations 2000]
+"""
+
+import argparse
+
+from bench_common import quiet_logging, time_callable
+from hlp_module import BadgeEngine, LearnerProfile
+
+PROFILE_FIELDS = ["learning_preferences", "interests", "struggle_areas", "cognitive_metrics", "completed_los"]
+NEVER_MET_CRITERIA = {
+    "learning_preferences": "check_helping_hand_badge",
+    "interests": "check_helping_hand_badge",
+    "struggle_areas": "check_curiosity_spark_badge",
+    "cognitive_metrics": "check_helping_hand_badge",
+    "completed_los": "check_curiosity_spark_badge"
+}
+
+
+def make_catalogue(size: int) -> dict:
+    """Builds `size` badges spread round-robin over PROFILE_FIELDS whose criteria never pass."""
+    catalogue = {}
+    for index in range(size):
+        field_name = PROFILE_FIELDS[index % len(PROFILE_FIELDS)]
+        badge_id = f"synthetic_badge_{index:04d}"
+        catalogue[badge_id] = {
+            "id": badge_id,
+            "name": f"Synthetic Badge {index}",
+            "criteria_check_function": NEVER_MET_CRITERIA[field_name],
+            "depends_on": [field_name]
+        }
+    return catalogue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="5,50,500")
+    parser.add_argument("--mutations", type=int, default=2000)
+    args = parser.parse_args()
+
+    quiet_logging()
+    profile = LearnerProfile("bench_student")
+    profile.badge_engine = None # Mutations are replayed explicitly below
+
+    print(f"mutations={args.mutations}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        engine = BadgeEngine(make_catalogue(size))
+
+        def full_sweep():
+            for _ in range(args.mutations):
+                engine.evaluate_all(profile)
+
+        def event_driven():
+            for _ in range(args.mutations):
+                engine.on_profile_changed(profile, "cognitive_metrics")
+
+        sweep_seconds, _ = time_callable(full_sweep)
+        engine_seconds, _ = time_callable(event_driven)
+        subscribed = len(engine.badges_by_field.get("cognitive_metrics", ()))
+        print(
+            f"badges={size:5d}  full sweep {sweep_seconds / args.mutations * 1e6:9.1f}us/mutation  "
+            f"engine {engine_seconds / args.mutations * 1e6:9.1f}us/mutation ({subscribed} subscribed)"
+        )
+
+
+if __name__ == "__main__":
+    main()
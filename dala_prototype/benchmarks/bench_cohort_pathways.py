@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Cohort Pathway Generation
+
+Compares generating pathways one learner at a time (a fresh `PathwayGenerator` per learner)
+with `generate_pathways_for_cohort`, which derives eligibility once per set of completed LOs
+and content selections once per preference combination (see `PathwayPrecomputation`). Each
+run starts from freshly loaded profiles, as a daily batch would.
+
+Usage:
+    python benchmarks/bench_cohort_pathways.py [--learners N] [--los N] [--content-per-lo N]
+"""
+
+import argparse
+import random
+
+from bench_common import (
+    quiet_logging, make_synthetic_curriculum, make_synthetic_content,
+    make_synthetic_profiles, time_callable
+)
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator, generate_pathways_for_cohort
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=2000)
+    parser.add_argument("--los", type=int, default=200)
+    parser.add_argument("--content-per-lo", type=int, default=20)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    content_store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, args.content_per_lo))
+    profiles = []
+
+    def load_profiles():
+        # Fresh profiles carry no eligibility tracker from the previous run
+        profiles[:] = make_synthetic_profiles(args.learners, curriculum)
+
+    def per_learner_loop():
+        random.seed(0)
+        return {
+            profile.learner_id: PathwayGenerator(profile, content_store).generate_initial_pathway()
+            for profile in profiles
+        }
+
+    def cohort():
+        random.seed(0)
+        return generate_pathways_for_cohort(profiles, content_store)
+
+    loop_seconds, loop_result = time_callable(per_learner_loop, setup=load_profiles)
+    cohort_seconds, cohort_result = time_callable(cohort, setup=load_profiles)
+
+    print(f"learners={args.learners} los={args.los} content_per_lo={args.content_per_lo}")
+    print(f"per-learner loop : {loop_seconds:8.3f}s  {args.learners / loop_seconds:10.0f} learners/s")
+    print(f"cohort batch     : {cohort_seconds:8.3f}s  {args.learners / cohort_seconds:10.0f} learners/s")
+    print(f"speed-up         : {loop_seconds / cohort_seconds:8.2f}x")
+    print(f"identical output : {loop_result == cohort_result}")
+
+
+if __name__ == "__main__":
+    main()
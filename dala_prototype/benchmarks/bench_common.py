@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark Helpers
+
+Shared helpers for the scripts in this directory:
+1.  Making the DALA modules in the parent directory importable.
+2.  Generating synthetic curricula, content sets and learner profiles at arbitrary scale.
+3.  Timing a callable and reporting the best of several runs.
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# The DALA modules live one directory up and import each other as top-level modules.
+DALA_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if DALA_DIR not in sys.path:
+    sys.path.insert(0, DALA_DIR)
+
+from config import DIFFICULTY_ORDER, ALL_POSSIBLE_CONTENT_TYPES  # noqa: E402
+
+SYNTHETIC_TARGET_PREFERENCES: List[str] = ["visual", "auditory", "textual", "kinesthetic", "logical", "narrative"]
+"""Target preference tags sampled for synthetic content items."""
+
+
+def quiet_logging() -> None:
+    """Raises the root logging level so per-item INFO/DEBUG records do not distort timings."""
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def make_synthetic_curriculum(num_los: int, max_prerequisites: int = 2, seed: int = 0) -> Dict[str, Any]:
+    """Builds a curriculum slice with `num_los` LOs and an acyclic prerequisite structure.
+
+    Each LO may only depend on LOs defined before it, so the prerequisite graph is always a DAG.
+
+    Args:
+        num_los (int): Number of learning objectives to generate.
+        max_prerequisites (int, optional): Maximum prerequisites per LO. Defaults to 2.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: A curriculum slice in the same shape as the files in `data/`.
+    """
+    rng = random.Random(seed)
+    learning_objectives = []
+    for index in range(num_los):
+        candidates = range(max(0, index - 20), index)
+        num_prereqs = rng.randint(0, min(max_prerequisites, len(candidates)))
+        prerequisites = [f"SYN_LO_{p}" for p in sorted(rng.sample(candidates, num_prereqs))]
+        learning_objectives.append({
+            "id": f"SYN_LO_{index}",
+            "description": f"Synthetic learning objective {index}.",
+            "keywords": ["synthetic"],
+            "prerequisites": prerequisites
+        })
+    return {
+        "subject": "Synthetic",
+        "year_group": "Year 4",
+        "topic": "Benchmark",
+        "learning_objectives": learning_objectives
+    }
+
+
+def make_synthetic_content(num_los: int, content_per_lo: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Builds `content_per_lo` content items for each of `num_los` synthetic LOs.
+
+    Args:
+        num_los (int): Number of learning objectives the content should cover.
+        content_per_lo (int): Number of content items per LO.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[Dict[str, Any]]: Content items in the same shape as the maths content sets in `data/`.
+    """
+    rng = random.Random(seed)
+    difficulties = [level for level in DIFFICULTY_ORDER if level != "default"]
+    content = []
+    for lo_index in range(num_los):
+        for item_index in range(content_per_lo):
+            content.append({
+                "id": f"SYN_CONT_{lo_index}_{item_index}",
+                "title": f"Synthetic activity {item_index} for LO {lo_index}",
+                "type": rng.choice(ALL_POSSIBLE_CONTENT_TYPES),
+                "learning_objectives_covered": [f"SYN_LO_{lo_index}"],
+                "target_preferences": rng.sample(SYNTHETIC_TARGET_PREFERENCES, 2),
+                "difficulty": rng.choice(difficulties),
+                "url_path": f"/content/synthetic/{lo_index}/{item_index}.html"
+            })
+    return content
+
+
+def make_synthetic_profiles(num_learners: int, curriculum: Dict[str, Any], seed: int = 0) -> List[Any]:
+    """Builds learner profiles with random preferences and a random prefix of completed LOs.
+
+    Args:
+        num_learners (int): Number of profiles to generate.
+        curriculum (Dict[str, Any]): The curriculum slice the learners work through.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[LearnerProfile]: The generated profiles.
+    """
+    from hlp_module import LearnerProfile
+
+    rng = random.Random(seed)
+    lo_ids = [lo["id"] for lo in curriculum.get("learning_objectives", [])]
+    profiles = []
+    for index in range(num_learners):
+        profile = LearnerProfile(f"synthetic_student_{index:06d}")
+        profile.learning_preferences["visual_task_1"] = rng.choice(["visual", "non-visual"])
+        profile.learning_preferences["textual_task_1"] = rng.choice(["detailed_text", "concise_text"])
+        # Set directly rather than through mark_lo_completed so no badge checks run during setup.
+        profile.completed_los.update(lo_ids[:rng.randint(0, len(lo_ids) // 2)])
+        profiles.append(profile)
+    return profiles
+
+
+def time_callable(func: Callable[[], Any], repeat: int = 3, setup: Optional[Callable[[], Any]] = None) -> Tuple[float, Any]:
+    """Runs `func` `repeat` times and returns the best wall-clock time and the last result.
+
+    Args:
+        func (Callable[[], Any]): The callable to time.
+        repeat (int, optional): Number of runs. Defaults to 3.
+        setup (Optional[Callable[[], Any]], optional): Called untimed before each run. Defaults to None.
+
+    Returns:
+        Tuple[float, Any]: The fastest run in seconds and the value returned by the last run.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Recent-Content History
+
+Every learner is served `--sessions` pathways over the same LOs (nothing is completed in
+between), first with the recent-content history cleared before each request, as if it did
+not exist, and then with each served pathway recorded in the history
+(`generate_initial_pathway(record_history=True)`). Reports how many distinct activities a learner was
+served across the sessions and the cost of one pathway request in each case.
+
+Usage:
+    python benchmarks/bench_content_history.py [--learners 200] [--sessions 5] [--los 200] [--content-per-lo 10]
+"""
+
+import argparse
+import time
+
+from bench_common import quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+from hlp_module import make_session_rng
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--los", type=int, default=200)
+    parser.add_argument("--content-per-lo", type=int, default=10)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, args.content_per_lo))
+    requests = args.learners * args.sessions
+
+    print(f"learners={args.learners} sessions={args.sessions} los={args.los} content_per_lo={args.content_per_lo}")
+    for keep_history in (False, True):
+        distinct_served = 0
+        seconds = 0.0
+        for profile in make_synthetic_profiles(args.learners, curriculum):
+            served = set()
+            for _ in range(args.sessions):
+                if not keep_history:
+                    profile.recent_content = None
+                # The same session seed every time, so each request picks the same LOs
+                generator = PathwayGenerator(profile, store, rng=make_session_rng(profile.learner_id, "bench_history"))
+                start = time.perf_counter()
+                pathway = generator.generate_initial_pathway(record_history=True)
+                seconds += time.perf_counter() - start
+                served.update(item["id"] for lo in pathway for item in lo["content_items"])
+            distinct_served += len(served)
+
+        mode = "history" if keep_history else "no history"
+        print(
+            f"{mode:10s}: {distinct_served / args.learners:6.1f} distinct activities/learner  "
+            f"{seconds / requests * 1e6:8.1f} us/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
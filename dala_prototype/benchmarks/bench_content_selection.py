@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Per-LO Content Selection
+
+Measures the cost of selecting activities for one LO as the amount of content per LO grows.
+The legacy algorithm (sort on every call, then rescan the sorted list once per content type)
+is reproduced here as a reference and compared against selection from the store's
+pre-sorted, type-bucketed `LOContentIndex`. Both must pick the same activities.
+
+Usage:
+    python benchmarks/bench_content_selection.py [--sizes 5,20,100,500] [--calls N]
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from bench_common import quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles
+from config import DIFFICULTY_ORDER, CONTENT_TYPE_PRIORITY_FOR_VARIETY, DEFAULT_MAX_ACTIVITIES_PER_LO
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+
+
+def legacy_select(generator: PathwayGenerator, content: List[Dict[str, Any]], max_activities: int) -> List[Dict[str, Any]]:
+    """The pre-index selection algorithm: sort per call and rescan per content type."""
+    sorted_content = sorted(content, key=lambda c: DIFFICULTY_ORDER.get(c.get("difficulty", "default").lower(), DIFFICULTY_ORDER["default"]))
+    selected: List[Dict[str, Any]] = []
+    used = set()
+    for pref_type in generator._get_preferred_content_types():
+        if len(selected) >= max_activities:
+            break
+        for item in sorted_content:
+            if item.get("type") == pref_type and item["id"] not in used:
+                selected.append(item)
+                used.add(item["id"])
+                break
+    selected_types = {act.get("type") for act in selected}
+    for activity_type in CONTENT_TYPE_PRIORITY_FOR_VARIETY:
+        if len(selected) >= max_activities:
+            break
+        if activity_type not in selected_types:
+            for item in sorted_content:
+                if item.get("type") == activity_type and item["id"] not in used:
+                    selected.append(item)
+                    used.add(item["id"])
+                    selected_types.add(activity_type)
+                    break
+    for item in sorted_content:
+        if len(selected) >= max_activities:
+            break
+        if item["id"] not in used:
+            selected.append(item)
+            used.add(item["id"])
+    return selected[:max_activities]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="5,20,100,500", help="Comma-separated content-per-LO counts.")
+    parser.add_argument("--calls", type=int, default=2000, help="Selections timed per size.")
+    args = parser.parse_args()
+
+    quiet_logging()
+    print(f"{'content/LO':>10} {'legacy us/call':>15} {'indexed us/call':>16} {'parity':>7}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        curriculum = make_synthetic_curriculum(1)
+        store = CurriculumContentStore(curriculum, make_synthetic_content(1, size))
+        generator = PathwayGenerator(make_synthetic_profiles(1, curriculum)[0], store)
+        lo_id = curriculum["learning_objectives"][0]["id"]
+        content = store.get_content_for_lo(lo_id)
+        content_index = store.get_content_index_for_lo(lo_id)
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            legacy_result = legacy_select(generator, content, DEFAULT_MAX_ACTIVITIES_PER_LO)
+        legacy_us = (time.perf_counter() - start) / args.calls * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            indexed_result = generator._select_content_from_index(lo_id, content_index, DEFAULT_MAX_ACTIVITIES_PER_LO)
+        indexed_us = (time.perf_counter() - start) / args.calls * 1e6
+
+        print(f"{size:>10} {legacy_us:>15.1f} {indexed_us:>16.1f} {str(legacy_result == indexed_result):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Streaming Content Ingestion
+
+Writes a synthetic content catalogue as one JSON array file and as the same items split across
+several JSON Lines files, then compares `json.load`ing the whole catalogue with streaming it
+item by item (`iter_content_files`), first for parsing alone and then for building a
+`CurriculumContentStore` (`CurriculumContentStore.from_content_files`). Timings are taken under
+tracemalloc, which reports the peak traced memory of each run.
+
+With `--legacy-field-names`, items name their type and difficulty `activity_type` and
+`difficulty_level`, as older content sets do, so normalisation copies every item: a build from a
+`json.load`ed list then holds the raw and the normalised items at once, a streamed build never does.
+
+Usage:
+    python benchmarks/bench_content_streaming.py [--los 2000] [--content-per-lo 20] [--files 8] [--legacy-field-names]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_common import quiet_logging, make_synthetic_curriculum, make_synthetic_content
+from curriculum_content_module import CurriculumContentStore, iter_content_files, write_content_jsonl
+
+
+def measure(build):
+    """Runs `build` under tracemalloc; returns (seconds, peak bytes, retained bytes, result)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, retained, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--los", type=int, default=2_000)
+    parser.add_argument("--content-per-lo", type=int, default=20)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--legacy-field-names", action="store_true", help="Use activity_type/difficulty_level.")
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    content = make_synthetic_content(args.los, args.content_per_lo)
+    if args.legacy_field_names:
+        for item in content:
+            item["activity_type"] = item.pop("type")
+            item["difficulty_level"] = item.pop("difficulty")
+
+    with tempfile.TemporaryDirectory(prefix="dala_bench_streaming_") as work_dir:
+        array_path = os.path.join(work_dir, "content.json")
+        with open(array_path, "w", encoding="utf-8") as f:
+            json.dump(content, f)
+        per_file = -(-len(content) // args.files)
+        jsonl_paths = []
+        for index in range(args.files):
+            path = os.path.join(work_dir, f"content_{index:03d}.jsonl")
+            write_content_jsonl(content[index * per_file:(index + 1) * per_file], path)
+            jsonl_paths.append(path)
+        item_count = len(content)
+        del content
+
+        def parse_whole():
+            with open(array_path, "r", encoding="utf-8") as f:
+                return len(json.load(f))
+
+        def load_whole():
+            with open(array_path, "r", encoding="utf-8") as f:
+                return CurriculumContentStore(curriculum, json.load(f))
+
+        print(f"los={args.los} content_items={item_count}")
+        print("parse only (items read and dropped):")
+        parses = {
+            "json.load list": parse_whole,
+            "stream json array": lambda: sum(1 for _ in iter_content_files([array_path])),
+            f"stream {args.files} jsonl files": lambda: sum(1 for _ in iter_content_files(jsonl_paths))
+        }
+        for label, parse in parses.items():
+            seconds, peak, _, count = measure(parse)
+            print(f"  {label:22s}: {seconds * 1000:8.1f} ms  peak {peak / 1e6:7.1f} MB  ({count} items)")
+
+        print("store build:")
+        builds = {
+            "json.load list": load_whole,
+            "stream json array": lambda: CurriculumContentStore.from_content_files(curriculum, [array_path]),
+            f"stream {args.files} jsonl files": lambda: CurriculumContentStore.from_content_files(curriculum, jsonl_paths)
+        }
+        stores = {}
+        for label, build in builds.items():
+            seconds, peak, retained, stores[label] = measure(build)
+            print(f"  {label:22s}: {seconds * 1000:8.1f} ms  peak {peak / 1e6:7.1f} MB  retained by store {retained / 1e6:7.1f} MB")
+        reference = stores["json.load list"]
+        same = all(
+            store.lo_to_content_map == reference.lo_to_content_map and store.content_library == reference.content_library
+            for store in stores.values()
+        )
+        print(f"identical stores: {same}")
+
+
+if __name__ == "__main__":
+    main()
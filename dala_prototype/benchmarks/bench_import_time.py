@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Module Import Time
+
+Measures how long a fresh interpreter takes to import each DALA module, net of interpreter
+start-up, and how long the first build of the interface's content store (the curriculum and
+content files loaded by `generate_interface.build_combined_content_store()`) takes once the
+module is imported.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+from bench_common import DALA_DIR
+
+MODULES = [
+    "config",
+    "hlp_module",
+    "curriculum_content_module",
+    "dcw_apg_module",
+    "profile_persistence_module",
+    "template_engine",
+    "generate_interface"
+]
+
+_TIMING_SNIPPET = (
+    "import time; start = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def time_in_fresh_interpreter(statement: str, setup: str = "pass", repeat: int = 5) -> float:
+    """Returns the best time of `statement` run after `setup` in `repeat` fresh interpreters."""
+    code = f"{setup}; " + _TIMING_SNIPPET.format(statement=statement)
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=DALA_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"repeat={args.repeat} (best of, fresh interpreter each time)")
+    for module in MODULES:
+        seconds = time_in_fresh_interpreter(f"import {module}", repeat=args.repeat)
+        print(f"import {module:28s}: {seconds * 1000:8.1f} ms")
+    first_use = time_in_fresh_interpreter(
+        "generate_interface.build_combined_content_store()", setup="import generate_interface", repeat=args.repeat
+    )
+    print(f"first build_combined_content_store(): {first_use * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
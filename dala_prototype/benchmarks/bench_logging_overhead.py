@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Logging Cost per Pathway Generation
+
+Generates initial pathways for a synthetic cohort under several logging configurations and
+reports the cost per pathway relative to logging switched off (`logging.disable`). Records are
+written to os.devnull, so the figures are the cost of creating, formatting and delivering them:
+
+    off          : logging disabled, the floor.
+    production   : `setup_logging("production")` - WARNING level, queue handler.
+    queued-info  : production handlers at INFO level, so every record goes through the queue.
+    development  : `setup_logging("development")` - INFO level, synchronous stream handler.
+    debug        : the development handler at DEBUG level.
+
+One untimed run first attaches the learners' eligibility trackers and warms the caches, and the
+timed runs then cycle through the modes `--repeat` times, keeping each mode's best run, so no
+mode is favoured by running later.
+
+Usage:
+    python benchmarks/bench_logging_overhead.py [--learners 500] [--los 500] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+
+from bench_common import make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles, time_callable
+from config import setup_logging
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+
+
+def configure(mode: str, devnull) -> None:
+    """Applies one of the benchmark's logging configurations."""
+    logging.disable(logging.NOTSET)
+    if mode == "off":
+        setup_logging("development", stream=devnull, force=True)
+        logging.disable(logging.CRITICAL)
+    elif mode in ("production", "queued-info"):
+        setup_logging("production", stream=devnull, force=True)
+        if mode == "queued-info":
+            logging.getLogger().setLevel(logging.INFO)
+    else:
+        setup_logging("development", stream=devnull, force=True)
+        if mode == "debug":
+            logging.getLogger().setLevel(logging.DEBUG)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=500)
+    parser.add_argument("--los", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    curriculum = make_synthetic_curriculum(args.los)
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, 10))
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+
+    def generate_all():
+        for profile in profiles:
+            PathwayGenerator(profile, store).generate_initial_pathway()
+
+    modes = ("off", "production", "queued-info", "development", "debug")
+    timings = {mode: float("inf") for mode in modes}
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        configure("off", devnull)
+        generate_all() # Warm-up
+        for _ in range(args.repeat):
+            for mode in modes:
+                configure(mode, devnull)
+                seconds, _ = time_callable(generate_all, repeat=1)
+                timings[mode] = min(timings[mode], seconds)
+        # Drains the production queue before devnull is closed
+        setup_logging("development", stream=devnull, force=True)
+    logging.disable(logging.NOTSET)
+
+    floor = timings["off"] / args.learners
+    print(f"learners={args.learners} los={args.los}")
+    for mode, seconds in timings.items():
+        per_pathway = seconds / args.learners
+        print(f"{mode:12s}: {per_pathway * 1e6:8.1f} us/pathway  logging cost {(per_pathway - floor) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Lookahead Pathway Planner
+
+Simulates learners working through a synthetic curriculum: each learner requests a pathway,
+completes every LO in it in order, and requests the next one, until `--goal` LOs are completed
+or no LO is left. This runs once with the one-layer pathways of `generate_initial_pathway`
+and once with `lookahead=True`, and reports the pathway requests needed per learner (the
+regeneration round-trips) and the cost of one request.
+
+With `--strands W`, LO i also requires LO i-W, so the curriculum is W interleaved sequences and
+only about W LOs are eligible at a time, as in a sequenced scheme of work; 0 keeps the
+synthetic curriculum unchanged.
+
+Every lookahead pathway is also checked to list each LO after all of its prerequisites; the
+script exits with status 1 otherwise.
+
+Usage:
+    python benchmarks/bench_lookahead_planner.py [--learners 100] [--los 2000] [--goal 200] [--pathway-los 30]
+                                                [--strands 5]
+"""
+
+import argparse
+import sys
+import time
+
+from bench_common import quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+from hlp_module import make_session_rng
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=100)
+    parser.add_argument("--los", type=int, default=2000)
+    parser.add_argument("--goal", type=int, default=200, help="LOs each learner completes.")
+    parser.add_argument("--pathway-los", type=int, default=30, help="LOs requested per pathway.")
+    parser.add_argument("--strands", type=int, default=5, help="Interleaved LO sequences; 0 for none.")
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    if args.strands > 0:
+        for index, lo in enumerate(curriculum["learning_objectives"][args.strands:], start=args.strands):
+            lo["prerequisites"] = sorted(set(lo["prerequisites"]) | {f"SYN_LO_{index - args.strands}"})
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, 10))
+    prerequisites = store.prerequisite_graph.prerequisites
+    invalid_plans = 0
+
+    print(f"learners={args.learners} los={args.los} goal={args.goal} pathway_los={args.pathway_los} strands={args.strands}")
+    for lookahead in (False, True):
+        requests = 0
+        seconds = 0.0
+        for profile in make_synthetic_profiles(args.learners, curriculum):
+            rng = make_session_rng(profile.learner_id, "bench_lookahead")
+            completed = 0
+            while completed < args.goal:
+                start = time.perf_counter()
+                pathway = PathwayGenerator(profile, store, rng=rng).generate_initial_pathway(
+                    target_lo_count=args.pathway_los, lookahead=lookahead
+                )
+                seconds += time.perf_counter() - start
+                requests += 1
+                if not pathway:
+                    break
+                for lo in pathway[:args.goal - completed]:
+                    if lookahead and not all(profile.has_completed_lo(prereq_id) for prereq_id in prerequisites[lo["id"]]):
+                        invalid_plans += 1
+                    profile.mark_lo_completed(lo["id"])
+                    completed += 1
+
+        mode = "lookahead" if lookahead else "one-layer"
+        print(
+            f"{mode:10s}: {requests / args.learners:7.1f} requests/learner  "
+            f"{seconds / requests * 1e6:8.1f} us/request"
+        )
+
+    print(f"prerequisite violations in lookahead pathways: {invalid_plans}")
+    if invalid_plans:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Pathway Cache
+
+Simulates learners re-opening their page: every learner's initial pathway is requested
+`--opens` times, first without a cache (a full generation per open) and then through a
+`PathwayCache` (one generation per learner, then cache hits). Finally every learner completes
+an LO, which invalidates their entry through the profile's change notification, and the next
+open regenerates.
+
+Usage:
+    python benchmarks/bench_pathway_cache.py [--learners 500] [--opens 5] [--los 500]
+"""
+
+import argparse
+
+from bench_common import (
+    quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles, time_callable
+)
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayCache, PathwayGenerator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=500)
+    parser.add_argument("--opens", type=int, default=5)
+    parser.add_argument("--los", type=int, default=500)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, 10))
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+    requests = args.learners * args.opens
+    cache = PathwayCache(max_entries=args.learners)
+
+    def open_pages(pathway_cache):
+        return [
+            PathwayGenerator(profile, store, pathway_cache=pathway_cache).generate_initial_pathway()
+            for _ in range(args.opens) for profile in profiles
+        ]
+
+    uncached_seconds, _ = time_callable(lambda: open_pages(None), repeat=1)
+    cached_seconds, _ = time_callable(lambda: open_pages(cache), repeat=1)
+    hits, misses = cache.hits, cache.misses
+
+    for profile in profiles:
+        profile.mark_lo_completed(profile.learner_id + "_extra_lo")
+    entries_after_invalidation = len(cache)
+    after_seconds, _ = time_callable(lambda: open_pages(cache), repeat=1)
+
+    print(f"learners={args.learners} opens_per_learner={args.opens} los={args.los}")
+    print(f"no cache             : {uncached_seconds / requests * 1e6:8.1f} us/open")
+    print(f"with cache           : {cached_seconds / requests * 1e6:8.1f} us/open ({hits} hits, {misses} misses)")
+    print(f"entries after LO done: {entries_after_invalidation}")
+    print(f"after invalidation   : {after_seconds / requests * 1e6:8.1f} us/open ({cache.misses - misses} new misses)")
+
+
+if __name__ == "__main__":
+    main()
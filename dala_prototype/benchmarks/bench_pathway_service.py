@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Async Pathway Service
+
+Fires a burst of concurrent pathway requests at a `PathwayService` over a synthetic catalogue,
+where many requests are duplicates for the same learners, and reports throughput, the number of
+coalesced requests, the service's p50/p99 latencies and how late a 1 ms heartbeat task on the
+event loop ran (the loop stays responsive because generation runs in the executor). A batch
+request for the same learners is timed for comparison, along with a sequential baseline that
+calls `PathwayGenerator` once per request.
+
+Usage:
+    python benchmarks/bench_pathway_service.py [--requests 2000] [--learners 200] [--los 500]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from bench_common import (
+    quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles, time_callable
+)
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+from pathway_service_module import PathwayService
+from profile_persistence_module import JSONLearnerProfileStore
+
+
+async def heartbeat(stop: asyncio.Event, lags: list) -> None:
+    """Sleeps 1 ms at a time and records how late each wake-up was."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run_burst(service: PathwayService, learner_ids: list) -> tuple:
+    stop = asyncio.Event()
+    lags: list = []
+    beat = asyncio.ensure_future(heartbeat(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(service.get_pathway(learner_id) for learner_id in learner_ids))
+    seconds = time.perf_counter() - start
+    stop.set()
+    await beat
+    return seconds, max(lags) if lags else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--learners", type=int, default=200)
+    parser.add_argument("--los", type=int, default=500)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, 10))
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+    rng = random.Random(0)
+    requested_ids = [rng.choice(profiles).learner_id for _ in range(args.requests)]
+
+    with tempfile.TemporaryDirectory(prefix="dala_bench_service_") as work_dir:
+        profile_store = JSONLearnerProfileStore(
+            os.path.join(work_dir, "learners"), cache_size=args.learners, flush_interval_seconds=float("inf")
+        )
+        for profile in profiles:
+            profile_store.save_profile(profile)
+        by_id = {profile.learner_id: profile for profile in profiles}
+
+        sequential_seconds, _ = time_callable(
+            lambda: [PathwayGenerator(by_id[learner_id], store).generate_initial_pathway() for learner_id in requested_ids],
+            repeat=1
+        )
+
+        async def run_service() -> None:
+            async with PathwayService(lambda: store, profile_store=profile_store) as service:
+                burst_seconds, max_lag = await run_burst(service, requested_ids)
+                metrics = service.metrics()
+                batch_start = time.perf_counter()
+                await service.get_pathways(list(by_id))
+                batch_seconds = time.perf_counter() - batch_start
+            print(f"requests={args.requests} distinct_learners={len(set(requested_ids))} los={args.los}")
+            print(f"sequential generator : {sequential_seconds * 1000:8.1f} ms ({args.requests / sequential_seconds:8.0f} req/s)")
+            print(f"service burst        : {burst_seconds * 1000:8.1f} ms ({args.requests / burst_seconds:8.0f} req/s)")
+            print(f"coalesced requests   : {metrics['coalesced_requests']}")
+            print(f"latency p50 / p99    : {metrics['pathway']['p50_ms']} ms / {metrics['pathway']['p99_ms']} ms")
+            print(f"max heartbeat lag    : {max_lag * 1000:8.2f} ms")
+            print(f"batch ({len(by_id)} learners): {batch_seconds * 1000:8.1f} ms")
+
+        asyncio.run(run_service())
+        profile_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: DALA Pipeline Suite
+
+Times the stages of the DALA pipeline separately over synthetic data at several scales, where
+each scale grows the curriculum, the content per LO and the roster by an order of magnitude:
+
+1.  `store_construction`: building a `CurriculumContentStore` from the curriculum and content.
+2.  `hlp_assessment`: `run_full_hlp_assessment` for every student on the roster.
+3.  `badge_check`: `check_and_award_all_relevant_badges` on every assessed profile.
+4.  `initial_pathway`: `PathwayGenerator.generate_initial_pathway` for every student (no cache).
+5.  `html_interface`: what `generate_html_interface` does per student (render the page for the
+    synthetic store and write it to disk), with the pathway cache cleared first.
+
+Each stage runs `--repeat` times and the fastest run is kept. Profiles and pages are seeded from
+the student ID and a fixed session, so every run does the same work. The results (per-stage
+seconds, per-item microseconds and the environment) are written as JSON. Pass a previous result
+file as `--baseline` to compare each stage against it; the script exits with status 1 if any
+stage is slower than the baseline by more than `--regression-threshold`.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--scales small,medium] [--repeat 3] [--output FILE]
+                                        [--baseline FILE] [--regression-threshold 1.25]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench_common import DALA_DIR, quiet_logging, make_synthetic_curriculum, make_synthetic_content
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator, default_pathway_cache
+from generate_interface import render_html_interface
+from hlp_module import check_and_award_all_relevant_badges, make_session_rng, run_full_hlp_assessment
+
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"los": 50, "content_per_lo": 2, "learners": 10},
+    "medium": {"los": 500, "content_per_lo": 20, "learners": 100},
+    "large": {"los": 5_000, "content_per_lo": 200, "learners": 1_000}
+}
+"""Synthetic data sizes per scale; each scale is an order of magnitude larger than the previous one."""
+
+SESSION = "bench_pipeline"
+"""Session every profile and page is seeded with."""
+
+RESULTS_DIR = os.path.join(DALA_DIR, "benchmarks", "results")
+"""Default directory for result files."""
+
+
+def time_stage(run: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None, repeat: int = 3) -> float:
+    """Returns the fastest of `repeat` runs of `run(setup())`, excluding the time spent in `setup`."""
+    best = float("inf")
+    for _ in range(repeat):
+        prepared = setup()
+        start = time.perf_counter()
+        run(prepared)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def git_revision() -> Optional[str]:
+    """Returns the current git commit of the checkout, or None outside a git repository."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=DALA_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scale(name: str, sizes: Dict[str, int], repeat: int, work_dir: str) -> Dict[str, Any]:
+    """Times every pipeline stage at one scale and returns the scale's result record."""
+    curriculum = make_synthetic_curriculum(sizes["los"])
+    content = make_synthetic_content(sizes["los"], sizes["content_per_lo"])
+    student_ids = [f"bench_student_{index:06d}" for index in range(sizes["learners"])]
+    store = CurriculumContentStore(curriculum, content)
+
+    def assess() -> List[Any]:
+        return [run_full_hlp_assessment(student_id, rng=make_session_rng(student_id, SESSION)) for student_id in student_ids]
+
+    def assess_without_badges() -> List[Any]:
+        profiles = assess()
+        for profile in profiles:
+            profile.earned_badges_data.clear()
+        return profiles
+
+    def generate_pathways(_: Any) -> None:
+        for profile in profiles:
+            PathwayGenerator(profile, store, rng=make_session_rng(profile.learner_id, SESSION)).generate_initial_pathway()
+
+    def write_pages(_: Any) -> None:
+        default_pathway_cache.clear()
+        for student_id in student_ids:
+            page = render_html_interface(student_id, store, session=SESSION)
+            with open(os.path.join(work_dir, f"{student_id}.html"), "w", encoding="utf-8") as f:
+                f.write(page)
+
+    profiles = assess()
+    stages: List[Tuple[str, int, float]] = [
+        ("store_construction", len(content), time_stage(lambda _: CurriculumContentStore(curriculum, content), repeat=repeat)),
+        ("hlp_assessment", len(student_ids), time_stage(lambda _: assess(), repeat=repeat)),
+        ("badge_check", len(student_ids), time_stage(
+            lambda fresh: [check_and_award_all_relevant_badges(profile, store) for profile in fresh],
+            setup=assess_without_badges, repeat=repeat
+        )),
+        ("initial_pathway", len(student_ids), time_stage(generate_pathways, repeat=repeat)),
+        ("html_interface", len(student_ids), time_stage(write_pages, repeat=repeat))
+    ]
+    return {
+        "scale": name,
+        **sizes,
+        "content_items": len(content),
+        "stages": {
+            stage: {"items": items, "seconds": round(seconds, 6), "us_per_item": round(seconds / items * 1e6, 3)}
+            for stage, items, seconds in stages
+        }
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Prints each stage's time relative to the baseline and returns the regressed "scale/stage" names."""
+    baseline_scales = {record["scale"]: record for record in baseline.get("scales", [])}
+    regressions = []
+    print(f"compared with {baseline.get('git_revision') or 'baseline'} ({baseline.get('timestamp')}):")
+    for record in results["scales"]:
+        baseline_stages = baseline_scales.get(record["scale"], {}).get("stages", {})
+        for stage, timing in record["stages"].items():
+            reference = baseline_stages.get(stage)
+            if not reference or not reference["us_per_item"]:
+                continue
+            ratio = timing["us_per_item"] / reference["us_per_item"]
+            flag = "  REGRESSION" if ratio > threshold else ""
+            print(f"  {record['scale']:6s} {stage:18s}: {ratio:6.2f}x{flag}")
+            if flag:
+                regressions.append(f"{record['scale']}/{stage}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="small,medium", help=f"Comma-separated scales from: {', '.join(SCALES)}.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Result file (default: benchmarks/results/pipeline-<time>.json).")
+    parser.add_argument("--baseline", default=None, help="Previous result file to compare against.")
+    parser.add_argument("--regression-threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    scale_names = [name.strip() for name in args.scales.split(",") if name.strip()]
+    unknown = [name for name in scale_names if name not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+
+    quiet_logging()
+    started = datetime.datetime.now(datetime.timezone.utc)
+    results: Dict[str, Any] = {
+        "benchmark": "pipeline",
+        "timestamp": started.isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "scales": []
+    }
+    with tempfile.TemporaryDirectory(prefix="dala_bench_pipeline_") as work_dir:
+        for name in scale_names:
+            record = run_scale(name, SCALES[name], args.repeat, work_dir)
+            results["scales"].append(record)
+            print(f"{name}: los={record['los']} content_items={record['content_items']} learners={record['learners']}")
+            for stage, timing in record["stages"].items():
+                print(f"  {stage:18s}: {timing['seconds'] * 1000:10.1f} ms  {timing['us_per_item']:10.1f} us/item")
+
+    output_path = args.output or os.path.join(RESULTS_DIR, f"pipeline-{started.strftime('%Y%m%dT%H%M%SZ')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {output_path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.regression_threshold)
+        if regressions:
+            print(f"regressions above {args.regression_threshold:.2f}x: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
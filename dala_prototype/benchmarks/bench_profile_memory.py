@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Learner Profile Memory
+
+Measures the memory held by a roster of `LearnerProfile` objects against the same roster as
+`CompactLearnerProfile` objects (slots, coded interests/struggles, completed-LO bitset), and
+checks that `to_dict()` round-trips between the two.
+
+Usage:
+    python benchmarks/bench_profile_memory.py [--learners 100000] [--los 200]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from bench_common import quiet_logging, make_synthetic_curriculum
+from curriculum_content_module import PrerequisiteGraph
+from hlp_module import LearnerProfile, CompactLearnerProfile, PREDEFINED_INTERESTS, PREDEFINED_STRUGGLE_AREAS
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    """Returns the bytes still allocated after `build()` and the built objects."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated, objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=100_000)
+    parser.add_argument("--los", type=int, default=200)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    graph = PrerequisiteGraph(curriculum["learning_objectives"])
+    lo_ids = graph.lo_ids
+
+    rng = random.Random(0)
+    source_dicts = []
+    for index in range(args.learners):
+        source_dicts.append({
+            "student_id": f"synthetic_student_{index:06d}",
+            "learning_preferences": {"visual_task_1": "visual", "textual_task_1": "concise_text"},
+            "interests": rng.sample(PREDEFINED_INTERESTS, 3),
+            "struggle_areas": rng.sample(PREDEFINED_STRUGGLE_AREAS, 2),
+            "cognitive_metrics": {},
+            "completed_los": lo_ids[:rng.randint(0, len(lo_ids) // 2)],
+            "current_learning_objective_id": None,
+            "earned_badges_data": {}
+        })
+
+    regular_bytes, regular = measure(lambda: [LearnerProfile.from_dict(data) for data in source_dicts])
+    compact_bytes, compact = measure(lambda: [CompactLearnerProfile.from_dict(data, graph) for data in source_dicts])
+
+    round_trip_ok = all(
+        sorted(c.to_dict()["completed_los"]) == sorted(r.to_dict()["completed_los"])
+        and {k: v for k, v in c.to_dict().items() if k != "completed_los"}
+        == {k: v for k, v in r.to_dict().items() if k != "completed_los"}
+        for r, c in zip(regular[:1000], compact[:1000])
+    )
+
+    print(f"learners={args.learners} los={args.los}")
+    print(f"LearnerProfile        : {regular_bytes / 2**20:8.1f} MiB  {regular_bytes / args.learners:8.0f} B/learner")
+    print(f"CompactLearnerProfile : {compact_bytes / 2**20:8.1f} MiB  {compact_bytes / args.learners:8.0f} B/learner")
+    print(f"reduction             : {regular_bytes / compact_bytes:8.2f}x")
+    print(f"to_dict round-trip    : {round_trip_ok}")
+
+
+if __name__ == "__main__":
+    main()
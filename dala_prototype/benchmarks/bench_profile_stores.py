@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Learner Profile Stores
+
+Compares the per-file JSON profile store with the SQLite profile store on a synthetic roster:
+one batched flush of every profile, a full cohort load, and a "who completed this LO" query
+(a full scan of loaded profiles for JSON, an indexed lookup for SQLite).
+
+Usage:
+    python benchmarks/bench_profile_stores.py [--learners 10000] [--los 200]
+"""
+
+import argparse
+import os
+import tempfile
+
+from bench_common import quiet_logging, make_synthetic_curriculum, make_synthetic_profiles, time_callable
+from profile_persistence_module import JSONLearnerProfileStore, SQLiteLearnerProfileStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=10_000)
+    parser.add_argument("--los", type=int, default=200)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+    query_lo_id = curriculum["learning_objectives"][0]["id"]
+
+    store_options = {"cache_size": args.learners, "flush_interval_seconds": float("inf")}
+    with tempfile.TemporaryDirectory(prefix="dala_bench_stores_") as work_dir:
+        stores = {
+            "json": lambda: JSONLearnerProfileStore(os.path.join(work_dir, "json"), **store_options),
+            "sqlite": lambda: SQLiteLearnerProfileStore(os.path.join(work_dir, "learners.sqlite3"), **store_options)
+        }
+        print(f"learners={args.learners} los={args.los}")
+        for name, make_store in stores.items():
+            store = make_store()
+            for profile in profiles:
+                store.save_profile(profile)
+            write_seconds, _ = time_callable(store.flush, repeat=1)
+            store.close()
+
+            def load_cohort():
+                reader = make_store()
+                loaded = reader.get_profiles(reader.list_learners())
+                reader.close()
+                return loaded
+
+            load_seconds, loaded = time_callable(load_cohort, repeat=1)
+            if name == "sqlite":
+                reader = make_store()
+                query_seconds, completed = time_callable(lambda: reader.learners_who_completed(query_lo_id))
+                reader.close()
+            else:
+                query_seconds, completed = time_callable(
+                    lambda: [p.learner_id for p in loaded if query_lo_id in p.completed_los]
+                )
+                query_seconds += load_seconds # The JSON store has to load the cohort to answer it
+            print(
+                f"{name:6s}: flush {write_seconds:7.3f}s  load cohort {load_seconds:7.3f}s  "
+                f"who-completed query {query_seconds * 1000:9.2f}ms ({len(completed)} learners)"
+            )
+
+
+if __name__ == "__main__":
+    main()
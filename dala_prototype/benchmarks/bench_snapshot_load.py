@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Content Store Cold Start from JSON vs Snapshot
+
+Writes a synthetic catalogue as JSON files and as a compiled binary snapshot, then compares a
+cold start from each: parsing the JSON and building a `CurriculumContentStore`, versus opening
+the memory-mapped `SnapshotContentStore`. Also times the first pathway generated against each
+store - and against a snapshot opened with `preload=True`, which decodes the prerequisite graph
+and every LO up front - and checks the stores produce the same pathways for a few learners.
+
+Usage:
+    python benchmarks/bench_snapshot_load.py [--los 5000] [--content-per-lo 20] [--learners 20]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from bench_common import (
+    quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles, time_callable
+)
+from curriculum_content_module import CurriculumContentStore, load_json_data
+from content_snapshot_module import compile_store_snapshot, load_store_snapshot
+from dcw_apg_module import PathwayGenerator
+
+
+def pathways_for(store, profiles, seed: int = 7):
+    """Generates a pathway per profile with a fixed random seed, returning the content IDs."""
+    random.seed(seed)
+    return [
+        [item["id"] for item in PathwayGenerator(profile, store).generate_initial_pathway()]
+        for profile in profiles
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--los", type=int, default=5_000)
+    parser.add_argument("--content-per-lo", type=int, default=20)
+    parser.add_argument("--learners", type=int, default=20)
+    args = parser.parse_args()
+
+    quiet_logging()
+    curriculum = make_synthetic_curriculum(args.los)
+    content = make_synthetic_content(args.los, args.content_per_lo)
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+
+    with tempfile.TemporaryDirectory(prefix="dala_bench_snapshot_") as work_dir:
+        curriculum_path = os.path.join(work_dir, "curriculum.json")
+        content_path = os.path.join(work_dir, "content.json")
+        snapshot_path = os.path.join(work_dir, "store.dalasnap")
+        for path, data in ((curriculum_path, curriculum), (content_path, content)):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+        def load_from_json():
+            return CurriculumContentStore(
+                load_json_data(curriculum_path, "curriculum"), load_json_data(content_path, "content")
+            )
+
+        json_seconds, json_store = time_callable(load_from_json)
+        compile_seconds, _ = time_callable(lambda: compile_store_snapshot(json_store, snapshot_path), repeat=1)
+
+        def open_snapshot():
+            store = load_store_snapshot(snapshot_path)
+            store.close()
+
+        snapshot_seconds, _ = time_callable(open_snapshot)
+
+        snapshot_store = load_store_snapshot(snapshot_path)
+        json_pathway_seconds, json_pathways = time_callable(lambda: pathways_for(json_store, profiles), repeat=1)
+        snapshot_pathway_seconds, snapshot_pathways = time_callable(lambda: pathways_for(snapshot_store, profiles), repeat=1)
+        preload_seconds, preloaded_store = time_callable(lambda: load_store_snapshot(snapshot_path, preload=True), repeat=1)
+        preloaded_pathway_seconds, preloaded_pathways = time_callable(lambda: pathways_for(preloaded_store, profiles), repeat=1)
+
+        print(f"los={args.los} content_items={len(content)} learners={args.learners}")
+        print(f"json files        : {(os.path.getsize(curriculum_path) + os.path.getsize(content_path)) / 1e6:8.2f} MB")
+        print(f"snapshot file     : {os.path.getsize(snapshot_path) / 1e6:8.2f} MB (compiled in {compile_seconds * 1000:.0f} ms)")
+        print(f"json parse + build: {json_seconds * 1000:8.1f} ms")
+        print(f"snapshot open     : {snapshot_seconds * 1000:8.3f} ms")
+        print(f"snapshot preload  : {preload_seconds * 1000:8.1f} ms")
+        print(
+            f"first pathways    : json {json_pathway_seconds * 1000:.1f} ms, snapshot {snapshot_pathway_seconds * 1000:.1f} ms, "
+            f"preloaded snapshot {preloaded_pathway_seconds * 1000:.1f} ms"
+        )
+        print(f"pathway parity    : {json_pathways == snapshot_pathways == preloaded_pathways}")
+        snapshot_store.close()
+        preloaded_store.close()
+
+
+if __name__ == "__main__":
+    main()
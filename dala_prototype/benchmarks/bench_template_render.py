@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Student Interface Template Rendering
+
+Compares reading the student interface template from disk and running `str.format` over it on
+every render (the previous behaviour of `generate_html_interface`) with rendering the cached
+`CompiledTemplate`, and checks both produce the same page.
+
+Usage:
+    python benchmarks/bench_template_render.py [--renders 2000]
+"""
+
+import argparse
+
+from bench_common import quiet_logging, time_callable
+from generate_interface import HTML_TEMPLATE_PATH, load_html_template
+from template_engine import get_compiled_template
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=2000)
+    args = parser.parse_args()
+
+    quiet_logging()
+    field_names = set(get_compiled_template(HTML_TEMPLATE_PATH).field_names)
+    values = {name: f"<span>{name} value</span>" * 20 for name in field_names}
+
+    def read_and_format():
+        return [load_html_template(HTML_TEMPLATE_PATH).format(**values) for _ in range(args.renders)]
+
+    def compiled_render():
+        return [get_compiled_template(HTML_TEMPLATE_PATH).render(**values) for _ in range(args.renders)]
+
+    legacy_seconds, legacy_pages = time_callable(read_and_format)
+    compiled_seconds, compiled_pages = time_callable(compiled_render)
+    print(f"renders={args.renders} template_fields={len(field_names)}")
+    print(f"read + str.format : {legacy_seconds / args.renders * 1e6:8.1f} us/render")
+    print(f"compiled template : {compiled_seconds / args.renders * 1e6:8.1f} us/render")
+    print(f"identical output  : {legacy_pages == compiled_pages}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Benchmark: Vectorised Content Selection
+
+Checks that `VectorisedContentSelector` selects exactly the activities of
+`PathwayGenerator._select_content_from_index` - for every LO, every learner and several
+activity limits, over the synthetic store and the bundled sample content, with every other
+learner given a history of recently served content - and then times activity selection for
+every LO of a synthetic store three ways:
+
+    per-item   : the three-pass selection of `PathwayGenerator`, one learner at a time.
+    vectorised : `VectorisedContentSelector.select_for_lo`, one learner at a time.
+    batched    : `VectorisedContentSelector.select_for_learners`, all learners per LO at once.
+
+The script exits with status 1 if any selection differs. It needs NumPy and reports that it
+is skipped otherwise.
+
+Usage:
+    python benchmarks/bench_vectorised_selection.py [--learners 200] [--los 200] [--content-per-lo 50] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+from typing import Any, List
+
+from bench_common import (
+    quiet_logging, make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles, time_callable
+)
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+from hlp_module import RecentContentHistory
+from vectorised_selection_module import NUMPY_AVAILABLE, VectorisedContentSelector
+
+MAX_ACTIVITY_LIMITS = (1, 2, 3, 5)
+"""Activity limits the parity check covers."""
+
+
+def check_parity(store: CurriculumContentStore, profiles: List[Any]) -> int:
+    """Compares both selectors for every LO, profile and activity limit; returns the number of mismatches."""
+    rng = random.Random(0)
+    content_ids = sorted(store.content_records)
+    for index, profile in enumerate(profiles):
+        recent_ids = rng.sample(content_ids, len(content_ids) // 3)
+        profile.recent_content = RecentContentHistory(len(recent_ids), recent_ids) if index % 2 else None
+    selector = VectorisedContentSelector(store)
+    generators = [PathwayGenerator(profile, store) for profile in profiles]
+    type_lists = [generator._get_preferred_content_types() for generator in generators]
+    mismatches = 0
+    for lo in store.get_learning_objectives():
+        content_index = store.get_content_index_for_lo(lo["id"])
+        for max_activities in MAX_ACTIVITY_LIMITS:
+            batched = selector.select_for_learners(lo["id"], type_lists, max_activities)
+            for generator, types, batch_items in zip(generators, type_lists, batched):
+                recent_content = generator.learner_profile.recent_content
+                expected = generator._select_content_from_index(lo["id"], content_index, max_activities)
+                single = selector.select_for_lo(lo["id"], types, max_activities, recent_content=recent_content)
+                if single != expected or (recent_content is None and batch_items != expected):
+                    mismatches += 1
+                    if mismatches <= 5:
+                        print(f"  mismatch: lo={lo['id']} max={max_activities} types={types[:3]}...")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=200)
+    parser.add_argument("--los", type=int, default=200)
+    parser.add_argument("--content-per-lo", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed; skipping the vectorised selection benchmark.")
+        return
+
+    quiet_logging()
+    from generate_interface import build_combined_content_store
+
+    curriculum = make_synthetic_curriculum(args.los)
+    store = CurriculumContentStore(curriculum, make_synthetic_content(args.los, args.content_per_lo))
+    profiles = make_synthetic_profiles(args.learners, curriculum)
+
+    mismatches = check_parity(store, profiles) + check_parity(build_combined_content_store(), profiles)
+    for profile in profiles:
+        profile.recent_content = None
+    print(f"parity: {'OK' if not mismatches else f'{mismatches} mismatching selections'}")
+
+    lo_ids = [lo["id"] for lo in store.get_learning_objectives()]
+    generators = [PathwayGenerator(profile, store) for profile in profiles]
+    type_lists = [generator._get_preferred_content_types() for generator in generators]
+    selector = VectorisedContentSelector(store)
+    selector.select_for_learners(lo_ids[0], type_lists) # Encodes the type codes up front
+
+    def per_item():
+        for lo_id in lo_ids:
+            content_index = store.get_content_index_for_lo(lo_id)
+            for generator in generators:
+                generator._select_content_from_index(lo_id, content_index)
+
+    def vectorised():
+        for lo_id in lo_ids:
+            for types in type_lists:
+                selector.select_for_lo(lo_id, types)
+
+    def batched():
+        for lo_id in lo_ids:
+            selector.select_for_learners(lo_id, type_lists)
+
+    selections = len(lo_ids) * len(profiles)
+    print(f"learners={args.learners} los={args.los} content_per_lo={args.content_per_lo}")
+    for name, func in (("per-item", per_item), ("vectorised", vectorised), ("batched", batched)):
+        seconds, _ = time_callable(func, repeat=args.repeat)
+        print(f"{name:10s}: {seconds / selections * 1e6:8.2f} us/selection")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
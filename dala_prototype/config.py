@@ -12,10 +12,13 @@ Properly documenting and typing these configurations is crucial for maintainabil
 as the project grows.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, TextIO, Union
 
 # --- Logging Configuration ---
 LOGGING_LEVEL: int = logging.INFO
@@ -27,20 +30,70 @@ LOGGING_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(f
 LOGGING_DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 """The format string for timestamps in log messages."""
 
-def setup_logging() -> None:
+LOGGING_MODE: str = os.environ.get("DALA_LOGGING_MODE", "development")
+"""Default mode for `setup_logging`: "development" or "production" (set via the DALA_LOGGING_MODE environment variable)."""
+
+PRODUCTION_LOGGING_LEVEL: int = logging.WARNING
+"""The logging level in production mode; per-learner INFO records are dropped before they are formatted."""
+
+PRODUCTION_LOGGING_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+"""The format in production mode, without the module/function/line lookups of `LOGGING_FORMAT`."""
+
+_log_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(mode: Optional[str] = None, stream: Optional[TextIO] = None, force: bool = False) -> None:
     """Configures the root logger for the application.
     
-    Sets up basic logging to stream to stdout with the defined level, format, and date format.
-    This function should be called once at the beginning of the application or main script.
+    In development mode, sets up basic logging to stream to stdout with the defined level, format,
+    and date format. In production mode, records are logged at `PRODUCTION_LOGGING_LEVEL` with
+    `PRODUCTION_LOGGING_FORMAT`, and the calling thread only puts them on a queue: a background
+    listener thread formats and writes them, so request threads never wait on the stream.
+    This function should be called once at the beginning of the application or main script;
+    library modules do not call it at import time.
+
+    Args:
+        mode (Optional[str], optional): "development" or "production". Defaults to LOGGING_MODE.
+        stream (Optional[TextIO], optional): Where log records are written. Defaults to stdout.
+        force (bool, optional): Replace handlers configured by an earlier call. Defaults to False.
+
+    Raises:
+        ValueError: If the mode is unknown.
     """
-    logging.basicConfig(
-        level=LOGGING_LEVEL,
-        format=LOGGING_FORMAT,
-        datefmt=LOGGING_DATE_FORMAT,
-        handlers=[
-            logging.StreamHandler(sys.stdout) # Output logs to standard output
-        ]
-    )
+    global _log_queue_listener
+    mode = mode or LOGGING_MODE
+    if mode not in ("development", "production"):
+        raise ValueError(f"Unknown logging mode: {mode!r}")
+    if logging.getLogger().handlers and not force:
+        return # Already configured, as logging.basicConfig would leave it
+    if _log_queue_listener is not None:
+        _log_queue_listener.stop()
+        _log_queue_listener = None
+
+    stream_handler = logging.StreamHandler(stream or sys.stdout) # Output logs to standard output
+    if mode == "development":
+        logging.basicConfig(
+            level=LOGGING_LEVEL,
+            format=LOGGING_FORMAT,
+            datefmt=LOGGING_DATE_FORMAT,
+            handlers=[stream_handler],
+            force=force
+        )
+        return
+
+    stream_handler.setFormatter(logging.Formatter(PRODUCTION_LOGGING_FORMAT, LOGGING_DATE_FORMAT))
+    record_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_queue_listener = logging.handlers.QueueListener(record_queue, stream_handler)
+    _log_queue_listener.start()
+    queue_handler = logging.handlers.QueueHandler(record_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s")) # Only merges the arguments; the listener applies the format
+    logging.basicConfig(level=PRODUCTION_LOGGING_LEVEL, handlers=[queue_handler], force=force)
+
+def _stop_log_queue_listener() -> None:
+    """Flushes the records still queued in production mode when the interpreter exits."""
+    if _log_queue_listener is not None:
+        _log_queue_listener.stop()
+
+atexit.register(_stop_log_queue_listener)
 
 # --- File and Directory Configurations ---
 DEFAULT_OUTPUT_HTML_FILENAME: str = "dala_student_interface_v15_tts.html"
@@ -75,6 +128,31 @@ CURRICULUM_SLICE_KS2_ENGLISH_Y34_FILE: str = os.path.join(DATA_DIR, "curriculum_
 KS2_ENGLISH_ACTIVITIES_SET2_FILE: str = os.path.join(DATA_DIR, "ks2_english_activities_set2.json")
 """Path to the JSON file for the KS2 English activities set 2."""
 
+CONTENT_SNAPSHOT_DIR: str = os.path.join(DATA_DIR, "snapshots")
+"""Directory for compiled binary content store snapshots (see content_snapshot_module)."""
+
+CONTENT_STREAM_CHUNK_SIZE: int = 64 * 1024
+"""Characters read at a time when streaming content items out of a JSON array file."""
+
+CONTENT_WATCH_INTERVAL_SECONDS: float = 2.0
+"""How often a ContentStoreWatcher checks the registry's source files for changes."""
+
+# --- Learner Profile Persistence Configurations ---
+LEARNERS_DATA_DIR: str = os.path.join(DATA_DIR, "learners")
+"""Directory holding one `{learner_id}.json` file per learner for the JSON profile store."""
+
+LEARNERS_SQLITE_DB_FILE: str = os.path.join(DATA_DIR, "learners.sqlite3")
+"""SQLite database file used by the SQLite profile store for large rosters."""
+
+PROFILE_STORE_CACHE_SIZE: int = 1024
+"""Maximum number of learner profiles a profile store keeps in memory (least recently used are evicted)."""
+
+PROFILE_STORE_FLUSH_INTERVAL_SECONDS: float = 5.0
+"""Minimum time between automatic flushes of changed profiles; changes in between are batched."""
+
+PROFILE_SCHEMA_VERSION: str = "1.1"
+"""Version written into the metadata of persisted learner profiles."""
+
 # --- HTML Template Configuration (Placeholder) ---
 # For larger templates, consider loading from external files.
 # Example: HTML_TEMPLATE_FILE: str = "student_interface_template.html"
@@ -95,11 +173,58 @@ DEFAULT_TARGET_LO_COUNT: int = 3
 DEFAULT_MAX_ACTIVITIES_PER_LO: int = 2
 """Default maximum number of activities to select per Learning Objective."""
 
+LOOKAHEAD_MAX_PLANNED_LOS: int = 30
+"""Upper bound on the LOs a lookahead pathway plans, which bounds the cost of one request."""
+
+RECENT_CONTENT_HISTORY_SIZE: int = 32
+"""Number of recently served content IDs remembered per learner; selection avoids repeating them."""
+
+ROSTER_GENERATION_BATCH_SIZE: int = 50
+"""Number of student interfaces a roster worker renders before writing them out together."""
+
+ROSTER_OUTPUT_FILENAME_PATTERN: str = "dala_student_interface_{student_id}.html"
+"""Output filename pattern for roster generation; `{student_id}` is replaced with each student's ID."""
+
+# --- Pathway Cache Configurations ---
+PATHWAY_CACHE_SIZE: int = 4096
+"""Maximum number of generated pathways kept by a pathway cache (least recently used are evicted)."""
+
+PATHWAY_CACHE_TTL_SECONDS: float = 300.0
+"""Seconds a cached pathway stays valid, even if the learner's profile and the content are unchanged."""
+
+PATHWAY_PRECOMPUTATION_MAX_ENTRIES: int = 20000
+"""Entries each shared table of a `PathwayPrecomputation` holds before it is cleared and refilled."""
+
+# --- Pathway Service Configurations ---
+PATHWAY_SERVICE_MAX_WORKERS: int = 4
+"""Worker threads the pathway service uses for pathway generation, keeping the event loop free."""
+
+PATHWAY_SERVICE_BATCH_CHUNK_SIZE: int = 100
+"""Learners per executor job when the pathway service generates pathways for a batch."""
+
+PATHWAY_SERVICE_LATENCY_WINDOW: int = 10_000
+"""Number of most recent request latencies the pathway service keeps per operation for percentiles."""
+
 
 # --- DCW-APG Module Configurations ---
 DIFFICULTY_ORDER: Dict[str, int] = {"easy": 1, "medium": 2, "hard": 3, "default": 99}
 """Mapping of difficulty levels (lowercase) to numerical order for sorting content. Lower is easier."""
 
+DIFFICULTY_ALIASES: Dict[str, str] = {
+    "beginner": "easy",
+    "beginner_intermediate": "easy",
+    "intermediate": "medium",
+    "advanced": "hard"
+}
+"""Maps difficulty labels used by some content sets (lowercase) onto the canonical keys of `DIFFICULTY_ORDER`."""
+
+CONTENT_FIELD_ALIASES: Dict[str, List[str]] = {
+    "id": ["id", "content_id"],
+    "type": ["type", "activity_type"],
+    "difficulty": ["difficulty", "difficulty_level"]
+}
+"""Canonical content field names mapped to the source field names that may hold them, in order of precedence."""
+
 CONTENT_TYPE_PRIORITY_FOR_VARIETY: List[str] = ["game", "interactive_quiz", "video", "worksheet_pdf", "text_explanation"]
 """Ordered list defining the priority for selecting diverse content types to ensure variety."""
 
@@ -9,23 +9,39 @@ This module contains:
 1.  Representations of digitized curriculum slices.
 2.  Sets of tagged learning content.
 3.  Logic to store and retrieve this information.
+4.  A registry of merged content stores that reloads only the source files that changed,
+    on demand or from a background watcher.
+5.  Streaming readers that feed content items from JSON Lines or JSON array files into a store
+    one at a time, so large catalogues split across many files are never held as raw lists.
 """
 
+import copy
 import json
 import os
+import re
+import sys
+import hashlib
+import heapq
+import threading
 import logging
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import IO, Dict, List, Any, Optional, Set, Tuple, Iterable, Iterator, Callable, Sequence
 
-# Import and setup logging and data file paths from config.py
+# Import logging setup and data file paths from config.py
 from config import (
     setup_logging,
     CURRICULUM_SLICE_MATH_Y4_FILE,
     LEARNING_CONTENT_SET_MATH_Y4_FILE,
     CURRICULUM_SLICE_KS2_ENGLISH_Y34_FILE,
     KS2_ENGLISH_ACTIVITIES_SET2_FILE,
+    DIFFICULTY_ORDER,
+    DIFFICULTY_ALIASES,
+    CONTENT_FIELD_ALIASES,
+    CONTENT_STREAM_CHUNK_SIZE,
+    CONTENT_WATCH_INTERVAL_SECONDS,
     DATA_DIR # For saving files in the main block
 )
-setup_logging() # Initialize logging configuration
+from instrumentation_module import increment, instrumented
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
@@ -57,6 +73,515 @@ def load_json_data(file_path: str, data_description: str) -> Optional[Any]:
         logger.error(f"An unexpected error occurred while loading {data_description} from {file_path}: {e}")
         return None
 
+# --- Prerequisite Graph ---
+
+class PrerequisiteGraphError(ValueError):
+    """Raised when the prerequisites of a curriculum do not form a directed acyclic graph."""
+
+
+class PrerequisiteGraph:
+    """A compiled, immutable view of the prerequisite relationships between learning objectives.
+
+    The graph is built once per curriculum. It provides a topological order of the LOs, the
+    reverse dependencies of every LO (which LOs list it as a prerequisite) and the number of
+    prerequisites each LO has, so that eligibility can be tracked incrementally per learner
+    with an `EligibilityTracker` instead of rescanning the whole curriculum.
+
+    Prerequisite IDs that do not match any LO in the curriculum are kept (so an LO depending on
+    them only becomes eligible once the learner has completed that ID elsewhere) and reported
+    in `missing_prerequisites`.
+
+    Attributes:
+        lo_ids (List[str]): All LO IDs in curriculum order.
+        lo_index (Dict[str, int]): Position of each LO ID in `lo_ids`.
+        prerequisites (Dict[str, Tuple[str, ...]]): Prerequisite IDs of each LO, without duplicates.
+        dependents (Dict[str, Tuple[str, ...]]): LO IDs that list the key as a prerequisite.
+        prerequisite_counts (Dict[str, int]): Number of prerequisites of each LO.
+        topological_order (List[str]): LO IDs ordered so every LO follows all of its prerequisites.
+        topological_rank (Dict[str, int]): Position of each LO ID in `topological_order`.
+        missing_prerequisites (Dict[str, List[str]]): Unknown prerequisite IDs, keyed by the LO referencing them.
+        prerequisite_masks (Dict[str, Optional[int]]): For each LO, a bitmask with bit `lo_index[p]` set for
+                                                       every prerequisite `p`; None if a prerequisite is unknown.
+                                                       Built on first access.
+    """
+
+    def __init__(self, learning_objectives: List[Dict[str, Any]]):
+        """Compiles the graph and validates it.
+
+        Args:
+            learning_objectives (List[Dict[str, Any]]): The LO dictionaries of a curriculum slice.
+
+        Raises:
+            PrerequisiteGraphError: If the prerequisites contain a cycle.
+        """
+        self._link(
+            list(dict.fromkeys(lo["id"] for lo in learning_objectives)),
+            {lo["id"]: tuple(dict.fromkeys(lo.get("prerequisites", []))) for lo in learning_objectives}
+        )
+        self.topological_order: List[str] = self._compute_topological_order()
+        self.topological_rank: Dict[str, int] = {lo_id: rank for rank, lo_id in enumerate(self.topological_order)}
+
+    @classmethod
+    def from_compiled(
+        cls,
+        lo_ids: List[str],
+        prerequisites: Dict[str, Tuple[str, ...]],
+        topological_order: List[str]
+    ) -> "PrerequisiteGraph":
+        """Rebuilds a graph from parts of an already validated graph (e.g. a store snapshot).
+
+        The topological order is taken as given rather than recomputed.
+
+        Args:
+            lo_ids (List[str]): All LO IDs in curriculum order, without duplicates.
+            prerequisites (Dict[str, Tuple[str, ...]]): De-duplicated prerequisite IDs of each LO.
+            topological_order (List[str]): The LO IDs in topological order.
+
+        Returns:
+            PrerequisiteGraph: The graph.
+        """
+        graph = cls.__new__(cls)
+        graph._link(lo_ids, prerequisites)
+        graph.topological_order = list(topological_order)
+        graph.topological_rank = {lo_id: rank for rank, lo_id in enumerate(graph.topological_order)}
+        return graph
+
+    def _link(self, lo_ids: List[str], prerequisites: Dict[str, Tuple[str, ...]]) -> None:
+        """Derives the lookup tables (index, dependents, counts) from the LO IDs and prerequisites."""
+        self.lo_ids: List[str] = lo_ids
+        self.lo_index: Dict[str, int] = {lo_id: index for index, lo_id in enumerate(self.lo_ids)}
+        self.prerequisites: Dict[str, Tuple[str, ...]] = prerequisites
+        self.prerequisite_counts: Dict[str, int] = {lo_id: len(prereqs) for lo_id, prereqs in self.prerequisites.items()}
+
+        dependents: Dict[str, List[str]] = {}
+        self.missing_prerequisites: Dict[str, List[str]] = {}
+        for lo_id, prereqs in self.prerequisites.items():
+            for prereq_id in prereqs:
+                dependents.setdefault(prereq_id, []).append(lo_id)
+                if prereq_id not in self.lo_index:
+                    self.missing_prerequisites.setdefault(lo_id, []).append(prereq_id)
+        self.dependents: Dict[str, Tuple[str, ...]] = {lo_id: tuple(deps) for lo_id, deps in dependents.items()}
+
+        # Only needed for compact profiles; built on first use
+        self._prerequisite_indices: Optional[List[Optional[Tuple[int, ...]]]] = None
+        self._prerequisite_masks: Optional[Dict[str, Optional[int]]] = None
+
+        if self.missing_prerequisites:
+            logger.warning("Prerequisite graph references unknown LO IDs: %s", self.missing_prerequisites)
+
+    def _compute_topological_order(self) -> List[str]:
+        """Orders the LOs with Kahn's algorithm, keeping curriculum order among independent LOs.
+
+        Unknown prerequisite IDs are ignored for ordering purposes.
+
+        Returns:
+            List[str]: The LO IDs in topological order.
+
+        Raises:
+            PrerequisiteGraphError: If not every LO could be ordered because of a cycle.
+        """
+        in_degree = {
+            lo_id: sum(1 for prereq_id in prereqs if prereq_id in self.lo_index)
+            for lo_id, prereqs in self.prerequisites.items()
+        }
+        ready = deque(lo_id for lo_id in self.lo_ids if in_degree[lo_id] == 0)
+        order: List[str] = []
+        while ready:
+            lo_id = ready.popleft()
+            order.append(lo_id)
+            for dependent_id in self.dependents.get(lo_id, ()):
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    ready.append(dependent_id)
+        if len(order) != len(self.lo_ids):
+            cyclic_los = sorted(lo_id for lo_id, degree in in_degree.items() if degree > 0)
+            raise PrerequisiteGraphError(f"Prerequisite cycle detected among LOs: {cyclic_los}")
+        return order
+
+    def is_eligible(self, lo_id: str, completed_los: Iterable[str]) -> bool:
+        """Checks if all prerequisites of an LO are in a set of completed LO IDs.
+
+        Args:
+            lo_id (str): The LO to check.
+            completed_los (Iterable[str]): The learner's completed LO IDs (ideally a set).
+
+        Returns:
+            bool: True if the LO is known and all of its prerequisites are completed.
+        """
+        prereqs = self.prerequisites.get(lo_id)
+        if prereqs is None:
+            return False
+        return all(prereq_id in completed_los for prereq_id in prereqs)
+
+    @property
+    def prerequisite_masks(self) -> Dict[str, Optional[int]]:
+        """Dict[str, Optional[int]]: Prerequisite bitmask of each LO (see the class attributes), built on first access."""
+        if self._prerequisite_masks is None:
+            masks: Dict[str, Optional[int]] = {}
+            for lo_id, prereq_indices in zip(self.lo_ids, self._get_prerequisite_indices()):
+                mask: Optional[int] = None
+                if prereq_indices is not None:
+                    mask = 0
+                    for index in prereq_indices:
+                        mask |= 1 << index
+                masks[lo_id] = mask
+            self._prerequisite_masks = masks
+        return self._prerequisite_masks
+
+    def _get_prerequisite_indices(self) -> List[Optional[Tuple[int, ...]]]:
+        """Returns the `lo_index` positions of each LO's prerequisites, aligned with `lo_ids` (None if one is unknown)."""
+        if self._prerequisite_indices is None:
+            lo_index = self.lo_index
+            self._prerequisite_indices = [
+                None if any(prereq_id not in lo_index for prereq_id in self.prerequisites[lo_id])
+                else tuple(lo_index[prereq_id] for prereq_id in self.prerequisites[lo_id])
+                for lo_id in self.lo_ids
+            ]
+        return self._prerequisite_indices
+
+    def eligible_lo_ids_for_bits(self, completed_bits: int, has_completed_lo: Callable[[str], bool]) -> List[str]:
+        """Lists uncompleted LOs whose prerequisites are completed, for a bitset of completed LOs.
+
+        Bit `lo_index[lo_id]` of `completed_bits` is set when the LO is completed. The bitset is
+        expanded into one flag per LO in a single pass, so the scan costs O(V + E) however large
+        the curriculum, instead of a big-integer shift or AND per LO.
+
+        Args:
+            completed_bits (int): Bitset of completed LOs, indexed by `lo_index`.
+            has_completed_lo (Callable[[str], bool]): Fallback check for prerequisite IDs outside the graph.
+
+        Returns:
+            List[str]: The eligible LO IDs in curriculum order.
+        """
+        # "1" at position i when LO i is completed (least significant bit first), padded to every LO
+        completed_flags = format(completed_bits, "b")[::-1].ljust(len(self.lo_ids), "0")
+        eligible: List[str] = []
+        for lo_id, completed, prereq_indices in zip(self.lo_ids, completed_flags, self._get_prerequisite_indices()):
+            if completed == "1":
+                continue
+            if prereq_indices is None:
+                if all(has_completed_lo(prereq_id) for prereq_id in self.prerequisites[lo_id]):
+                    eligible.append(lo_id)
+                continue
+            for index in prereq_indices:
+                if completed_flags[index] != "1":
+                    break
+            else:
+                eligible.append(lo_id)
+        return eligible
+
+    def plan_lookahead(
+        self,
+        eligible_lo_ids: Iterable[str],
+        has_completed_lo: Callable[[str], bool],
+        max_los: int
+    ) -> List[Tuple[str, int]]:
+        """Plans up to `max_los` LOs ahead, including LOs unlocked by earlier steps of the plan.
+
+        Starting from the currently eligible LOs, the candidate with the lowest `topological_rank`
+        is planned next and treated as completed, which makes dependents whose prerequisites are
+        now all completed or planned candidates for later steps. Every LO therefore follows its
+        prerequisites. Only the `max_los` best-ranked eligible LOs can be planned, so the heap
+        starts with those, and planning an LO only touches its dependents and their
+        prerequisites: the cost grows with the plan length, not with the size of the curriculum.
+
+        Args:
+            eligible_lo_ids (Iterable[str]): LO IDs the learner is eligible for now.
+            has_completed_lo (Callable[[str], bool]): Checks whether the learner has completed an LO ID.
+            max_los (int): Maximum number of LOs to plan.
+
+        Returns:
+            List[Tuple[str, int]]: The planned LO IDs in order, each with its layer: 0 for LOs eligible now,
+                                   otherwise one more than the highest layer among its planned prerequisites.
+        """
+        if max_los <= 0:
+            return []
+        rank = self.topological_rank
+        # nsmallest returns the candidates sorted, which is already a valid heap
+        candidates = [(rank[lo_id], lo_id, 0) for lo_id in heapq.nsmallest(max_los, eligible_lo_ids, key=rank.__getitem__)]
+        planned_layers: Dict[str, int] = {}
+        plan: List[Tuple[str, int]] = []
+        while candidates and len(plan) < max_los:
+            _, lo_id, layer = heapq.heappop(candidates)
+            planned_layers[lo_id] = layer
+            plan.append((lo_id, layer))
+            for dependent_id in self.dependents.get(lo_id, ()):
+                if dependent_id in planned_layers or has_completed_lo(dependent_id):
+                    continue
+                dependent_layer = 0
+                for prereq_id in self.prerequisites[dependent_id]:
+                    if prereq_id in planned_layers:
+                        dependent_layer = max(dependent_layer, planned_layers[prereq_id] + 1)
+                    elif not has_completed_lo(prereq_id):
+                        break
+                else:
+                    # lo_id was the last prerequisite to be planned, so this is the only push
+                    heapq.heappush(candidates, (rank[dependent_id], dependent_id, dependent_layer))
+        return plan
+
+    def create_tracker(self, completed_los: Iterable[str]) -> "EligibilityTracker":
+        """Creates an `EligibilityTracker` seeded with a learner's completed LOs.
+
+        Args:
+            completed_los (Iterable[str]): The learner's completed LO IDs.
+
+        Returns:
+            EligibilityTracker: A tracker bound to this graph.
+        """
+        return EligibilityTracker(self, completed_los)
+
+
+class EligibilityTracker:
+    """Tracks which LOs a single learner is eligible for as they complete LOs.
+
+    Built once from the learner's completed LOs in O(V + E); afterwards `mark_completed` only
+    touches the dependents of the completed LO, decrementing their remaining-prerequisite
+    counters and unlocking those that reach zero.
+
+    Attributes:
+        graph (PrerequisiteGraph): The graph the tracker is bound to.
+        completed_los (Set[str]): LO IDs the learner has completed (including IDs outside the graph).
+        remaining_prerequisites (Dict[str, int]): Number of not-yet-completed prerequisites per LO.
+        eligible_los (Set[str]): Uncompleted LO IDs whose prerequisites are all completed.
+    """
+
+    def __init__(self, graph: PrerequisiteGraph, completed_los: Iterable[str]):
+        """Initializes the tracker from a learner's completed LOs.
+
+        Args:
+            graph (PrerequisiteGraph): The compiled prerequisite graph.
+            completed_los (Iterable[str]): The learner's completed LO IDs.
+        """
+        self.graph = graph
+        self.completed_los: Set[str] = set(completed_los)
+        self.remaining_prerequisites: Dict[str, int] = {
+            lo_id: sum(1 for prereq_id in prereqs if prereq_id not in self.completed_los)
+            for lo_id, prereqs in graph.prerequisites.items()
+        }
+        self.eligible_los: Set[str] = {
+            lo_id for lo_id, remaining in self.remaining_prerequisites.items()
+            if remaining == 0 and lo_id not in self.completed_los
+        }
+
+    def mark_completed(self, lo_id: str) -> List[str]:
+        """Records a completed LO and unlocks its dependents in O(out-degree).
+
+        Args:
+            lo_id (str): The completed LO ID.
+
+        Returns:
+            List[str]: LO IDs that became eligible because of this completion.
+        """
+        if lo_id in self.completed_los:
+            return []
+        self.completed_los.add(lo_id)
+        self.eligible_los.discard(lo_id)
+        unlocked: List[str] = []
+        for dependent_id in self.graph.dependents.get(lo_id, ()):
+            self.remaining_prerequisites[dependent_id] -= 1
+            if self.remaining_prerequisites[dependent_id] == 0 and dependent_id not in self.completed_los:
+                self.eligible_los.add(dependent_id)
+                unlocked.append(dependent_id)
+        return unlocked
+
+    def is_eligible(self, lo_id: str) -> bool:
+        """Checks if an LO is currently eligible (uncompleted, all prerequisites done).
+
+        Args:
+            lo_id (str): The LO ID to check.
+
+        Returns:
+            bool: True if the LO is eligible.
+        """
+        return lo_id in self.eligible_los
+
+    def get_eligible_lo_ids(self) -> List[str]:
+        """Returns the currently eligible LO IDs in curriculum order.
+
+        Returns:
+            List[str]: The eligible LO IDs.
+        """
+        return sorted(self.eligible_los, key=self.graph.lo_index.__getitem__)
+
+# --- Content Record Normalisation ---
+
+class ContentRecord:
+    """A content item normalised once at load time into a compact, canonical form.
+
+    Content sets name the same fields differently (`type`/`activity_type`, `difficulty`/
+    `difficulty_level`, `id`/`content_id`) and use different difficulty labels. Every item is
+    converted into a `ContentRecord` when it enters a `CurriculumContentStore`, so the pathway
+    selection loops read plain attributes instead of probing dictionaries per item.
+
+    Attributes:
+        content_id (str): The content item's ID.
+        content_type (Optional[str]): The interned content type (e.g. "video"), or None if absent.
+        difficulty (str): The canonical difficulty key from `DIFFICULTY_ORDER` (e.g. "medium").
+        difficulty_rank (int): The numeric rank of `difficulty`; lower is easier.
+        learning_objectives_covered (Tuple[str, ...]): IDs of the LOs the item covers.
+        target_preferences (Tuple[str, ...]): Learning preferences the item targets.
+        item (Dict[str, Any]): The item as a dictionary with canonical `id`, `type` and `difficulty`
+                               keys; this is what the store's public methods return.
+    """
+    __slots__ = (
+        "content_id", "content_type", "difficulty", "difficulty_rank",
+        "learning_objectives_covered", "target_preferences", "item"
+    )
+
+    def __init__(
+        self,
+        content_id: str,
+        content_type: Optional[str],
+        difficulty: str,
+        learning_objectives_covered: Tuple[str, ...],
+        target_preferences: Tuple[str, ...],
+        item: Dict[str, Any]
+    ):
+        """Initializes a record from already-canonical values (see `normalise_content_item`)."""
+        self.content_id = content_id
+        self.content_type = content_type
+        self.difficulty = difficulty
+        self.difficulty_rank = DIFFICULTY_ORDER[difficulty]
+        self.learning_objectives_covered = learning_objectives_covered
+        self.target_preferences = target_preferences
+        self.item = item
+
+    def __repr__(self) -> str:
+        return f"ContentRecord(content_id={self.content_id!r}, content_type={self.content_type!r}, difficulty={self.difficulty!r})"
+
+
+def _first_present_field(raw_item: Dict[str, Any], canonical_field: str) -> Any:
+    """Returns the value of the first alias of `canonical_field` present in `raw_item`, or None."""
+    for field_name in CONTENT_FIELD_ALIASES[canonical_field]:
+        value = raw_item.get(field_name)
+        if value is not None:
+            return value
+    return None
+
+
+def normalise_difficulty(raw_difficulty: Any) -> str:
+    """Maps a difficulty label from any content set onto a key of `DIFFICULTY_ORDER`.
+
+    Args:
+        raw_difficulty (Any): The label as found in the source data (e.g. "Medium", "intermediate").
+
+    Returns:
+        str: The canonical difficulty key, or "default" if the label is missing or unknown.
+    """
+    if not isinstance(raw_difficulty, str):
+        return "default"
+    label = raw_difficulty.strip().lower()
+    label = DIFFICULTY_ALIASES.get(label, label)
+    return label if label in DIFFICULTY_ORDER else "default"
+
+
+def normalise_content_item(raw_item: Dict[str, Any]) -> ContentRecord:
+    """Converts a raw content dictionary from any content set into a `ContentRecord`.
+
+    The record's `item` is the raw dictionary itself when it already uses the canonical field
+    names and values; otherwise it is a shallow copy with canonical `id`, `type` and `difficulty`
+    keys added (the original keys are kept).
+
+    Args:
+        raw_item (Dict[str, Any]): The content item as loaded from JSON.
+
+    Returns:
+        ContentRecord: The normalised record.
+
+    Raises:
+        ValueError: If the item has no ID under any known field name.
+    """
+    content_id = _first_present_field(raw_item, "id")
+    if content_id is None:
+        raise ValueError(f"Content item has no ID field ({CONTENT_FIELD_ALIASES['id']}): {raw_item.get('title', raw_item)}")
+    raw_type = _first_present_field(raw_item, "type")
+    content_type = sys.intern(str(raw_type)) if raw_type is not None else None
+    difficulty = normalise_difficulty(_first_present_field(raw_item, "difficulty"))
+
+    item = raw_item
+    if raw_item.get("id") != content_id or raw_item.get("type") != content_type or raw_item.get("difficulty") != difficulty:
+        item = dict(raw_item)
+        item["id"] = content_id
+        if content_type is not None:
+            item["type"] = content_type
+        item["difficulty"] = difficulty
+
+    return ContentRecord(
+        content_id=content_id,
+        content_type=content_type,
+        difficulty=difficulty,
+        learning_objectives_covered=tuple(raw_item.get("learning_objectives_covered", ())),
+        target_preferences=tuple(raw_item.get("target_preferences", ())),
+        item=item
+    )
+
+# --- Per-LO Content Index ---
+
+class LOContentIndex:
+    """The content of one learning objective, pre-sorted by difficulty and bucketed by content type.
+
+    Every bucket keeps the difficulty order of `records`, so the easiest unused record of a given
+    type is found by a dictionary lookup followed by a scan that only skips records already
+    selected in the current call.
+
+    Attributes:
+        records (List[ContentRecord]): All content for the LO, easiest first (stable for equal ranks).
+        by_type (Dict[Optional[str], List[ContentRecord]]): The same records grouped by content type.
+    """
+
+    def __init__(self, records: List[ContentRecord]):
+        """Sorts and buckets the content records of an LO.
+
+        Args:
+            records (List[ContentRecord]): The normalised content covering the LO, in any order.
+        """
+        self.records: List[ContentRecord] = sorted(records, key=lambda record: record.difficulty_rank)
+        self.by_type: Dict[Optional[str], List[ContentRecord]] = {}
+        for record in self.records:
+            self.by_type.setdefault(record.content_type, []).append(record)
+
+    @classmethod
+    def from_sorted(cls, records: List[ContentRecord]) -> "LOContentIndex":
+        """Builds an index from records that are already in difficulty order (e.g. from a store snapshot).
+
+        Args:
+            records (List[ContentRecord]): The records, easiest first.
+
+        Returns:
+            LOContentIndex: The index.
+        """
+        index = cls.__new__(cls)
+        index.records = records
+        index.by_type = {}
+        for record in records:
+            index.by_type.setdefault(record.content_type, []).append(record)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def sorted_items(self) -> List[Dict[str, Any]]:
+        """List[Dict[str, Any]]: The content items, easiest first."""
+        return [record.item for record in self.records]
+
+    def first_unused_of_type(self, content_type: str, used_content_ids: Set[str]) -> Optional[ContentRecord]:
+        """Returns the easiest record of a content type that has not been used yet.
+
+        Args:
+            content_type (str): The content type to look up (e.g. "video").
+            used_content_ids (Set[str]): Content IDs already selected.
+
+        Returns:
+            Optional[ContentRecord]: The record, or None if there is none.
+        """
+        for record in self.by_type.get(content_type, ()):
+            if record.content_id not in used_content_ids:
+                return record
+        return None
+
+_EMPTY_LO_CONTENT_INDEX = LOContentIndex([])
+
 # --- Storage and Retrieval Logic (Simplified) ---
 
 class CurriculumContentStore:
@@ -69,43 +594,126 @@ class CurriculumContentStore:
     Attributes:
         curriculum (Dict[str, Any]): The raw curriculum data (e.g., a subject slice).
         content_library (Dict[str, Dict[str, Any]]): A dictionary of all content items, keyed by content ID.
+        content_records (Dict[str, ContentRecord]): The normalised form of every content item, keyed by content ID.
         lo_to_content_map (Dict[str, List[str]]): Maps Learning Objective IDs to a list of content item IDs.
         lo_details_map (Dict[str, Dict[str, Any]]): Maps Learning Objective IDs to their detailed definitions.
+        prerequisite_graph (PrerequisiteGraph): The compiled prerequisite graph of the curriculum's LOs.
+        lo_content_index (Dict[str, LOContentIndex]): Difficulty-sorted, type-bucketed content for each LO ID.
+        content_version (Optional[str]): Fingerprint of the source files when built by a
+                                         `ContentStoreRegistry`, otherwise None.
     """
-    def __init__(self, curriculum_data: Dict[str, Any], content_data: List[Dict[str, Any]]):
+    @instrumented("content_store.build")
+    def __init__(self, curriculum_data: Dict[str, Any], content_data: Iterable[Dict[str, Any]]):
         """Initializes the CurriculumContentStore.
 
         Args:
             curriculum_data (Dict[str, Any]): The curriculum slice data.
-            content_data (List[Dict[str, Any]]): The list of learning content items.
+            content_data (Iterable[Dict[str, Any]]): The learning content items. Any iterable is
+                                                     accepted and consumed once, so a generator such
+                                                     as `iter_content_files` can feed items straight
+                                                     from disk without building a list.
+
+        Raises:
+            PrerequisiteGraphError: If the curriculum's prerequisites contain a cycle.
         """
         self.curriculum = curriculum_data if curriculum_data else {}
-        self.content_library = {item["id"]: item for item in content_data} if content_data else {}
-        self.lo_to_content_map = self._build_lo_to_content_map(content_data if content_data else [])
+        self.content_records, self.lo_to_content_map = self._ingest_content(content_data if content_data else [])
+        self.content_library = {content_id: record.item for content_id, record in self.content_records.items()}
         self.lo_details_map = {lo["id"]: lo for lo in self.curriculum.get("learning_objectives", [])}
-        if curriculum_data and content_data:
-            logger.info(f"CurriculumContentStore initialized with {len(self.lo_details_map)} LOs and {len(self.content_library)} content items.")
+        self.prerequisite_graph = PrerequisiteGraph(self.curriculum.get("learning_objectives", []))
+        self.lo_content_index = {
+            lo_id: LOContentIndex([self.content_records[cid] for cid in content_ids])
+            for lo_id, content_ids in self.lo_to_content_map.items()
+        }
+        self.content_version: Optional[str] = None
+        if self.curriculum and self.content_records:
+            logger.info("CurriculumContentStore initialized with %s LOs and %s content items.", len(self.lo_details_map), len(self.content_library))
         else:
             logger.warning("CurriculumContentStore initialized with empty or missing curriculum/content data.")
 
-    def _build_lo_to_content_map(self, content_data: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    @classmethod
+    def from_content_files(cls, curriculum_data: Dict[str, Any], content_files: Sequence[str]) -> "CurriculumContentStore":
+        """Builds a store by streaming its content from one or more JSON Lines / JSON array files.
+
+        Items are read, normalised and indexed one at a time (see `iter_content_files`); an ID
+        that appears in several files keeps its first occurrence.
+
+        The store keeps every item, so streaming does not lower the memory a store retains. What it
+        avoids is a second copy of the catalogue during the build: peak memory stays at what the
+        store retains, whereas building from a `json.load`ed list also holds the list and, when
+        items need their field names normalised, the raw items (about 20% more at peak for such
+        content in benchmarks/bench_content_streaming.py). It also accepts JSON Lines and split
+        files. Decoding items one at a time is about 1.3-2x slower than `json.load`, so for small
+        canonical JSON arrays loading the list and passing it to the constructor is faster.
+
+        Args:
+            curriculum_data (Dict[str, Any]): The curriculum slice data.
+            content_files (Sequence[str]): Content set files, in priority order.
+
+        Returns:
+            CurriculumContentStore: The store.
+
+        Raises:
+            FileNotFoundError: If a content file doesn't exist.
+            ValueError: If a content file is malformed.
+        """
+        return cls(curriculum_data, iter_content_files(content_files))
+
+    def _ingest_content(self, content_data: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, ContentRecord], Dict[str, List[str]]]:
+        """Helper method to normalise raw content items and map them to learning objectives in one pass.
+
+        Items without a recognisable ID are skipped with a warning. As before, a later item in
+        `content_data` with the same ID replaces an earlier one; only then is the LO map rebuilt
+        from the final records, so it stays in the same order as `content_records`. (Streamed
+        files never reach this case: `iter_content_files` drops repeated IDs itself, keeping the
+        first occurrence as `merge_content_sets` does.)
+
+        Args:
+            content_data (Iterable[Dict[str, Any]]): Raw content items to process.
+
+        Returns:
+            Tuple[Dict[str, ContentRecord], Dict[str, List[str]]]: The normalised records keyed by
+            content ID, and the map from LO IDs to content IDs.
+        """
+        records: Dict[str, ContentRecord] = {}
+        mapping: Dict[str, List[str]] = {}
+        replaced_any = False
+        for raw_item in content_data:
+            try:
+                record = normalise_content_item(raw_item)
+            except ValueError as e:
+                logger.warning("Skipping content item: %s", e)
+                continue
+            if record.content_id in records:
+                replaced_any = True
+            records[record.content_id] = record
+            if not replaced_any:
+                for lo_id in record.learning_objectives_covered:
+                    if lo_id not in mapping:
+                        mapping[lo_id] = []
+                    mapping[lo_id].append(record.content_id)
+        if replaced_any:
+            mapping = self._build_lo_to_content_map(records.values())
+        return records, mapping
+
+    def _build_lo_to_content_map(self, content_records: Iterable[ContentRecord]) -> Dict[str, List[str]]:
         """Helper method to map learning objectives to content items.
         
         Creates a dictionary where keys are Learning Objective IDs and values are
         lists of content item IDs that cover those learning objectives.
         
         Args:
-            content_data (List[Dict[str, Any]]): List of content items to process.
+            content_records (Iterable[ContentRecord]): The normalised content records to process.
             
         Returns:
             Dict[str, List[str]]: Mapping from Learning Objective IDs to lists of content item IDs.
         """
         mapping: Dict[str, List[str]] = {}
-        for item in content_data:
-            for lo_id in item.get("learning_objectives_covered", []):
+        for record in content_records:
+            for lo_id in record.learning_objectives_covered:
                 if lo_id not in mapping:
                     mapping[lo_id] = []
-                mapping[lo_id].append(item["id"])
+                mapping[lo_id].append(record.content_id)
         return mapping
 
     def get_learning_objectives(self) -> List[Dict[str, Any]]:
@@ -126,6 +734,7 @@ class CurriculumContentStore:
         Returns:
             Optional[Dict[str, Any]]: The learning objective dictionary if found, None otherwise.
         """
+        increment("content_store.get_lo_by_id")
         return self.lo_details_map.get(lo_id)
 
     def get_content_by_id(self, content_id: str) -> Optional[Dict[str, Any]]:
@@ -137,6 +746,7 @@ class CurriculumContentStore:
         Returns:
             Optional[Dict[str, Any]]: The content item dictionary if found, None otherwise.
         """
+        increment("content_store.get_content_by_id")
         return self.content_library.get(content_id)
 
     def get_content_for_lo(self, lo_id: str) -> List[Dict[str, Any]]:
@@ -149,10 +759,135 @@ class CurriculumContentStore:
             List[Dict[str, Any]]: A list of content item dictionaries that cover the specified
                                  learning objective. Returns an empty list if no content is found or content items are missing.
         """
+        increment("content_store.get_content_for_lo")
         content_ids = self.lo_to_content_map.get(lo_id, [])
         # Ensure that we only return content that actually exists in the library
         return [content for cid in content_ids if (content := self.get_content_by_id(cid)) is not None]
 
+    def get_content_index_for_lo(self, lo_id: str) -> LOContentIndex:
+        """Retrieves the pre-sorted, type-bucketed content index for a learning objective.
+
+        Args:
+            lo_id (str): The unique identifier of the learning objective.
+
+        Returns:
+            LOContentIndex: The LO's content index (empty if no content covers the LO).
+        """
+        increment("content_store.get_content_index_for_lo")
+        content_index = self.lo_content_index.get(lo_id)
+        if content_index is None:
+            content_index = _EMPTY_LO_CONTENT_INDEX
+        return content_index
+
+    @instrumented("content_store.with_changes")
+    def with_changes(
+        self,
+        upserted_content: Iterable[Dict[str, Any]] = (),
+        removed_content_ids: Iterable[str] = (),
+        curriculum_data: Optional[Dict[str, Any]] = None,
+        content_order: Optional[Callable[[str], Any]] = None
+    ) -> "CurriculumContentStore":
+        """Returns a copy of the store with some content items and/or the curriculum replaced.
+
+        The store itself is left untouched (copy-on-write), so pathway generations still using it
+        keep a consistent view. The copy shares every unaffected object with this store: only
+        the changed entries of `content_records`, `content_library`, `lo_to_content_map`,
+        `lo_content_index` and `lo_details_map` are replaced, and the prerequisite graph is only
+        recompiled when an LO's ID, position or prerequisites changed.
+
+        Args:
+            upserted_content (Iterable[Dict[str, Any]], optional): Raw content items to add or replace.
+            removed_content_ids (Iterable[str], optional): IDs of content items to remove.
+            curriculum_data (Optional[Dict[str, Any]], optional): The new curriculum slice, or None to
+                                                                  keep the current one.
+            content_order (Optional[Callable[[str], Any]], optional): Sort key for content IDs, used to
+                                                                      keep the content lists of affected LOs
+                                                                      in the order a full rebuild would give.
+                                                                      Defaults to None (existing content
+                                                                      first, new content appended).
+
+        Returns:
+            CurriculumContentStore: The patched store.
+
+        Raises:
+            PrerequisiteGraphError: If the new curriculum's prerequisites contain a cycle.
+        """
+        store = copy.copy(self)
+        upserted_records = []
+        for raw_item in upserted_content:
+            try:
+                upserted_records.append(normalise_content_item(raw_item))
+            except ValueError as e:
+                logger.warning("Skipping content item: %s", e)
+        removed_content_ids = [content_id for content_id in removed_content_ids if content_id in self.content_records]
+
+        if upserted_records or removed_content_ids:
+            store.content_records = dict(self.content_records)
+            store.content_library = dict(self.content_library)
+            affected_lo_ids: Set[str] = set()
+            for content_id in removed_content_ids:
+                affected_lo_ids.update(store.content_records.pop(content_id).learning_objectives_covered)
+                del store.content_library[content_id]
+            for record in upserted_records:
+                previous = store.content_records.get(record.content_id)
+                if previous is not None:
+                    affected_lo_ids.update(previous.learning_objectives_covered)
+                affected_lo_ids.update(record.learning_objectives_covered)
+                store.content_records[record.content_id] = record
+                store.content_library[record.content_id] = record.item
+
+            store.lo_to_content_map = dict(self.lo_to_content_map)
+            store.lo_content_index = dict(self.lo_content_index)
+            for lo_id in affected_lo_ids:
+                # Keep surviving IDs in place, then add IDs that newly cover the LO
+                content_ids = [
+                    content_id for content_id in self.lo_to_content_map.get(lo_id, ())
+                    if content_id in store.content_records and lo_id in store.content_records[content_id].learning_objectives_covered
+                ]
+                listed = set(content_ids)
+                content_ids.extend(
+                    record.content_id for record in upserted_records
+                    if lo_id in record.learning_objectives_covered and record.content_id not in listed
+                    and store.content_records[record.content_id] is record
+                )
+                if content_order is not None:
+                    content_ids.sort(key=content_order)
+                if content_ids:
+                    store.lo_to_content_map[lo_id] = content_ids
+                    store.lo_content_index[lo_id] = LOContentIndex([store.content_records[cid] for cid in content_ids])
+                else:
+                    store.lo_to_content_map.pop(lo_id, None)
+                    store.lo_content_index.pop(lo_id, None)
+        else:
+            affected_lo_ids = set()
+
+        changed_lo_count = 0
+        if curriculum_data is not None:
+            store.curriculum = curriculum_data
+            new_los = curriculum_data.get("learning_objectives", [])
+            new_details = {lo["id"]: lo for lo in new_los}
+            store.lo_details_map = dict(self.lo_details_map)
+            for lo_id in [lo_id for lo_id in store.lo_details_map if lo_id not in new_details]:
+                del store.lo_details_map[lo_id]
+                changed_lo_count += 1
+            for lo_id, lo in new_details.items():
+                if store.lo_details_map.get(lo_id) != lo:
+                    store.lo_details_map[lo_id] = lo
+                    changed_lo_count += 1
+
+            def graph_inputs(learning_objectives: List[Dict[str, Any]]) -> List[Tuple[str, Tuple[str, ...]]]:
+                return [(lo["id"], tuple(lo.get("prerequisites", []))) for lo in learning_objectives]
+
+            if graph_inputs(new_los) != graph_inputs(self.curriculum.get("learning_objectives", [])):
+                store.prerequisite_graph = PrerequisiteGraph(new_los)
+
+        logger.info(
+            "Patched content store: %s content items added or changed, %s removed, %s LO content lists and "
+            "%s LO definitions updated.",
+            len(upserted_records), len(removed_content_ids), len(affected_lo_ids), changed_lo_count
+        )
+        return store
+
     def save_to_json(self, curriculum_filepath: str = "curriculum_slice.json", content_filepath: str = "learning_content.json") -> None:
         """Saves the current curriculum and content library to JSON files.
 
@@ -179,8 +914,702 @@ class CurriculumContentStore:
         except Exception as e:
             logger.error(f"An unexpected error occurred during save_to_json: {e}")
 
+# --- Merged Content Store Registry ---
+
+def merge_curriculum_slices(curricula: Iterable[Dict[str, Any]], **curriculum_fields: Any) -> Dict[str, Any]:
+    """Merges the learning objectives of several curriculum slices into one slice.
+
+    LOs are de-duplicated by ID, keeping the first occurrence.
+
+    Args:
+        curricula (Iterable[Dict[str, Any]]): The curriculum slices, in priority order.
+        **curriculum_fields (Any): Top-level fields of the merged slice (e.g. `subject`, `year_group`).
+
+    Returns:
+        Dict[str, Any]: The merged curriculum slice.
+    """
+    merged_los = []
+    seen_lo_ids = set()
+    for curriculum in curricula:
+        for lo in curriculum.get("learning_objectives", []):
+            if lo.get("id") not in seen_lo_ids:
+                merged_los.append(lo)
+                seen_lo_ids.add(lo.get("id"))
+    return {**curriculum_fields, "learning_objectives": merged_los}
+
+
+def merge_content_sets(content_sets: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Concatenates several content sets, de-duplicating items by ID and keeping the first occurrence.
+
+    Args:
+        content_sets (Iterable[List[Dict[str, Any]]]): The content sets, in priority order.
+
+    Returns:
+        List[Dict[str, Any]]: The merged content items.
+    """
+    merged_content = []
+    seen_content_ids = set()
+    for content_set in content_sets:
+        for item in content_set:
+            content_id = _first_present_field(item, "id")
+            if content_id not in seen_content_ids:
+                merged_content.append(item)
+                seen_content_ids.add(content_id)
+    return merged_content
+
+
+# --- Streaming Content Readers ---
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_SCALAR_END = re.compile(r"[ \t\n\r,\]]")
+CONTENT_FILE_EXTENSIONS: Tuple[str, ...] = (".json", ".jsonl")
+"""File extensions considered when scanning a data directory for curriculum and content files."""
+
+
+class _JSONChunkReader:
+    """Reads JSON values one at a time from a file read in chunks (see `iter_json_array_items`)."""
+
+    def __init__(self, f: IO[str], file_path: str, chunk_size: int):
+        self.f = f
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.exhausted = False
+        self.decoder = json.JSONDecoder()
+
+    def read_more(self) -> bool:
+        # Grow reads with the buffer so a value larger than a chunk is decoded in O(size)
+        chunk = "" if self.exhausted else self.f.read(max(self.chunk_size, len(self.buffer) - self.position))
+        if not chunk:
+            self.exhausted = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def next_token(self) -> str:
+        """Skips whitespace and returns the next character without consuming it ('' at the end)."""
+        while True:
+            self.position = _JSON_WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read_more():
+                return ""
+
+    def expect_end(self, description: str) -> None:
+        """Consumes the closing character of the top-level value and checks that nothing follows it."""
+        self.position += 1
+        if self.next_token():
+            raise ValueError(f"Unexpected data after the {description} in {self.file_path}.")
+
+    def decode_value(self, description: str) -> Any:
+        """Decodes the value starting at the next token."""
+        if self.next_token() not in "{[\"":
+            # Numbers and literals have no closing character: buffer up to the delimiter that ends them
+            while _JSON_SCALAR_END.search(self.buffer, self.position) is None and self.read_more():
+                pass
+        while True:
+            try:
+                value, self.position = self.decoder.raw_decode(self.buffer, self.position)
+                return value
+            except json.JSONDecodeError as e:
+                if not self.read_more():
+                    raise ValueError(f"Malformed JSON {description} in {self.file_path}: {e}") from e
+
+
+def iter_json_array_items(file_path: str, chunk_size: int = CONTENT_STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """Yields the elements of a top-level JSON array file one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it is complete, so memory
+    use is bounded by the chunk size and the largest single element, not by the file size.
+
+    Args:
+        file_path (str): Path to a file holding a JSON array.
+        chunk_size (int, optional): Characters read at a time. Defaults to CONTENT_STREAM_CHUNK_SIZE.
+
+    Yields:
+        Any: The decoded array elements, in order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file is not a well-formed JSON array.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        reader = _JSONChunkReader(f, file_path, chunk_size)
+        if reader.next_token() != "[":
+            raise ValueError(f"{file_path} does not contain a JSON array.")
+        reader.position += 1
+        if reader.next_token() == "]":
+            reader.expect_end("JSON array")
+            return
+        while True:
+            yield reader.decode_value("array element")
+            token = reader.next_token()
+            if token == "]":
+                reader.expect_end("JSON array")
+                return
+            if token != ",":
+                raise ValueError(f"Expected ',' or ']' after an array element in {file_path}, found {token!r}.")
+            reader.position += 1
+
+
+def iter_json_object_keys(file_path: str, chunk_size: int = CONTENT_STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Yields the keys of a top-level JSON object file one at a time, without keeping its values.
+
+    The value of a key is only decoded (and discarded) when the caller asks for the next key, so
+    a caller looking for one key stops reading the file as soon as it is found.
+
+    Args:
+        file_path (str): Path to a file holding a JSON object.
+        chunk_size (int, optional): Characters read at a time. Defaults to CONTENT_STREAM_CHUNK_SIZE.
+
+    Yields:
+        str: The object's keys, in file order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file is not a well-formed JSON object.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        reader = _JSONChunkReader(f, file_path, chunk_size)
+        if reader.next_token() != "{":
+            raise ValueError(f"{file_path} does not contain a JSON object.")
+        reader.position += 1
+        if reader.next_token() == "}":
+            reader.expect_end("JSON object")
+            return
+        while True:
+            if reader.next_token() != "\"":
+                raise ValueError(f"Expected an object key in {file_path}, found {reader.next_token()!r}.")
+            key = reader.decode_value("object key")
+            if reader.next_token() != ":":
+                raise ValueError(f"Expected ':' after the object key {key!r} in {file_path}.")
+            reader.position += 1
+            yield key
+            reader.decode_value("object value")
+            token = reader.next_token()
+            if token == "}":
+                reader.expect_end("JSON object")
+                return
+            if token != ",":
+                raise ValueError(f"Expected ',' or '}}' after an object value in {file_path}, found {token!r}.")
+            reader.position += 1
+
+
+def iter_json_lines(file_path: str) -> Iterator[Any]:
+    """Yields the JSON value on each non-blank line of a JSON Lines file.
+
+    Args:
+        file_path (str): Path to the JSON Lines file.
+
+    Yields:
+        Any: The decoded values, in order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If a line is not valid JSON.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Malformed JSON on line {line_number} of {file_path}: {e}") from e
+
+
+def iter_content_items(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Streams the content items of a content set file.
+
+    `.jsonl` files hold one item per line; any other file must hold a JSON array of items.
+    Elements that are not objects are skipped with a warning. Items are decoded one at a time,
+    so their field names are re-keyed through a shared memo (as `json.load` does within one
+    document) instead of every item holding its own copies.
+
+    Args:
+        file_path (str): Path to the content set file.
+
+    Yields:
+        Dict[str, Any]: The raw content items, in file order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file is malformed.
+    """
+    elements = iter_json_lines(file_path) if file_path.endswith(".jsonl") else iter_json_array_items(file_path)
+    field_names: Dict[str, str] = {}
+    count = 0
+    for element in elements:
+        if not isinstance(element, dict):
+            logger.warning("Skipping non-object content entry in %s: %.80r", file_path, element)
+            continue
+        count += 1
+        yield {field_names.setdefault(key, key): value for key, value in element.items()}
+    logger.info("Streamed %s content items from %s", count, file_path)
+
+
+def iter_content_files(
+    content_files: Iterable[str],
+    content_positions: Optional[Dict[str, Dict[str, int]]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Streams the content items of several content set files as one de-duplicated set.
+
+    Like `merge_content_sets`, an ID seen in an earlier file (or earlier in the same file) wins;
+    only the IDs are remembered, never the items.
+
+    Args:
+        content_files (Iterable[str]): Content set files, in priority order.
+        content_positions (Optional[Dict[str, Dict[str, int]]], optional): If given, filled with
+            the position of each ID's first occurrence in each file, keyed by file path (used by
+            `ContentStoreRegistry` to patch stores incrementally). Defaults to None.
+
+    Yields:
+        Dict[str, Any]: The raw content items.
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist.
+        ValueError: If a file is malformed.
+    """
+    seen_content_ids = set()
+    for file_path in content_files:
+        positions = content_positions.setdefault(file_path, {}) if content_positions is not None else None
+        for position, item in enumerate(iter_content_items(file_path)):
+            content_id = _first_present_field(item, "id")
+            if positions is not None and content_id is not None:
+                positions.setdefault(content_id, position)
+            if content_id not in seen_content_ids:
+                seen_content_ids.add(content_id)
+                yield item
+
+
+def write_content_jsonl(content_items: Iterable[Dict[str, Any]], file_path: str) -> int:
+    """Writes content items to a JSON Lines file, one item per line.
+
+    Args:
+        content_items (Iterable[Dict[str, Any]]): The items to write.
+        file_path (str): Destination path.
+
+    Returns:
+        int: The number of items written.
+    """
+    count = 0
+    with open(file_path, "w", encoding="utf-8") as f:
+        for item in content_items:
+            f.write(json.dumps(item, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    logger.info("Wrote %s content items to %s", count, file_path)
+    return count
+
+
+def _peek_json_start(file_path: str) -> str:
+    """Returns the first non-whitespace character of a file ('' if there is none)."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return ""
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[0]
+
+
+def list_data_files(data_dir: str = DATA_DIR) -> List[str]:
+    """Returns the paths of the JSON and JSON Lines files in a data directory, sorted by name."""
+    return [
+        os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir))
+        if name.endswith(CONTENT_FILE_EXTENSIONS)
+    ]
+
+
+def discover_data_files(data_dir: str = DATA_DIR) -> Tuple[List[str], List[str]]:
+    """Finds the curriculum slices and content sets among the JSON and JSON Lines files of a data directory.
+
+    A `.jsonl` file is a content set. A `.json` file holding a list is a content set (recognised
+    from its first character, without parsing it); one holding an object with
+    `learning_objectives` is a curriculum slice (recognised from its top-level keys, reading the
+    file only up to that key). Other files are ignored.
+
+    Args:
+        data_dir (str, optional): The directory to scan. Defaults to DATA_DIR.
+
+    Returns:
+        Tuple[List[str], List[str]]: The curriculum file paths and the content file paths, sorted.
+    """
+    curriculum_files: List[str] = []
+    content_files: List[str] = []
+    for file_path in list_data_files(data_dir):
+        if file_path.endswith(".jsonl"):
+            content_files.append(file_path)
+            continue
+        try:
+            first_character = _peek_json_start(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error("Could not read data file %s: %s", file_path, e)
+            continue
+        if first_character == "[":
+            content_files.append(file_path)
+        elif first_character == "{":
+            # Only the top-level keys are needed: stop at `learning_objectives` instead of parsing the file twice
+            try:
+                if any(key == "learning_objectives" for key in iter_json_object_keys(file_path)):
+                    curriculum_files.append(file_path)
+            except (OSError, ValueError) as e:
+                logger.error("Could not read data file %s: %s", file_path, e)
+    return curriculum_files, content_files
+
+
+def content_fingerprint(file_paths: Iterable[str], use_content_hashes: bool = False) -> str:
+    """Computes a fingerprint that changes whenever one of the files changes.
+
+    Args:
+        file_paths (Iterable[str]): The files to fingerprint, in order.
+        use_content_hashes (bool, optional): Hash file contents instead of using modification
+                                             time and size. Slower, but immune to mtime quirks
+                                             (e.g. files restored with their old timestamps).
+                                             Defaults to False.
+
+    Returns:
+        str: A hex digest identifying the current state of the files.
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist.
+    """
+    digest = hashlib.sha1()
+    for file_path in file_paths:
+        digest.update(file_path.encode("utf-8"))
+        if use_content_hashes:
+            with open(file_path, "rb") as f:
+                digest.update(hashlib.sha1(f.read()).digest())
+        else:
+            stat = os.stat(file_path)
+            digest.update(f":{stat.st_mtime_ns}:{stat.st_size};".encode("ascii"))
+    return digest.hexdigest()
+
+
+class _StoreSources:
+    """What a registry store was built from, kept so that changed files can be diffed against it.
+
+    Attributes:
+        curriculum_fields (Dict[str, Any]): Top-level fields of the merged curriculum.
+        file_fingerprints (Dict[str, str]): Fingerprint of each source file when it was last loaded.
+        curriculum_los (Dict[str, List[Dict[str, Any]]]): The LOs of each curriculum file.
+        content_positions (Dict[str, Dict[str, int]]): For each content file, the position of the
+                                                       first occurrence of each content ID in it.
+        failed_fingerprint (Optional[str]): Fingerprint of the sources the last failed reload saw,
+                                            so a broken file is not re-read on every lookup.
+    """
+    __slots__ = ("curriculum_fields", "file_fingerprints", "curriculum_los", "content_positions", "failed_fingerprint")
+
+    def __init__(self, curriculum_fields: Dict[str, Any]):
+        self.curriculum_fields = curriculum_fields
+        self.file_fingerprints: Dict[str, str] = {}
+        self.curriculum_los: Dict[str, List[Dict[str, Any]]] = {}
+        self.content_positions: Dict[str, Dict[str, int]] = {}
+        self.failed_fingerprint: Optional[str] = None
+
+
+class ContentStoreRegistry:
+    """Shares merged, indexed `CurriculumContentStore`s between requests.
+
+    A store is identified by the ordered lists of curriculum and content files it is merged
+    from, and is cached together with the fingerprint of those files. Each lookup re-checks the
+    fingerprint (a `stat` per file by default). When a source file has changed, only that file is
+    reloaded and diffed against the store, and a patched copy of the store (see
+    `CurriculumContentStore.with_changes`) replaces it; callers still holding the previous store
+    keep a consistent, unchanged view. The fingerprint is recorded on the store as `content_version`.
+    Content files are streamed into the store (see `iter_content_files`) rather than loaded
+    whole, so they may be JSON arrays or JSON Lines and may be split across any number of files.
+
+    Stores are reloaded on the next lookup after a change, by an explicit `refresh()`, or in the
+    background by a `ContentStoreWatcher`. Stores handed out are shared and must be treated as read-only.
+
+    Attributes:
+        use_content_hashes (bool): Fingerprint files by content hash instead of mtime and size.
+    """
+
+    def __init__(self, use_content_hashes: bool = False):
+        """Initializes an empty registry.
+
+        Args:
+            use_content_hashes (bool, optional): See `content_fingerprint`. Defaults to False.
+        """
+        self.use_content_hashes = use_content_hashes
+        self._stores: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], CurriculumContentStore] = {}
+        self._sources: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], _StoreSources] = {}
+        self._discovered: Dict[str, Tuple[str, Tuple[List[str], List[str]]]] = {}
+        self._lock = threading.Lock()
+
+    def get_store(
+        self,
+        curriculum_files: Sequence[str],
+        content_files: Sequence[str],
+        **curriculum_fields: Any
+    ) -> CurriculumContentStore:
+        """Returns the store merged from the given files, reloading whatever changed since the last call.
+
+        If a changed file cannot be loaded (e.g. it is mid-edit and not valid JSON), the error is
+        logged and the previous store keeps being served until the file is fixed.
+
+        Args:
+            curriculum_files (Sequence[str]): Curriculum slice files, in priority order.
+            content_files (Sequence[str]): Content set files, in priority order.
+            **curriculum_fields (Any): Top-level fields of the merged curriculum (see
+                                       `merge_curriculum_slices`); only used when (re)building.
+
+        Returns:
+            CurriculumContentStore: The shared store.
+
+        Raises:
+            FileNotFoundError: If a source file doesn't exist.
+            ValueError: If a source file cannot be loaded when the store is first built.
+        """
+        key = (tuple(curriculum_files), tuple(content_files))
+        fingerprint = content_fingerprint(key[0] + key[1], self.use_content_hashes)
+        store = self._stores.get(key)
+        if store is not None and store.content_version == fingerprint:
+            return store
+        with self._lock:
+            store = self._stores.get(key)
+            if store is not None and store.content_version == fingerprint:
+                return store
+            if store is None:
+                return self._build(key, fingerprint, curriculum_fields)
+            return self._reload(key, fingerprint, curriculum_fields)
+
+    def get_data_dir_store(self, data_dir: str = DATA_DIR, **curriculum_fields: Any) -> CurriculumContentStore:
+        """Returns the store merged from every curriculum slice and content set in a data directory.
+
+        Files are only re-classified (see `discover_data_files`) when the directory's data files change.
+
+        Args:
+            data_dir (str, optional): The directory to scan. Defaults to DATA_DIR.
+            **curriculum_fields (Any): Top-level fields of the merged curriculum.
+
+        Returns:
+            CurriculumContentStore: The shared store.
+        """
+        directory_fingerprint = content_fingerprint(list_data_files(data_dir), self.use_content_hashes)
+        discovered = self._discovered.get(data_dir)
+        if discovered is None or discovered[0] != directory_fingerprint:
+            discovered = (directory_fingerprint, discover_data_files(data_dir))
+            self._discovered[data_dir] = discovered
+        curriculum_files, content_files = discovered[1]
+        return self.get_store(curriculum_files, content_files, **curriculum_fields)
+
+    def refresh(self) -> int:
+        """Reloads every cached store whose source files changed.
+
+        Returns:
+            int: The number of stores that were reloaded.
+        """
+        reloaded = 0
+        for key in list(self._stores):
+            try:
+                fingerprint = content_fingerprint(key[0] + key[1], self.use_content_hashes)
+            except FileNotFoundError as e:
+                logger.error("Cannot refresh content store: %s", e)
+                continue
+            with self._lock:
+                store = self._stores.get(key)
+                if store is None or store.content_version == fingerprint:
+                    continue
+                if self._reload(key, fingerprint, self._sources[key].curriculum_fields) is not store:
+                    reloaded += 1
+        return reloaded
+
+    def clear(self) -> None:
+        """Drops every cached store."""
+        with self._lock:
+            self._stores.clear()
+            self._sources.clear()
+            self._discovered.clear()
+
+    def _build(
+        self,
+        key: Tuple[Tuple[str, ...], Tuple[str, ...]],
+        fingerprint: str,
+        curriculum_fields: Dict[str, Any]
+    ) -> CurriculumContentStore:
+        """Loads and indexes a store from scratch. Must be called with the lock held."""
+        sources = _StoreSources(curriculum_fields)
+        for file_path in key[0] + key[1]:
+            sources.file_fingerprints[file_path] = content_fingerprint([file_path], self.use_content_hashes)
+        for file_path in key[0]:
+            sources.curriculum_los[file_path] = self._load(file_path, "curriculum slice").get("learning_objectives", [])
+        store = CurriculumContentStore(
+            self._merge_curriculum(key, sources),
+            iter_content_files(key[1], sources.content_positions)
+        )
+        store.content_version = fingerprint
+        self._stores[key] = store
+        self._sources[key] = sources
+        logger.info("Built merged content store %s from %s curriculum and %s content file(s).", fingerprint[:12], len(key[0]), len(key[1]))
+        return store
+
+    def _reload(
+        self,
+        key: Tuple[Tuple[str, ...], Tuple[str, ...]],
+        fingerprint: str,
+        curriculum_fields: Dict[str, Any]
+    ) -> CurriculumContentStore:
+        """Patches a cached store with the files that changed since it was built. Must be called with the lock held."""
+        store = self._stores[key]
+        sources = self._sources[key]
+        if curriculum_fields != sources.curriculum_fields:
+            return self._build(key, fingerprint, curriculum_fields)
+        if sources.failed_fingerprint == fingerprint:
+            return store
+        try:
+            file_fingerprints = {
+                file_path: content_fingerprint([file_path], self.use_content_hashes) for file_path in key[0] + key[1]
+            }
+            changed_files = [path for path, value in file_fingerprints.items() if sources.file_fingerprints.get(path) != value]
+
+            # Load only the changed files; nothing is recorded until the patch has succeeded
+            curriculum_los = dict(sources.curriculum_los)
+            content_positions = dict(sources.content_positions)
+            changed_items: Dict[str, Dict[str, Any]] = {}
+            affected_by_file: Dict[str, Set[str]] = {}
+            for file_path in changed_files:
+                if file_path in curriculum_los:
+                    curriculum_los[file_path] = self._load(file_path, "curriculum slice").get("learning_objectives", [])
+                    continue
+                old_positions = content_positions[file_path]
+                positions: Dict[str, int] = {}
+                affected = affected_by_file[file_path] = set()
+                for position, item in enumerate(iter_content_items(file_path)):
+                    content_id = _first_present_field(item, "id")
+                    if content_id is None or content_id in positions:
+                        continue
+                    positions[content_id] = position
+                    # New, moved or edited items are upserted; unchanged ones are left alone
+                    if old_positions.get(content_id) != position or \
+                            normalise_content_item(item).item != store.content_library.get(content_id):
+                        affected.add(content_id)
+                        changed_items[content_id] = item
+                affected.update(content_id for content_id in old_positions if content_id not in positions)
+                content_positions[file_path] = positions
+
+            # An ID defined in more than one file may change which file wins it; rebuild in that case
+            for file_path, affected in affected_by_file.items():
+                other_files = [path for path in key[1] if path != file_path]
+                if any(
+                    content_id in content_positions[path] or content_id in sources.content_positions[path]
+                    for path in other_files for content_id in affected
+                ):
+                    logger.info("Content IDs changed in %s are also defined in other content files; rebuilding the store.", file_path)
+                    return self._build(key, fingerprint, curriculum_fields)
+            affected_content_ids = set().union(*affected_by_file.values())
+
+            def content_order(content_id: str) -> Tuple[int, int]:
+                for file_index, path in enumerate(key[1]):
+                    position = content_positions[path].get(content_id)
+                    if position is not None:
+                        return file_index, position
+                return len(key[1]), 0
+
+            curriculum_changed = any(path in curriculum_los for path in changed_files)
+            new_store = store.with_changes(
+                upserted_content=[changed_items[cid] for cid in affected_content_ids if cid in changed_items],
+                removed_content_ids=[cid for cid in affected_content_ids if cid not in changed_items],
+                curriculum_data=self._merge_curriculum(key, sources, curriculum_los) if curriculum_changed else None,
+                content_order=content_order
+            )
+        except (OSError, ValueError) as e:
+            logger.error("Could not reload content store %s; keeping the previous version: %s", store.content_version[:12], e)
+            sources.failed_fingerprint = fingerprint
+            return store
+
+        new_store.content_version = fingerprint
+        sources.file_fingerprints = file_fingerprints
+        sources.curriculum_los = curriculum_los
+        sources.content_positions = content_positions
+        self._stores[key] = new_store
+        logger.info("Reloaded content store %s from %s changed file(s): %s", fingerprint[:12], len(changed_files), changed_files)
+        return new_store
+
+    @staticmethod
+    def _merge_curriculum(
+        key: Tuple[Tuple[str, ...], Tuple[str, ...]],
+        sources: _StoreSources,
+        curriculum_los: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        curriculum_los = sources.curriculum_los if curriculum_los is None else curriculum_los
+        return merge_curriculum_slices(
+            ({"learning_objectives": curriculum_los[file_path]} for file_path in key[0]), **sources.curriculum_fields
+        )
+
+    @staticmethod
+    def _load(file_path: str, data_description: str) -> Any:
+        data = load_json_data(file_path, data_description)
+        if data is None:
+            raise ValueError(f"Could not load {data_description} from {file_path}")
+        return data
+
+
+content_store_registry = ContentStoreRegistry()
+"""Process-wide registry used by the interface generator."""
+
+
+
+class ContentStoreWatcher:
+    """Polls a `ContentStoreRegistry`'s source files in a background thread and hot-reloads changed stores.
+
+    Polling (a `stat` per source file per interval) needs no platform-specific file system
+    notification support. Usable as a context manager.
+
+    Attributes:
+        registry (ContentStoreRegistry): The registry to refresh.
+        interval_seconds (float): Time between checks.
+    """
+
+    def __init__(self, registry: ContentStoreRegistry = content_store_registry, interval_seconds: float = CONTENT_WATCH_INTERVAL_SECONDS):
+        """Initializes a stopped watcher.
+
+        Args:
+            registry (ContentStoreRegistry, optional): The registry to refresh. Defaults to `content_store_registry`.
+            interval_seconds (float, optional): Time between checks. Defaults to CONTENT_WATCH_INTERVAL_SECONDS.
+        """
+        self.registry = registry
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ContentStoreWatcher":
+        """Starts polling in a daemon thread (no-op if already running)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="ContentStoreWatcher", daemon=True)
+            self._thread.start()
+            logger.info("Watching content store source files every %ss.", self.interval_seconds)
+        return self
+
+    def stop(self) -> None:
+        """Stops polling and waits for the thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.registry.refresh()
+            except Exception as e:
+                logger.error("Content store refresh failed: %s", e)
+
+    def __enter__(self) -> "ContentStoreWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
 # --- Main execution for testing --- 
 if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
     logger.info("--- Initializing DALA Curriculum & Content Module (Standalone Test) ---")
     
     # Load data from JSON files using paths from config
@@ -242,5 +1671,11 @@ if __name__ == "__main__":
     else:
         logger.error("Could not test KS2 English Slice due to missing data.")
 
+    # --- Test the merged store registry over every file in DATA_DIR ---
+    data_dir_store = content_store_registry.get_data_dir_store(subject="All subjects")
+    logger.info(f"Merged DATA_DIR store {data_dir_store.content_version[:12]}: {len(data_dir_store.lo_details_map)} LOs, "
+                f"{len(data_dir_store.content_library)} content items; reused on next lookup: "
+                f"{content_store_registry.get_data_dir_store(subject='All subjects') is data_dir_store}")
+
     logger.info("--- DALA Curriculum & Content Module (Standalone Test) Finished ---")
 
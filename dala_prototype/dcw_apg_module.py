@@ -9,30 +9,247 @@ This module contains the logic for:
 1.  Generating a learning pathway considering LO prerequisites.
 2.  Selecting content for these LOs based on learner profile preferences, difficulty progression,
     and offering a variety of activities.
+3.  Caching generated pathways per learner until their profile or the content changes.
 """
 
+import time
 import random
+import weakref
+import threading
 import logging
-from typing import List, Dict, Tuple, Any, Optional, Set
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Any, Optional, Set, Iterable
 
-from hlp_module import LearnerProfile
-from curriculum_content_module import CurriculumContentStore
+from hlp_module import LearnerProfileBase, make_session_rng
+from curriculum_content_module import (
+    CurriculumContentStore, EligibilityTracker, LOContentIndex, ContentRecord, normalise_content_item
+)
+from instrumentation_module import increment, instrumented
 from config import (
-    setup_logging,
-    DIFFICULTY_ORDER,
     CONTENT_TYPE_PRIORITY_FOR_VARIETY,
     ALL_POSSIBLE_CONTENT_TYPES,
     VISUAL_PREFERENCE_CONTENT_TYPES,
     TEXTUAL_PREFERENCE_CONTENT_TYPES,
     DEFAULT_TARGET_LO_COUNT,
-    DEFAULT_MAX_ACTIVITIES_PER_LO
+    DEFAULT_MAX_ACTIVITIES_PER_LO,
+    LOOKAHEAD_MAX_PLANNED_LOS,
+    PATHWAY_CACHE_SIZE,
+    PATHWAY_CACHE_TTL_SECONDS,
+    PATHWAY_PRECOMPUTATION_MAX_ENTRIES
 )
 
-setup_logging() # Initialize logging configuration
-
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+class PathwayPrecomputation:
+    """Learner-independent data derived once from a content store and shared across many learners.
+
+    Learners in a cohort mostly share their progress and preferences, and everything but the random
+    choice of LOs follows from those. This caches, per distinct value, what a `PathwayGenerator`
+    would otherwise derive for each learner:
+
+    - the ordered preferred content types of each preference combination;
+    - the eligible LOs of each set of completed LOs, which spares building an `EligibilityTracker`
+      (a pass over the whole prerequisite graph) per learner;
+    - the activities selected for an LO for each preference combination and activity limit, for
+      learners with no recent content history to hold back.
+
+    Each table is cleared once it holds `max_entries` entries, so a precomputation kept between
+    runs does not grow without bound. Safe to share between threads: a race only repeats a derivation.
+
+    Attributes:
+        content_store (CurriculumContentStore): The store the data was derived from.
+        max_entries (int): Entries each table holds before it is cleared.
+        preferred_types_by_key (Dict[Tuple[Any, ...], List[str]]): Ordered preferred content types,
+                                                                    keyed by the preference values they derive from.
+        eligible_los_by_completed (Dict[frozenset, Tuple[Dict[str, Any], ...]]): Eligible LO dictionaries in
+                                                                                curriculum order, keyed by the
+                                                                                completed LO IDs.
+        selections_by_key (Dict[Tuple[Any, ...], List[Dict[str, Any]]]): Selected activities, keyed by LO ID,
+                                                                          preference values and activity limit.
+    """
+
+    def __init__(self, content_store: CurriculumContentStore, max_entries: int = PATHWAY_PRECOMPUTATION_MAX_ENTRIES):
+        """Binds the shared data to a content store.
+
+        Args:
+            content_store (CurriculumContentStore): Repository of curriculum and content data.
+            max_entries (int, optional): Entries each table holds before it is cleared.
+                                         Defaults to PATHWAY_PRECOMPUTATION_MAX_ENTRIES.
+        """
+        self.content_store = content_store
+        self.max_entries = max_entries
+        self.preferred_types_by_key: Dict[Tuple[Any, ...], List[str]] = {}
+        self.eligible_los_by_completed: Dict[frozenset, Tuple[Dict[str, Any], ...]] = {}
+        self.selections_by_key: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+
+    def remember(self, table: Dict[Any, Any], key: Any, value: Any) -> None:
+        """Stores a derived value in one of the tables, clearing the table first if it is full."""
+        if len(table) >= self.max_entries:
+            table.clear()
+        table[key] = value
+
+
+# Profile fields (as reported by LearnerProfileBase._notify_change) that a pathway depends on
+PATHWAY_PROFILE_FIELDS = frozenset({"completed_los", "learning_preferences"})
+
+
+def profile_pathway_fingerprint(profile: LearnerProfileBase) -> Tuple[frozenset, frozenset]:
+    """Returns a hashable snapshot of the profile state a pathway depends on.
+
+    Args:
+        profile (LearnerProfileBase): The learner profile (regular or compact).
+
+    Returns:
+        Tuple[frozenset, frozenset]: The completed LO IDs and the learning preference items.
+    """
+    return frozenset(profile.completed_los), frozenset(profile.learning_preferences.items())
+
+
+class PathwayCache:
+    """An LRU cache of generated initial pathways with a time-to-live.
+
+    Entries are keyed by learner ID, pathway options, the session seeding the generation (see
+    `make_session_rng`), a fingerprint of the profile fields the pathway depends on
+    (`profile_pathway_fingerprint`) and the content store's `content_version` (or the store's
+    identity for unversioned stores), so a change to any of them is a miss
+    even if the profile was mutated directly. The cache also subscribes to the change
+    notifications of every profile it caches for and drops that learner's entries as soon as
+    `mark_lo_completed` or `update_preference` changes them.
+
+    Cached pathways are shared between callers and must be treated as read-only. Thread-safe.
+
+    Attributes:
+        max_entries (int): Maximum number of cached pathways.
+        ttl_seconds (float): Seconds an entry stays valid.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that required generating a pathway.
+    """
+
+    def __init__(self, max_entries: int = PATHWAY_CACHE_SIZE, ttl_seconds: float = PATHWAY_CACHE_TTL_SECONDS):
+        """Initializes an empty cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached pathways. Defaults to PATHWAY_CACHE_SIZE.
+            ttl_seconds (float, optional): Seconds an entry stays valid. Defaults to PATHWAY_CACHE_TTL_SECONDS.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time, weak reference to the content store, pathway)
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any, List[Dict[str, Any]]]]" = OrderedDict()
+        self._keys_by_learner: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        profile: LearnerProfileBase,
+        content_store: CurriculumContentStore,
+        target_lo_count: int,
+        max_activities_per_lo: int,
+        lookahead: bool = False,
+        session: Optional[str] = None
+    ) -> Tuple[Any, ...]:
+        """Builds the cache key of a pathway request; `session` is None for unseeded generation."""
+        content_version = content_store.content_version
+        return (
+            profile.learner_id,
+            content_version if content_version is not None else id(content_store),
+            target_lo_count,
+            max_activities_per_lo,
+            lookahead,
+            session,
+            profile_pathway_fingerprint(profile)
+        )
+
+    def get(self, key: Tuple[Any, ...], content_store: CurriculumContentStore) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached pathway for a key, or None if it is missing or expired.
+
+        Args:
+            key (Tuple[Any, ...]): The key from `make_key`.
+            content_store (CurriculumContentStore): The store the pathway must have been generated from.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: The cached pathway, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, store_ref, pathway = entry
+                if expires_at > time.monotonic() and store_ref() is content_store:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return pathway
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        key: Tuple[Any, ...],
+        profile: LearnerProfileBase,
+        content_store: CurriculumContentStore,
+        pathway: List[Dict[str, Any]]
+    ) -> None:
+        """Caches a pathway, evicting the least recently used entries beyond `max_entries`.
+
+        Args:
+            key (Tuple[Any, ...]): The key from `make_key`.
+            profile (LearnerProfileBase): The profile the pathway was generated for.
+            content_store (CurriculumContentStore): The store it was generated from.
+            pathway (List[Dict[str, Any]]): The pathway.
+        """
+        profile.add_change_listener(self._on_profile_changed)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, weakref.ref(content_store), pathway)
+            self._entries.move_to_end(key)
+            self._keys_by_learner.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_learner(self, learner_id: str) -> int:
+        """Drops every cached pathway of a learner.
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        with self._lock:
+            keys = self._keys_by_learner.pop(learner_id, ())
+            for key in keys:
+                self._entries.pop(key, None)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drops every cached pathway."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_learner.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _on_profile_changed(self, profile: LearnerProfileBase, field_name: str) -> None:
+        if field_name in PATHWAY_PROFILE_FIELDS:
+            self.invalidate_learner(profile.learner_id)
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        """Removes one entry. Must be called with the lock held."""
+        del self._entries[key]
+        learner_keys = self._keys_by_learner.get(key[0])
+        if learner_keys is not None:
+            learner_keys.discard(key)
+            if not learner_keys:
+                del self._keys_by_learner[key[0]]
+
+
+default_pathway_cache = PathwayCache()
+"""Process-wide pathway cache used by the interface generator and the pathway service."""
+
+
 class PathwayGenerator:
     """Generates a learning pathway for a student, considering prerequisites, difficulty, and activity variety.
     
@@ -41,49 +258,88 @@ class PathwayGenerator:
     appropriate difficulty progression and activity variety.
     
     Attributes:
-        learner_profile (LearnerProfile): The student's profile containing preferences and completed LOs.
+        learner_profile (LearnerProfileBase): The student's profile (regular or compact) containing preferences and completed LOs.
         content_store (CurriculumContentStore): Repository of curriculum and content data.
     """
     
-    def __init__(self, learner_profile: LearnerProfile, content_store: CurriculumContentStore):
+    def __init__(
+        self,
+        learner_profile: LearnerProfileBase,
+        content_store: CurriculumContentStore,
+        precomputation: Optional["PathwayPrecomputation"] = None,
+        pathway_cache: Optional[PathwayCache] = None,
+        rng: Optional[random.Random] = None,
+        session: Optional[str] = None
+    ):
         """Initialize the PathwayGenerator with a learner profile and content store.
         
         Args:
-            learner_profile (LearnerProfile): The student's profile with preferences and progress.
+            learner_profile (LearnerProfileBase): The student's profile (regular or compact) with preferences and progress.
             content_store (CurriculumContentStore): Repository of curriculum and content data.
+            precomputation (Optional[PathwayPrecomputation], optional): Store-level data shared across
+                                                                       learners (see `generate_pathways_for_cohort`).
+                                                                       Defaults to None, in which case
+                                                                       everything is derived per call.
+            pathway_cache (Optional[PathwayCache], optional): Cache consulted by `generate_initial_pathway`
+                                                              (e.g. `default_pathway_cache`). Defaults to None,
+                                                              in which case every call generates a new pathway.
+            rng (Optional[random.Random], optional): Random generator used to pick among eligible LOs, e.g.
+                                                     `make_session_rng(learner_id, session)` for reproducible
+                                                     pathways. Defaults to None, which uses the global
+                                                     `random` module. A generator passed without a
+                                                     `session` bypasses `pathway_cache`, since its
+                                                     pathways cannot be told apart from unseeded ones.
+            session (Optional[str], optional): Seeds LO selection with `make_session_rng(learner_id, session)`
+                                               (unless `rng` is given) and keeps the pathways of each
+                                               session apart in `pathway_cache`. Defaults to None.
         """
         self.learner_profile = learner_profile
         self.content_store = content_store
-        logger.info(f"PathwayGenerator initialized for student: {learner_profile.learner_id}")
+        self.precomputation = precomputation
+        self.pathway_cache = pathway_cache if session is not None or rng is None else None
+        self.session = session
+        if rng is None and session is not None:
+            rng = make_session_rng(learner_profile.learner_id, session)
+        self.rng = rng if rng is not None else random
+        logger.info("PathwayGenerator initialized for student: %s", learner_profile.learner_id)
+
+    def _get_eligibility_tracker(self) -> EligibilityTracker:
+        """Returns the learner's eligibility tracker for this store's prerequisite graph.
+
+        The tracker is kept on the learner profile so that later `mark_lo_completed` calls update it
+        incrementally. It is rebuilt if it belongs to another graph or if `completed_los` was changed
+        without going through `mark_lo_completed` (detected by comparing the completed sets, which
+        costs far less than the O(V + E) rebuild).
 
-    def _is_lo_eligible(self, lo_id: str) -> bool:
-        """Checks if a Learning Objective is eligible based on completed prerequisites.
-        
-        Args:
-            lo_id (str): The ID of the learning objective to check.
-            
         Returns:
-            bool: True if the LO is eligible (all prerequisites completed), False otherwise.
+            EligibilityTracker: A tracker in step with the learner's completed LOs.
         """
-        lo_details = self.content_store.get_lo_by_id(lo_id)
-        
-        if not lo_details:
-            logger.warning(f"LO details not found for ID: {lo_id}. Assuming not eligible.")
-            return False
-            
-        prerequisites = lo_details.get("prerequisites", [])
-        if not prerequisites:
-            return True
-        
-        for prereq_id in prerequisites:
-            if not self.learner_profile.has_completed_lo(prereq_id):
-                logger.debug(f"LO {lo_id} not eligible: Prerequisite {prereq_id} not completed by {self.learner_profile.learner_id}.")
-                return False
-        logger.debug(f"LO {lo_id} is eligible for {self.learner_profile.learner_id}.")
-        return True
+        graph = self.content_store.prerequisite_graph
+        tracker = self.learner_profile.eligibility_tracker
+        if (tracker is None or tracker.graph is not graph
+                or tracker.completed_los != self.learner_profile.completed_los):
+            tracker = graph.create_tracker(self.learner_profile.completed_los)
+            self.learner_profile.eligibility_tracker = tracker
+        return tracker
 
     def _get_preferred_content_types(self) -> List[str]:
         """Determines the ordered list of preferred content types based on learner profile."""
+        if self.precomputation is not None:
+            cache_key = self._preference_key()
+            cached = self.precomputation.preferred_types_by_key.get(cache_key)
+            if cached is None:
+                cached = self._derive_preferred_content_types()
+                self.precomputation.remember(self.precomputation.preferred_types_by_key, cache_key, cached)
+            return list(cached)
+        return self._derive_preferred_content_types()
+
+    def _preference_key(self) -> Tuple[Any, ...]:
+        """Returns the preference values the preferred content types (and so content selection) derive from."""
+        preferences = self.learner_profile.learning_preferences
+        return preferences.get("visual_task_1"), preferences.get("textual_task_1")
+
+    def _derive_preferred_content_types(self) -> List[str]:
+        """Derives the ordered preferred content types from the learner's preference values."""
         preferred_types_ordered_list: List[str] = []
         if self.learner_profile.learning_preferences.get("visual_task_1") == "visual":
             preferred_types_ordered_list.extend(VISUAL_PREFERENCE_CONTENT_TYPES)
@@ -96,127 +352,195 @@ class PathwayGenerator:
                 preferred_types_ordered_list.append(pt_config)
         return preferred_types_ordered_list
 
+    @instrumented("pathway.select.preference")
     def _apply_preference_driven_selection(
         self,
         lo_id: str,
-        sorted_content_all: List[Dict[str, Any]],
+        content_index: LOContentIndex,
         preferred_types_ordered_list: List[str],
-        selected_activities: List[Dict[str, Any]],
+        selected_records: List[ContentRecord],
         used_content_ids: Set[str],
         max_activities_per_lo: int
     ) -> None:
         """Applies preference-driven selection to choose content items."""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for pref_type in preferred_types_ordered_list:
-            if len(selected_activities) >= max_activities_per_lo:
+            if len(selected_records) >= max_activities_per_lo:
                 break
-            for item in sorted_content_all:
-                item_id_key = "id" if "id" in item else "content_id"
-                if item.get("type") == pref_type and item.get(item_id_key) not in used_content_ids:
-                    selected_activities.append(item)
-                    used_content_ids.add(item[item_id_key])
-                    logger.debug(f"Selected activity {item[item_id_key]} (type: {pref_type}) for LO {lo_id} based on preference.")
-                    break 
-            if selected_activities and selected_activities[-1].get("type") == pref_type: 
-                continue
+            record = content_index.first_unused_of_type(pref_type, used_content_ids)
+            if record is not None:
+                selected_records.append(record)
+                used_content_ids.add(record.content_id)
+                if debug_enabled:
+                    logger.debug("Selected activity %s (type: %s) for LO %s based on preference.", record.content_id, pref_type, lo_id)
 
+    @instrumented("pathway.select.variety")
     def _apply_variety_driven_selection(
         self,
         lo_id: str,
-        sorted_content_all: List[Dict[str, Any]],
-        selected_activities: List[Dict[str, Any]],
+        content_index: LOContentIndex,
+        selected_records: List[ContentRecord],
         used_content_ids: Set[str],
         max_activities_per_lo: int
     ) -> None:
         """Applies variety-driven selection to fill remaining content slots."""
-        current_selected_types = {act.get("type") for act in selected_activities}
-        if len(selected_activities) < max_activities_per_lo:
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        current_selected_types = {record.content_type for record in selected_records}
+        if len(selected_records) < max_activities_per_lo:
             for activity_type in CONTENT_TYPE_PRIORITY_FOR_VARIETY:
-                if len(selected_activities) >= max_activities_per_lo:
+                if len(selected_records) >= max_activities_per_lo:
                     break
                 if activity_type not in current_selected_types: 
-                    for item in sorted_content_all:
-                        item_id_key = "id" if "id" in item else "content_id"
-                        if item.get("type") == activity_type and item.get(item_id_key) not in used_content_ids:
-                            selected_activities.append(item)
-                            used_content_ids.add(item[item_id_key])
-                            current_selected_types.add(activity_type)
-                            logger.debug(f"Selected activity {item[item_id_key]} (type: {activity_type}) for LO {lo_id} for variety.")
-                            break 
+                    record = content_index.first_unused_of_type(activity_type, used_content_ids)
+                    if record is not None:
+                        selected_records.append(record)
+                        used_content_ids.add(record.content_id)
+                        current_selected_types.add(activity_type)
+                        if debug_enabled:
+                            logger.debug("Selected activity %s (type: %s) for LO %s for variety.", record.content_id, activity_type, lo_id)
 
+    @instrumented("pathway.select.fallback")
     def _apply_fallback_selection(
         self,
         lo_id: str,
-        sorted_content_all: List[Dict[str, Any]],
-        selected_activities: List[Dict[str, Any]],
+        content_index: LOContentIndex,
+        selected_records: List[ContentRecord],
         used_content_ids: Set[str],
         max_activities_per_lo: int
     ) -> None:
         """Applies fallback selection if not enough activities are chosen."""
-        if len(selected_activities) < max_activities_per_lo:
-            for item in sorted_content_all:
-                if len(selected_activities) >= max_activities_per_lo:
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if len(selected_records) < max_activities_per_lo:
+            for record in content_index.records:
+                if len(selected_records) >= max_activities_per_lo:
                     break
-                item_id_key = "id" if "id" in item else "content_id"
-                if item.get(item_id_key) not in used_content_ids:
-                    selected_activities.append(item)
-                    used_content_ids.add(item[item_id_key])
-                    logger.debug(f"Selected activity {item[item_id_key]} (type: {item.get('type')}) for LO {lo_id} as fallback.")
-
-        if not selected_activities and sorted_content_all: # Absolute fallback: pick the first (easiest) if nothing else selected
-            selected_activities.append(sorted_content_all[0])
-            item_id_key = "id" if "id" in sorted_content_all[0] else "content_id"
-            used_content_ids.add(sorted_content_all[0][item_id_key]) # Ensure it's marked as used
-            logger.debug(f"Selected easiest activity {sorted_content_all[0][item_id_key]} for LO {lo_id} as absolute fallback.")
+                if record.content_id not in used_content_ids:
+                    selected_records.append(record)
+                    used_content_ids.add(record.content_id)
+                    if debug_enabled:
+                        logger.debug("Selected activity %s (type: %s) for LO %s as fallback.", record.content_id, record.content_type, lo_id)
+
+        # Absolute fallback: pick the first (easiest) if nothing else selected, unless it was held
+        # back as recently served (see _select_content_from_index)
+        if not selected_records and content_index.records and content_index.records[0].content_id not in used_content_ids:
+            record = content_index.records[0]
+            selected_records.append(record)
+            used_content_ids.add(record.content_id) # Ensure it's marked as used
+            logger.debug("Selected easiest activity %s for LO %s as absolute fallback.", record.content_id, lo_id)
 
     def _select_varied_content_for_lo(self, lo_id: str, available_content_for_lo: List[Dict[str, Any]], max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO) -> List[Dict[str, Any]]:
-        """Selects a variety of appropriate content items for an LO.
+        """Selects a variety of appropriate content items for an arbitrary list of content.
+        
+        The list is normalised, sorted and bucketed on every call; pathway generation uses the
+        store's prebuilt index through `_select_content_from_index` instead.
+        
+        Args:
+            lo_id (str): The ID of the learning objective.
+            available_content_for_lo (List[Dict[str, Any]]): List of content items available for this LO.
+            max_activities_per_lo (int, optional): Maximum number of activities to select. 
+                                                 Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            
+        Returns:
+            List[Dict[str, Any]]: Selected content items for the learning objective.
+        """
+        if not available_content_for_lo:
+            logger.info("No available content for LO %s to select from.", lo_id)
+            return []
+        records = [normalise_content_item(item) for item in available_content_for_lo]
+        return self._select_content_from_index(lo_id, LOContentIndex(records), max_activities_per_lo)
+
+    @instrumented("pathway.select_content")
+    def _select_content_from_index(self, lo_id: str, content_index: LOContentIndex, max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO) -> List[Dict[str, Any]]:
+        """Selects a variety of appropriate content items for an LO from its content index.
         
         This method implements a sophisticated selection algorithm that:
         1. First prioritizes content matching the learner's preferences
         2. Then ensures variety by selecting different content types
         3. Falls back to easiest content if needed
         
+        Content in the learner's recent history (`recent_content`) is held back from all three
+        passes and only fills the slots still open afterwards, least recently served first, so a
+        learner is not served the same items again while the LO has other content.
+        
+        Each pass looks up the relevant type bucket of the pre-sorted index, so the cost of a
+        selection does not grow with the amount of content available for the LO.
+        
         Args:
             lo_id (str): The ID of the learning objective.
-            available_content_for_lo (List[Dict[str, Any]]): List of content items available for this LO.
+            content_index (LOContentIndex): The LO's difficulty-sorted, type-bucketed content.
             max_activities_per_lo (int, optional): Maximum number of activities to select. 
                                                  Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
             
         Returns:
             List[Dict[str, Any]]: Selected content items for the learning objective.
         """
-        if not available_content_for_lo:
-            logger.info(f"No available content for LO {lo_id} to select from.")
+        if not content_index.records:
+            logger.info("No available content for LO %s to select from.", lo_id)
             return []
 
-        sorted_content_all = sorted(
-            available_content_for_lo,
-            key=lambda c: DIFFICULTY_ORDER.get(c.get("difficulty", "default").lower(), DIFFICULTY_ORDER["default"])
-        )
-
-        selected_activities: List[Dict[str, Any]] = []
+        selected_records: List[ContentRecord] = []
         used_content_ids: Set[str] = set()
+        recent_content = self.learner_profile.recent_content
+        if recent_content:
+            # Marked as used so the passes skip them; one O(1) history lookup per item
+            used_content_ids.update(
+                record.content_id for record in content_index.records if record.content_id in recent_content
+            )
+        held_back_count = len(used_content_ids)
 
         preferred_types_ordered_list = self._get_preferred_content_types()
-        logger.debug(f"Preferred types for {self.learner_profile.learner_id} for LO {lo_id}: {preferred_types_ordered_list}")
+        logger.debug("Preferred types for %s for LO %s: %s", self.learner_profile.learner_id, lo_id, preferred_types_ordered_list)
 
         self._apply_preference_driven_selection(
-            lo_id, sorted_content_all, preferred_types_ordered_list,
-            selected_activities, used_content_ids, max_activities_per_lo
+            lo_id, content_index, preferred_types_ordered_list,
+            selected_records, used_content_ids, max_activities_per_lo
         )
         
         self._apply_variety_driven_selection(
-            lo_id, sorted_content_all, selected_activities, 
+            lo_id, content_index, selected_records, 
             used_content_ids, max_activities_per_lo
         )
 
         self._apply_fallback_selection(
-            lo_id, sorted_content_all, selected_activities, 
+            lo_id, content_index, selected_records, 
             used_content_ids, max_activities_per_lo
         )
+
+        if held_back_count and len(selected_records) < max_activities_per_lo:
+            # Repeats only fill the slots no other content could
+            selected_ids = {record.content_id for record in selected_records}
+            repeats = sorted(
+                (record for record in content_index.records
+                 if record.content_id in recent_content and record.content_id not in selected_ids),
+                key=lambda record: recent_content.served_order(record.content_id)
+            )
+            selected_records.extend(repeats[:max_activities_per_lo - len(selected_records)])
         
-        return selected_activities[:max_activities_per_lo]
+        return [record.item for record in selected_records[:max_activities_per_lo]]
 
+    def _get_eligible_lo_ids(self) -> List[str]:
+        """Returns the uncompleted LO IDs whose prerequisites are all completed, in curriculum order."""
+        graph = self.content_store.prerequisite_graph
+        if getattr(self.learner_profile, "lo_catalog", None) is graph:
+            # Compact profiles store completed LOs as a bitset over this graph: one AND per LO
+            return graph.eligible_lo_ids_for_bits(
+                self.learner_profile.completed_lo_bits, self.learner_profile.has_completed_lo
+            )
+        return self._get_eligibility_tracker().get_eligible_lo_ids()
+
+    def _get_eligible_los(self) -> List[Dict[str, Any]]:
+        """Returns the dictionaries of the LOs the learner is eligible for, in curriculum order."""
+        if self.precomputation is None:
+            return [self.content_store.get_lo_by_id(lo_id) for lo_id in self._get_eligible_lo_ids()]
+        # Learners with the same completed LOs share one eligibility computation
+        completed_key = frozenset(self.learner_profile.completed_los)
+        eligible_los = self.precomputation.eligible_los_by_completed.get(completed_key)
+        if eligible_los is None:
+            eligible_los = tuple(self.content_store.get_lo_by_id(lo_id) for lo_id in self._get_eligible_lo_ids())
+            self.precomputation.remember(self.precomputation.eligible_los_by_completed, completed_key, eligible_los)
+        return list(eligible_los)
+
+    @instrumented("pathway.eligible_los")
     def _get_eligible_next_los(self, max_los: int) -> List[Dict[str, Any]]:
         """Filters and selects eligible learning objectives for the next pathway.
 
@@ -226,28 +550,55 @@ class PathwayGenerator:
         Returns:
             List[Dict[str, Any]]: A list of selected learning objective dictionaries.
         """
-        all_learning_objectives = self.content_store.get_learning_objectives()
-        if not all_learning_objectives:
+        if not self.content_store.lo_details_map:
             logger.warning("No learning objectives found in the curriculum store for _get_eligible_next_los.")
             return []
 
-        candidate_los = [lo for lo in all_learning_objectives if not self.learner_profile.has_completed_lo(lo['id'])]
-        
-        # Filter by eligibility (prerequisites)
-        potential_next_los = [lo_data for lo_data in candidate_los if self._is_lo_eligible(lo_data['id'])]
+        potential_next_los = self._get_eligible_los()
         
         # Shuffle and select a subset
-        random.shuffle(potential_next_los)
+        self.rng.shuffle(potential_next_los)
         selected_los = potential_next_los[:min(len(potential_next_los), max_los)]
         
         if selected_los:
-            logger.info(f"Selected {len(selected_los)} eligible LOs for the pathway: {[lo['id'] for lo in selected_los]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Selected %s eligible LOs for the pathway: %s", len(selected_los), [lo['id'] for lo in selected_los])
         else:
             # This is a normal case if no LOs are eligible or all are completed.
-            logger.info(f"No new eligible LOs found to select for the pathway for student {self.learner_profile.learner_id}.")
+            logger.info("No new eligible LOs found to select for the pathway for student %s.", self.learner_profile.learner_id)
             
         return selected_los
 
+    @instrumented("pathway.lookahead_los")
+    def _get_lookahead_los(self, max_los: int) -> List[Dict[str, Any]]:
+        """Plans an ordered multi-layer sequence of LOs with the prerequisite graph.
+
+        Unlike `_get_eligible_next_los`, later LOs may depend on earlier LOs of the same sequence
+        (see `PrerequisiteGraph.plan_lookahead`). The plan follows the curriculum's topological
+        order, so it does not use the generator's random generator.
+
+        Args:
+            max_los (int): Maximum number of learning objectives to plan; capped at LOOKAHEAD_MAX_PLANNED_LOS.
+
+        Returns:
+            List[Dict[str, Any]]: Copies of the planned LO dictionaries in order, each with a
+                                  'lookahead_layer' key (0 for LOs the learner is eligible for now).
+        """
+        graph = self.content_store.prerequisite_graph
+        plan = graph.plan_lookahead(
+            self._get_eligible_lo_ids(), self.learner_profile.has_completed_lo, min(max_los, LOOKAHEAD_MAX_PLANNED_LOS)
+        )
+        planned_los = [dict(self.content_store.get_lo_by_id(lo_id), lookahead_layer=layer) for lo_id, layer in plan]
+        if planned_los:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Planned %s LOs over %s layers for the pathway: %s",
+                    len(planned_los), max(layer for _, layer in plan) + 1, [lo_id for lo_id, _ in plan]
+                )
+        else:
+            logger.info("No LOs could be planned for the pathway for student %s.", self.learner_profile.learner_id)
+        return planned_los
+
     def _process_selected_lo_for_pathway(self, lo_data: Dict[str, Any], max_activities_per_lo: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Processes a single LO to select content and prepare it for the pathway.
 
@@ -258,21 +609,36 @@ class PathwayGenerator:
         Returns:
             Tuple[Dict[str, Any], List[Dict[str, Any]]]: A tuple containing the LO data and its selected content items.
         """
-        logger.info(f"Processing LO: {lo_data['id']} - {lo_data.get('description', 'N/A')}")
-        available_content = self.content_store.get_content_for_lo(lo_data['id'])
-        selected_activity_list = self._select_varied_content_for_lo(lo_data['id'], available_content, max_activities_per_lo)
+        logger.info("Processing LO: %s - %s", lo_data['id'], lo_data.get('description', 'N/A'))
+        if self.precomputation is not None and not self.learner_profile.recent_content:
+            # Without a history to hold back, the selection only depends on the preferences
+            selection_key = (lo_data['id'], self._preference_key(), max_activities_per_lo)
+            cached_selection = self.precomputation.selections_by_key.get(selection_key)
+            if cached_selection is None:
+                content_index = self.content_store.get_content_index_for_lo(lo_data['id'])
+                cached_selection = self._select_content_from_index(lo_data['id'], content_index, max_activities_per_lo)
+                self.precomputation.remember(self.precomputation.selections_by_key, selection_key, cached_selection)
+            selected_activity_list = list(cached_selection)
+        else:
+            content_index = self.content_store.get_content_index_for_lo(lo_data['id'])
+            selected_activity_list = self._select_content_from_index(lo_data['id'], content_index, max_activities_per_lo)
         
         if selected_activity_list:
             # Detailed logging of selected activities is already in _select_varied_content_for_lo or its sub-methods.
             # Here, we can log a summary if needed, or rely on the existing detailed logs.
-            logger.info(f"  Successfully selected {len(selected_activity_list)} activities for LO {lo_data['id']}.")
+            logger.info("  Successfully selected %s activities for LO %s.", len(selected_activity_list), lo_data['id'])
         else:
-            logger.warning(f"  No suitable content found or selected for LO: {lo_data['id']}. It will be included in pathway without activities.")
+            logger.warning("  No suitable content found or selected for LO: %s. It will be included in pathway without activities.", lo_data['id'])
             selected_activity_list = [] # Ensure it's a list
             
         return (lo_data, selected_activity_list)
 
-    def generate_pathway_with_prerequisites(self, max_los: int = DEFAULT_TARGET_LO_COUNT, max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    def generate_pathway_with_prerequisites(
+        self,
+        max_los: int = DEFAULT_TARGET_LO_COUNT,
+        max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+        lookahead: bool = False
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Generates a learning pathway by selecting eligible LOs based on prerequisites
         and then selecting a variety of content for these LOs, considering difficulty.
@@ -282,16 +648,22 @@ class PathwayGenerator:
                                      Defaults to DEFAULT_TARGET_LO_COUNT.
             max_activities_per_lo (int, optional): Maximum activities per learning objective. 
                                                  Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            lookahead (bool, optional): If True, plans an ordered sequence of LOs that also includes LOs
+                                        unlocked by earlier steps of the pathway (see `_get_lookahead_los`);
+                                        otherwise picks only among the LOs eligible now. Defaults to False.
             
         Returns:
             List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]: A list of tuples, each containing:
                 - A learning objective dictionary
                 - A list of content item dictionaries for that learning objective
         """
-        logger.info(f"--- Generating Pathway (Prerequisites, Difficulty, Variety) for {self.learner_profile.learner_id} ---")
+        logger.info("--- Generating Pathway (Prerequisites, Difficulty, Variety) for %s ---", self.learner_profile.learner_id)
         generated_pathway_tuples: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = [] 
 
-        selected_los_for_this_pathway = self._get_eligible_next_los(max_los)
+        if lookahead:
+            selected_los_for_this_pathway = self._get_lookahead_los(max_los)
+        else:
+            selected_los_for_this_pathway = self._get_eligible_next_los(max_los)
 
         if not selected_los_for_this_pathway:
             # Message already logged in _get_eligible_next_los
@@ -305,10 +677,17 @@ class PathwayGenerator:
             if not generated_pathway_tuples and selected_los_for_this_pathway:
                  logger.warning("Eligible LOs were selected, but the final pathway is empty. This might indicate issues in content processing for all selected LOs.")
 
-        logger.info(f"--- Pathway Generation Complete for {self.learner_profile.learner_id}. Generated {len(generated_pathway_tuples)} LO steps. ---")
+        logger.info("--- Pathway Generation Complete for %s. Generated %s LO steps. ---", self.learner_profile.learner_id, len(generated_pathway_tuples))
         return generated_pathway_tuples
 
-    def generate_initial_pathway(self, target_lo_count: int = DEFAULT_TARGET_LO_COUNT, max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO) -> List[Dict[str, Any]]:
+    @instrumented("pathway.generate_initial")
+    def generate_initial_pathway(
+        self,
+        target_lo_count: int = DEFAULT_TARGET_LO_COUNT,
+        max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+        lookahead: bool = False,
+        record_history: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Generates an initial learning pathway, typically for when a student starts or needs a new set of LOs.
         
@@ -322,17 +701,45 @@ class PathwayGenerator:
                                            Defaults to DEFAULT_TARGET_LO_COUNT.
             max_activities_per_lo (int, optional): Maximum activities per learning objective.
                                                  Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            lookahead (bool, optional): If True, the pathway is a multi-layer plan in which later LOs may
+                                        build on earlier ones (see `generate_pathway_with_prerequisites`),
+                                        so fewer regenerations are needed as the learner progresses.
+                                        Defaults to False.
+            record_history (bool, optional): If True, the returned pathway is being served to the learner,
+                                             and its content is added to the learner's recent history (see
+                                             `LearnerProfileBase.record_served_content`) so the next pathway
+                                             favours other content. Defaults to False, which leaves the
+                                             profile unchanged.
             
+        If the generator has a `pathway_cache`, a pathway cached for the same learner, profile state,
+        options and content is returned instead (shared, so treat it as read-only); the history is
+        not part of the cache key, so reopening a page shows the pathway it was served with.
+
         Returns:
             List[Dict[str, Any]]: A list of learning objective dictionaries, each with a 'content_items' key
                                 containing a list of selected content items.
         """
-        logger.info(f"Generating initial pathway for student: {self.learner_profile.learner_id}")
+        cache_key = None
+        if self.pathway_cache is not None:
+            cache_key = PathwayCache.make_key(
+                self.learner_profile, self.content_store, target_lo_count, max_activities_per_lo, lookahead,
+                self.session
+            )
+            cached_pathway = self.pathway_cache.get(cache_key, self.content_store)
+            if cached_pathway is not None:
+                increment("pathway.cache_hits")
+                logger.info("Using cached initial pathway for student: %s", self.learner_profile.learner_id)
+                if record_history:
+                    self.learner_profile.record_served_content(pathway_content_ids(cached_pathway))
+                return cached_pathway
+
+        logger.info("Generating initial pathway for student: %s", self.learner_profile.learner_id)
         
         # Use the prerequisite-aware pathway generation
         pathway_tuples = self.generate_pathway_with_prerequisites(
             max_los=target_lo_count,
-            max_activities_per_lo=max_activities_per_lo
+            max_activities_per_lo=max_activities_per_lo,
+            lookahead=lookahead
         )
         
         # Convert the tuples to the expected format (LOs with content_items)
@@ -344,5 +751,79 @@ class PathwayGenerator:
             lo_with_content['content_items'] = content_items
             pathway_los.append(lo_with_content)
         
-        logger.info(f"Initial pathway generation complete. Generated {len(pathway_los)} LOs with content.")
+        logger.info("Initial pathway generation complete. Generated %s LOs with content.", len(pathway_los))
+        if cache_key is not None:
+            self.pathway_cache.put(cache_key, self.learner_profile, self.content_store, pathway_los)
+        if record_history:
+            self.learner_profile.record_served_content(pathway_content_ids(pathway_los))
         return pathway_los
+
+
+
+def pathway_content_ids(pathway: List[Dict[str, Any]]) -> List[str]:
+    """Returns the IDs of a pathway's content items in pathway order, e.g. to record them as served."""
+    return [item['id'] for lo_with_content in pathway for item in lo_with_content['content_items']]
+
+
+@instrumented("pathway.cohort")
+def generate_pathways_for_cohort(
+    profiles: Iterable[LearnerProfileBase],
+    content_store: CurriculumContentStore,
+    target_lo_count: int = DEFAULT_TARGET_LO_COUNT,
+    max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+    precomputation: Optional[PathwayPrecomputation] = None,
+    pathway_cache: Optional[PathwayCache] = None,
+    session: Optional[str] = None,
+    lookahead: bool = False,
+    record_history: bool = False
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Generates initial pathways for a whole cohort (class, year group or school) in one pass.
+
+    The store's prerequisite graph and per-LO content index are shared by every learner, and the
+    work that only depends on a learner's progress and preferences (eligible LOs per set of
+    completed LOs, preferred content types and selected activities per preference combination)
+    is done once per distinct value in a `PathwayPrecomputation` instead of once per learner as
+    in a per-learner loop. The pathways are the same as the loop's.
+
+    Args:
+        profiles (Iterable[LearnerProfileBase]): The learner profiles (regular or compact) to generate pathways for.
+        content_store (CurriculumContentStore): Repository of curriculum and content data.
+        target_lo_count (int, optional): Target number of LOs per pathway.
+                                         Defaults to DEFAULT_TARGET_LO_COUNT.
+        max_activities_per_lo (int, optional): Maximum activities per learning objective.
+                                               Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+        precomputation (Optional[PathwayPrecomputation], optional): Previously built shared data for
+                                                                    `content_store`, e.g. kept between
+                                                                    daily runs. Defaults to None.
+        pathway_cache (Optional[PathwayCache], optional): Cache of previously generated pathways
+                                                          (see `PathwayGenerator`). Defaults to None.
+        session (Optional[str], optional): If given, each learner's pathway is generated with
+                                           `make_session_rng(learner_id, session)`, so rerunning the
+                                           cohort with the same session reproduces it. Defaults to None.
+        lookahead (bool, optional): Whether to plan multi-layer pathways
+                                    (see `PathwayGenerator.generate_initial_pathway`). Defaults to False.
+        record_history (bool, optional): Whether the pathways are being served, so their content is added
+                                         to each learner's recent history. Defaults to False.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The pathway of each learner (in the format returned by
+                                         `PathwayGenerator.generate_initial_pathway`), keyed by learner ID.
+    """
+    if precomputation is None or precomputation.content_store is not content_store:
+        precomputation = PathwayPrecomputation(content_store)
+
+    generators = [
+        PathwayGenerator(profile, content_store, precomputation=precomputation, pathway_cache=pathway_cache, session=session)
+        for profile in profiles
+    ]
+
+    pathways_by_learner: Dict[str, List[Dict[str, Any]]] = {}
+    for generator in generators:
+        pathways_by_learner[generator.learner_profile.learner_id] = generator.generate_initial_pathway(
+            target_lo_count=target_lo_count,
+            max_activities_per_lo=max_activities_per_lo,
+            lookahead=lookahead,
+            record_history=record_history
+        )
+    logger.info("Generated pathways for a cohort of %s learners.", len(pathways_by_learner))
+    return pathways_by_learner
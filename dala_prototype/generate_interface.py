@@ -20,24 +20,29 @@ Visual enhancements are applied for better engagement.
 """
 
 import os
+import sys
 import html
+import time
 import random
+import argparse
 import datetime # For formatting badge earned date
 import json # For learner profile data in JS
 import logging # Added for structured logging
-from typing import List, Dict, Any, Tuple # For type hinting
+from typing import List, Dict, Any, Tuple, Optional # For type hinting
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-# Import and setup logging from config.py
+# Import logging setup from config.py
 from config import (
     setup_logging, DEFAULT_OUTPUT_HTML_FILENAME, DEFAULT_OUTPUT_DIR_NAME,
     ASSET_DIR_NAME, ADVENTURE_QUEST_ASSETS_SUBDIR, DEFAULT_STUDENT_ID,
     DEFAULT_INITIAL_CONTENT_SET_KEY, DEFAULT_NEW_CONTENT_SET_KEY,
     DEFAULT_TARGET_LO_COUNT, DEFAULT_MAX_ACTIVITIES_PER_LO,
+    ROSTER_GENERATION_BATCH_SIZE, ROSTER_OUTPUT_FILENAME_PATTERN,
     CURRICULUM_SLICE_MATH_Y4_FILE, LEARNING_CONTENT_SET_MATH_Y4_FILE,
     CURRICULUM_SLICE_KS2_ENGLISH_Y34_FILE, KS2_ENGLISH_ACTIVITIES_SET2_FILE,
     BASE_DIR
 )
-setup_logging() # Initialize logging configuration
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
@@ -47,11 +52,14 @@ from hlp_module import (
     run_visual_preference_task, run_textual_preference_task,
     capture_student_interests, capture_student_struggles,
     run_story_weaver_task, run_mind_mapper_task,
-    BADGE_DEFINITIONS, check_and_award_all_relevant_badges, run_full_hlp_assessment
+    BADGE_DEFINITIONS, check_and_award_all_relevant_badges, run_full_hlp_assessment, make_session_rng
 )
 # Assuming curriculum_content_module.py is in the same directory or accessible via PYTHONPATH
-from curriculum_content_module import CurriculumContentStore # Removed direct data imports
-from dcw_apg_module import PathwayGenerator
+from curriculum_content_module import CurriculumContentStore, content_store_registry
+from dcw_apg_module import PathwayGenerator, PathwayCache, default_pathway_cache, pathway_content_ids
+from profile_persistence_module import LearnerProfileStore
+from template_engine import get_compiled_template, join_fragments
+from instrumentation_module import span, instrumented, record_request
 
 # --- Load Curriculum Data ---
 def load_curriculum_data(curriculum_file_path: str, content_file_path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
@@ -94,35 +102,44 @@ def load_html_template(template_path: str) -> str:
         logger.error(f"Unexpected error loading HTML template: {e}")
         raise
 
-# Load the initial Math curriculum and content
-initial_curriculum_data, initial_content_data = load_curriculum_data(
-    CURRICULUM_SLICE_MATH_Y4_FILE,
-    LEARNING_CONTENT_SET_MATH_Y4_FILE
-)
-
-# Load the new KS2 English curriculum and content
-new_curriculum_data, new_content_data = load_curriculum_data(
-    CURRICULUM_SLICE_KS2_ENGLISH_Y34_FILE,
-    KS2_ENGLISH_ACTIVITIES_SET2_FILE
-)
-
 # Path to the HTML template
 TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
 HTML_TEMPLATE_PATH = os.path.join(TEMPLATE_DIR, "student_interface_template_v15_tts.html")
 
-def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filename: str = DEFAULT_OUTPUT_HTML_FILENAME) -> str:
+COMBINED_CURRICULUM_FIELDS: Dict[str, str] = {
+    "curriculum_id": "combined_math_english_ks2_y3_y4", 
+    "subject": "Mathematics & English", 
+    "year_group": "Year 3/4", 
+    "description": "Combined learning objectives for KS2 Mathematics and English."
+}
+
+def build_combined_content_store() -> CurriculumContentStore:
+    """Returns the content store merging the Mathematics and English curriculum slices and content sets.
+
+    The store comes from `content_store_registry`, so it is built once and shared by every call;
+    when a source file changes, the next call gets a copy patched with just that file's changes,
+    while renders already holding the previous store finish against it unchanged. LOs and content
+    items are de-duplicated by ID, keeping the first occurrence.
+
+    Returns:
+        CurriculumContentStore: The shared store over the combined curriculum and content.
     """
-    Generates an HTML interface for the student based on their profile and learning pathway.
-    
-    Args:
-        student_id (str, optional): The ID of the student. Defaults to DEFAULT_STUDENT_ID.
-        output_filename (str, optional): The filename for the output HTML. Defaults to DEFAULT_OUTPUT_HTML_FILENAME.
-        
+    return content_store_registry.get_store(
+        [CURRICULUM_SLICE_MATH_Y4_FILE, CURRICULUM_SLICE_KS2_ENGLISH_Y34_FILE],
+        [LEARNING_CONTENT_SET_MATH_Y4_FILE, KS2_ENGLISH_ACTIVITIES_SET2_FILE],
+        **COMBINED_CURRICULUM_FIELDS
+    )
+
+def _render_selected_item_tag(text: str) -> str:
+    """Renders one selected interest or struggle area as a tag."""
+    return f'<span class="selected-item-tag">{html.escape(text)}</span>'
+
+def prepare_output_dir() -> str:
+    """Creates the interface output directory and its asset subdirectories if they don't exist.
+
     Returns:
-        str: The path to the generated HTML file.
+        str: The output directory path.
     """
-    logger.info(f"Generating interface for student: {student_id}")
-    
     # Create output directory if it doesn't exist
     output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_OUTPUT_DIR_NAME)
     os.makedirs(output_dir, exist_ok=True)
@@ -134,81 +151,27 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
     # Create adventure quest assets subdirectory if it doesn't exist
     adventure_quest_assets_dir = os.path.join(assets_dir, ADVENTURE_QUEST_ASSETS_SUBDIR)
     os.makedirs(adventure_quest_assets_dir, exist_ok=True)
-    
-    # Initialize the learner profile
-    learner_profile = LearnerProfile(student_id=student_id)
-    
-    # Run the HLP assessment to populate the learner profile
-    run_full_hlp_assessment(learner_profile)
-
-    # --- Combine curriculum and content data --- 
-    merged_los = []
-    seen_lo_ids = set()
-    for lo_list_source in [initial_curriculum_data.get('learning_objectives', []), new_curriculum_data.get('learning_objectives', [])]:
-        for lo in lo_list_source:
-            if lo.get('id') not in seen_lo_ids:
-                merged_los.append(lo)
-                seen_lo_ids.add(lo['id'])
-
-    final_curriculum_data = {
-        "curriculum_id": "combined_math_english_ks2_y3_y4", 
-        "subject": "Mathematics & English", 
-        "year_group": "Year 3/4", 
-        "description": "Combined learning objectives for KS2 Mathematics and English.",
-        "learning_objectives": merged_los
-    }
+    return output_dir
 
-    merged_content = []
-    seen_content_ids = set()
-    for content_list_source in [initial_content_data, new_content_data]:
-        for item in content_list_source:
-            if item.get('id') not in seen_content_ids:
-                merged_content.append(item)
-                seen_content_ids.add(item['id'])
-    final_content_data = merged_content
-    logger.info(f"Combined curriculum: {len(final_curriculum_data['learning_objectives'])} LOs. Combined content: {len(final_content_data)} items.")
-
-    # Initialize the curriculum content store with the COMBINED curriculum data
-    content_store = CurriculumContentStore(
-        curriculum_data=final_curriculum_data,
-        content_data=final_content_data
-    )
-    
-    # Generate a learning pathway using the combined store
-    pathway_generator = PathwayGenerator(learner_profile, content_store)
-    current_pathway = pathway_generator.generate_initial_pathway(
-        target_lo_count=DEFAULT_TARGET_LO_COUNT,
-        max_activities_per_lo=DEFAULT_MAX_ACTIVITIES_PER_LO
-    )
-    
-    # Simulate completing some LOs to demonstrate progress
-    if current_pathway and len(current_pathway) > 0:
-        first_lo_id = current_pathway[0]['id']
-        learner_profile.mark_lo_completed(first_lo_id)
-        logger.info(f"Marked LO {first_lo_id} as completed for demonstration")
-        
-        if len(current_pathway) > 1:
-            second_lo_id = current_pathway[1]['id']
-            learner_profile.current_learning_objective_id = second_lo_id
-            logger.info(f"Set LO {second_lo_id} as current for demonstration")
-    
-    # Award some badges for demonstration
-    learner_profile.earned_badges_data["first_step"] = {
-        "earned_date": datetime.datetime.now().strftime("%Y-%m-%d"),
-        "details": "Awarded for starting your learning journey!"
-    }
-    learner_profile.earned_badges_data["hlp_explorer"] = {
-        "earned_date": datetime.datetime.now().strftime("%Y-%m-%d"),
-        "details": "Awarded for completing the learning profile assessment!"
-    }
-    
-    # Check for any additional badges that might be earned
-    check_and_award_all_relevant_badges(learner_profile)
-    
+def _render_page_sections(
+    learner_profile: LearnerProfile,
+    current_pathway: List[Dict[str, Any]],
+    rng: Any
+) -> Dict[str, str]:
+    """Renders the HTML fragments of the page's sections for `render_html_interface`.
+
+    Args:
+        learner_profile (LearnerProfile): The learner's profile.
+        current_pathway (List[Dict[str, Any]]): The learner's pathway, with each LO's `content_items`.
+        rng (Any): Random generator (or the `random` module) for the map node positions.
+
+    Returns:
+        Dict[str, str]: The template fields of the sections, keyed by field name.
+    """
     # Generate HTML for the learning objectives and content items
-    learning_objectives_html = ""
+    lo_fragments = []
     for lo in current_pathway: # Use current_pathway which has all content
-        lo_html = f"""
+        lo_fragments.append(f"""
         <li>
             <div class="lo-title-container">
                 <div class="lo-title">{html.escape(lo.get('description', 'No description'))}</div>
@@ -216,12 +179,12 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
             </div>
             <button class="tts-button" title="Read aloud">🔊</button>
         </li>
-        """
+        """)
         
         content_items = lo.get('content_items', [])
         if content_items:
             for item in content_items:
-                content_html = f"""
+                lo_fragments.append(f"""
                 <li style="margin-left: 30px;">
                     <div class="content-title-container">
                         <div class="content-title">{html.escape(item.get('title', 'No title'))} <em>({html.escape(item.get('type', 'unknown type'))})</em></div>
@@ -229,29 +192,21 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
                     </div>
                     <button class="tts-button" title="Read aloud">🔊</button>
                 </li>
-                """
-                lo_html += content_html
-        
-        learning_objectives_html += lo_html
-    
-    # Generate HTML for interests
-    interests_html = ""
-    for interest in learner_profile.interests:
-        interests_html += f'<span class="selected-item-tag">{html.escape(interest)}</span>'
+                """)
+    learning_objectives_html = "".join(lo_fragments)
     
-    # Generate HTML for struggles
-    struggles_html = ""
-    for struggle in learner_profile.struggle_areas:
-        struggles_html += f'<span class="selected-item-tag">{html.escape(struggle)}</span>'
+    # Generate HTML for interests and struggles
+    interests_html = join_fragments(learner_profile.interests, _render_selected_item_tag)
+    struggles_html = join_fragments(learner_profile.struggle_areas, _render_selected_item_tag)
     
     # Generate HTML for adventure map nodes
-    adventure_map_nodes_html = ""
+    map_node_fragments = []
     map_nodes_for_js = []
     
     if current_pathway: # Check if current_pathway is not empty
         for i, lo in enumerate(current_pathway):
             pos_x = 5 + (90 * i / len(current_pathway)) if len(current_pathway) > 0 else 50
-            pos_y = 50 + (random.randint(-15, 15))
+            pos_y = 50 + (rng.randint(-15, 15))
             
             status = "normal"
             if learner_profile.has_completed_lo(lo['id']):
@@ -259,13 +214,12 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
             elif learner_profile.current_learning_objective_id == lo['id']:
                 status = "current"
             
-            node_html = f"""
+            map_node_fragments.append(f"""
             <div class="map-node {status}" style="left: {pos_x}%; top: {pos_y}%;">
                 {i+1}
                 <div class="map-node-tooltip">{html.escape(lo.get('description', 'Learning Objective'))}</div>
             </div>
-            """
-            adventure_map_nodes_html += node_html
+            """)
             
             map_nodes_for_js.append({
                 "id": lo['id'],
@@ -275,8 +229,10 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
                 "description": lo.get('description', 'Learning Objective')
             })
     
+    adventure_map_nodes_html = "".join(map_node_fragments)
+    
     # Generate HTML for badges
-    badges_html = ""
+    badge_fragments = []
     for badge_id, badge_info in BADGE_DEFINITIONS.items():
         badge_name = badge_info.get('name', 'Unknown Badge')
         badge_description = badge_info.get('description', 'No description available')
@@ -290,7 +246,7 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
             earned_date = learner_profile.earned_badges_data[badge_id].get('earned_date', 'Unknown date')
             earned_date_html = f'<div class="badge-earned-date">Earned: {earned_date}</div>'
         
-        badge_html = f"""
+        badge_fragments.append(f"""
         <div class="badge-item {badge_class}">
             <img src="./assets/{badge_image}" alt="{badge_name}" class="badge-image">
             <div class="badge-name">{html.escape(badge_name)}</div>
@@ -298,52 +254,321 @@ def generate_html_interface(student_id: str = DEFAULT_STUDENT_ID, output_filenam
             {earned_date_html}
             {'' if is_earned else '<div class="badge-locked-overlay"><span class="badge-locked-icon">🔒</span></div>'}
         </div>
-        """
-        badges_html += badge_html
+        """)
+    badges_html = "".join(badge_fragments)
+    return {
+        "learning_objectives_html": learning_objectives_html,
+        "interests_html": interests_html,
+        "struggles_html": struggles_html,
+        "adventure_map_nodes_html": adventure_map_nodes_html,
+        "badges_html": badges_html,
+        "map_nodes_json_for_js": json.dumps(map_nodes_for_js)
+    }
+
+@instrumented("interface.render")
+def render_html_interface(
+    student_id: str,
+    content_store: CurriculumContentStore,
+    profile_store: Optional[LearnerProfileStore] = None,
+    session: Optional[str] = None
+) -> str:
+    """
+    Renders the HTML interface for the student based on their profile and learning pathway.
+    
+    Args:
+        student_id (str): The ID of the student.
+        content_store (CurriculumContentStore): The store to generate the learning pathway from.
+        profile_store (Optional[LearnerProfileStore], optional): Store to load the learner's profile from
+            (and save new profiles to). The HLP assessment is only run for learners without a stored profile,
+            and the page's demonstration progress and badges are never applied to a stored profile. The
+            activities shown are added to the stored learner's recent history, so later pages favour others.
+            Defaults to None, in which case the assessment is run on every call.
+        session (Optional[str], optional): If given, the HLP simulation, pathway selection and map layout
+            draw from `make_session_rng(student_id, session)`, so the same student and session render
+            the same page (up to badge award times). Defaults to None, which uses the global `random` module.
+        
+    Returns:
+        str: The rendered HTML page.
+    """
+    # The assessment, the pathway and the map layout each get a fresh session generator, so the pathway
+    # matches the one `generate_pathways_for_cohort` and `PathwayService` produce for the same session
+    hlp_rng = make_session_rng(student_id, session) if session is not None else None
+    rng = make_session_rng(student_id, session) if session is not None else random
+
+    # Load the learner profile, running the HLP assessment only when there is no stored profile
+    with span("interface.profile"):
+        if profile_store is not None:
+            learner_profile = profile_store.get_or_create_profile(
+                student_id, lambda new_student_id: run_full_hlp_assessment(new_student_id, rng=hlp_rng)
+            )
+        else:
+            learner_profile = run_full_hlp_assessment(student_id, rng=hlp_rng)
+
+    # Generate a learning pathway using the combined store. The cache is filled by hand below: the
+    # demonstration progress invalidates the learner's entries, so the pathway is only cached after it.
+    with span("interface.pathway"):
+        cache_key = PathwayCache.make_key(
+            learner_profile, content_store, DEFAULT_TARGET_LO_COUNT, DEFAULT_MAX_ACTIVITIES_PER_LO, session=session
+        )
+        # A stored learner is actually served the page's activities, so they go into their recent history
+        record_history = profile_store is not None
+        current_pathway = default_pathway_cache.get(cache_key, content_store)
+        if current_pathway is None:
+            pathway_generator = PathwayGenerator(learner_profile, content_store, rng=rng, session=session)
+            current_pathway = pathway_generator.generate_initial_pathway(
+                target_lo_count=DEFAULT_TARGET_LO_COUNT,
+                max_activities_per_lo=DEFAULT_MAX_ACTIVITIES_PER_LO,
+                record_history=record_history
+            )
+            pathway_is_new = True
+        else:
+            logger.info("Using cached initial pathway for student: %s", student_id)
+            if record_history:
+                learner_profile.record_served_content(pathway_content_ids(current_pathway))
+            pathway_is_new = False
     
-    # Load the HTML template
-    html_template = load_html_template(HTML_TEMPLATE_PATH)
+    # The demonstration progress and badges below are applied to a copy of a stored profile, so page
+    # views never change (or persist into) a real learner's profile
+    page_profile = learner_profile if profile_store is None else LearnerProfile.from_dict(learner_profile.to_dict())
+
+    # Simulate completing some LOs to demonstrate progress
+    if current_pathway and len(current_pathway) > 0:
+        first_lo_id = current_pathway[0]['id']
+        page_profile.mark_lo_completed(first_lo_id)
+        logger.info("Marked LO %s as completed for demonstration", first_lo_id)
+        
+        if len(current_pathway) > 1:
+            second_lo_id = current_pathway[1]['id']
+            page_profile.current_learning_objective_id = second_lo_id
+            logger.info("Set LO %s as current for demonstration", second_lo_id)
+    if pathway_is_new:
+        default_pathway_cache.put(cache_key, learner_profile, content_store, current_pathway)
     
-    # Fill in the template with the generated content
-    filled_template = html_template.format(
-        student_id=html.escape(student_id),
-        visual_preference_result=html.escape(learner_profile.learning_preferences.get('visual_task_1', 'Not assessed')),
-        textual_preference_result=html.escape(learner_profile.learning_preferences.get('textual_task_1', 'Not assessed')),
-        story_weaver_result=html.escape(str(learner_profile.cognitive_metrics.get('story_weaver', 'Not assessed'))),
-        mind_mapper_result=html.escape(str(learner_profile.cognitive_metrics.get('mind_mapper', 'Not assessed'))),
-        interests_html=interests_html,
-        struggles_html=struggles_html,
-        learning_objectives_html=learning_objectives_html,
-        adventure_map_nodes_html=adventure_map_nodes_html,
-        current_quest_name="Math and English Fundamentals", # Updated quest name
-        quest_progress=f"{len(learner_profile.completed_los)} / {len(current_pathway) if current_pathway else 0} objectives completed", # Use current_pathway
-        badges_html=badges_html,
-        learner_profile_json=json.dumps(learner_profile.to_dict()),
-        all_badge_definitions_json=json.dumps(BADGE_DEFINITIONS),
-        map_nodes_json_for_js=json.dumps(map_nodes_for_js)
-    )
+    # Award some badges for demonstration
+    page_profile.earned_badges_data["first_step"] = {
+        "earned_date": datetime.datetime.now().strftime("%Y-%m-%d"),
+        "details": "Awarded for starting your learning journey!"
+    }
+    page_profile.earned_badges_data["hlp_explorer"] = {
+        "earned_date": datetime.datetime.now().strftime("%Y-%m-%d"),
+        "details": "Awarded for completing the learning profile assessment!"
+    }
+    
+    # Check for any additional badges that might be earned
+    with span("interface.badges"):
+        check_and_award_all_relevant_badges(page_profile)
+    
+    # Generate the HTML fragments of the page's sections. The map layout gets its own session generator,
+    # so a cached pathway (which consumed no random numbers) gives the same layout as a generated one.
+    with span("interface.fragments"):
+        layout_rng = make_session_rng(student_id, session) if session is not None else random
+        sections = _render_page_sections(page_profile, current_pathway, layout_rng)
+    
+    # Fill in the compiled template (parsed once, re-read only when the file changes)
+    with span("interface.template"):
+        filled_template = get_compiled_template(HTML_TEMPLATE_PATH).render(
+            student_id=html.escape(student_id),
+            visual_preference_result=html.escape(page_profile.learning_preferences.get('visual_task_1', 'Not assessed')),
+            textual_preference_result=html.escape(page_profile.learning_preferences.get('textual_task_1', 'Not assessed')),
+            story_weaver_result=html.escape(str(page_profile.cognitive_metrics.get('story_weaver', 'Not assessed'))),
+            mind_mapper_result=html.escape(str(page_profile.cognitive_metrics.get('mind_mapper', 'Not assessed'))),
+            current_quest_name="Math and English Fundamentals", # Updated quest name
+            quest_progress=f"{len(page_profile.completed_los)} / {len(current_pathway) if current_pathway else 0} objectives completed", # Use current_pathway
+            learner_profile_json=json.dumps(page_profile.to_dict()),
+            all_badge_definitions_json=json.dumps(BADGE_DEFINITIONS),
+            **sections
+        )
+    return filled_template
+
+def generate_html_interface(
+    student_id: str = DEFAULT_STUDENT_ID,
+    output_filename: str = DEFAULT_OUTPUT_HTML_FILENAME,
+    profile_store: Optional[LearnerProfileStore] = None,
+    session: Optional[str] = None
+) -> str:
+    """
+    Generates an HTML interface for the student based on their profile and learning pathway.
+    
+    Args:
+        student_id (str, optional): The ID of the student. Defaults to DEFAULT_STUDENT_ID.
+        output_filename (str, optional): The filename for the output HTML. Defaults to DEFAULT_OUTPUT_HTML_FILENAME.
+        profile_store (Optional[LearnerProfileStore], optional): Store to load the learner's profile from
+            (and save it to). The HLP assessment is only run for learners without a stored profile.
+            Defaults to None, in which case the assessment is run on every call.
+        session (Optional[str], optional): Seeds the page's randomness (see `render_html_interface`).
+            Defaults to None.
+        
+    Returns:
+        str: The path to the generated HTML file.
+    """
+    logger.info("Generating interface for student: %s", student_id)
+    output_dir = prepare_output_dir()
+    with span("interface.content_store"):
+        content_store = build_combined_content_store()
+    filled_template = render_html_interface(student_id, content_store, profile_store, session)
     
     # Write the filled template to the output file
     output_path = os.path.join(output_dir, output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with span("interface.write"), open(output_path, 'w', encoding='utf-8') as f:
         f.write(filled_template)
     
-    logger.info(f"Generated interface saved to: {output_path}")
+    logger.info("Generated interface saved to: %s", output_path)
     return output_path
 
-def generate_logged_interface() -> str:
+def generate_logged_interface(session: Optional[str] = None) -> str:
     """
     Generates an interface with logging enabled and a modified filename.
     
+    Args:
+        session (Optional[str], optional): Seeds the page's randomness (see `render_html_interface`).
+            Defaults to None.
+        
     Returns:
         str: The path to the generated HTML file.
     """
     return generate_html_interface(
         student_id=DEFAULT_STUDENT_ID,
-        output_filename="dala_student_interface_v15_tts_logged.html"
+        output_filename="dala_student_interface_v15_tts_logged.html",
+        session=session
     )
 
+# --- Bulk Roster Generation ---
+# Per-worker state, built once by _init_roster_worker in each pool process
+_roster_content_store: Optional[CurriculumContentStore] = None
+
+def _init_roster_worker() -> None:
+    """Process-pool initializer: builds the combined content store and compiles the template once per worker."""
+    global _roster_content_store
+    random.seed() # Forked workers would otherwise replay the parent's random sequence
+    _roster_content_store = build_combined_content_store()
+    get_compiled_template(HTML_TEMPLATE_PATH)
+
+def _write_roster_batch(
+    student_ids: List[str],
+    content_store: CurriculumContentStore,
+    output_dir: str,
+    filename_pattern: str,
+    session: Optional[str] = None
+) -> List[str]:
+    """Renders a batch of student interfaces, then writes the whole batch out.
+
+    Returns:
+        List[str]: The paths of the written files, in the order of `student_ids`.
+    """
+    pages = [
+        (os.path.join(output_dir, filename_pattern.format(student_id=student_id)),
+         render_html_interface(student_id, content_store, session=session))
+        for student_id in student_ids
+    ]
+    for output_path, page in pages:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(page)
+    return [output_path for output_path, _ in pages]
+
+def _write_roster_batch_in_worker(
+    student_ids: List[str],
+    output_dir: str,
+    filename_pattern: str,
+    session: Optional[str] = None
+) -> List[str]:
+    """Pool task: writes one batch using the worker's shared content store."""
+    return _write_roster_batch(student_ids, _roster_content_store, output_dir, filename_pattern, session)
+
+def generate_interfaces_for_roster(
+    student_ids: List[str],
+    workers: Optional[int] = None,
+    batch_size: int = ROSTER_GENERATION_BATCH_SIZE,
+    filename_pattern: str = ROSTER_OUTPUT_FILENAME_PATTERN,
+    session: Optional[str] = None
+) -> List[str]:
+    """Generates one HTML interface per student, fanning the rendering out over a process pool.
+
+    Each worker builds the combined content store and compiles the template once, then renders
+    batches of `batch_size` students and writes each batch's files together. Profiles come from
+    the simulated HLP assessment, as in `generate_html_interface` without a profile store.
+
+    Args:
+        student_ids (List[str]): The students to generate interfaces for.
+        workers (Optional[int], optional): Number of worker processes; 1 renders in this process.
+                                           Defaults to the number of CPUs.
+        batch_size (int, optional): Students rendered per batch. Defaults to ROSTER_GENERATION_BATCH_SIZE.
+        filename_pattern (str, optional): Output filename pattern containing `{student_id}`.
+                                          Defaults to ROSTER_OUTPUT_FILENAME_PATTERN.
+        session (Optional[str], optional): Seeds each student's page (see `render_html_interface`), so
+                                           a roster rerun with the same session reproduces it whatever
+                                           the number of workers. Defaults to None.
+
+    Returns:
+        List[str]: The paths of the generated files, in the order of `student_ids`.
+
+    Raises:
+        ValueError: If a student ID cannot be used in a file name.
+    """
+    for student_id in student_ids:
+        if not student_id or student_id.startswith(".") or "/" in student_id or os.sep in student_id:
+            raise ValueError(f"Invalid student ID for an output file name: {student_id!r}")
+    workers = workers or os.cpu_count() or 1
+    batch_size = max(1, batch_size)
+    batches = [student_ids[start:start + batch_size] for start in range(0, len(student_ids), batch_size)]
+    output_dir = prepare_output_dir()
+
+    start_time = time.perf_counter()
+    output_paths: List[str] = []
+    if workers == 1 or len(batches) <= 1:
+        content_store = build_combined_content_store()
+        for batch in batches:
+            output_paths.extend(_write_roster_batch(batch, content_store, output_dir, filename_pattern, session))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(batches)), initializer=_init_roster_worker) as pool:
+            for batch_paths in pool.map(
+                _write_roster_batch_in_worker, batches, repeat(output_dir), repeat(filename_pattern), repeat(session)
+            ):
+                output_paths.extend(batch_paths)
+    elapsed = time.perf_counter() - start_time
+
+    logger.info(
+        f"Generated {len(output_paths)} interfaces with {workers} worker(s) in {elapsed:.2f}s "
+        f"({len(output_paths) / elapsed if elapsed > 0 else 0.0:.1f} pages/s)."
+    )
+    return output_paths
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses the command line; with no roster options the single logged interface is generated."""
+    parser = argparse.ArgumentParser(description="Generate DALA student interface pages.")
+    roster = parser.add_mutually_exclusive_group()
+    roster.add_argument("--roster", metavar="FILE", help="Generate a page per student ID listed in FILE (one per line).")
+    roster.add_argument("--synthetic-roster", metavar="N", type=int, help="Generate pages for N synthetic student IDs.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: number of CPUs).")
+    parser.add_argument("--batch-size", type=int, default=ROSTER_GENERATION_BATCH_SIZE, help="Students per write batch.")
+    parser.add_argument("--session", default=None, help="Seed each page from the student ID and this session for reproducible output.")
+    parser.add_argument("--trace", metavar="FILE", help="Write the single page's stage timings and call counts as JSON to FILE.")
+    parser.add_argument("--verbose", action="store_true", help="Keep INFO logging during roster generation.")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    output_path = generate_logged_interface()
-    print(f"Interface generated at: {output_path}")
+    setup_logging() # Configure logging only when run as a script
+    args = _parse_args()
+    if args.roster is None and args.synthetic_roster is None:
+        with record_request() as trace:
+            output_path = generate_logged_interface(session=args.session)
+        if args.trace:
+            with open(args.trace, 'w', encoding='utf-8') as f:
+                json.dump(trace.export(), f, indent=2)
+        print(f"Interface generated at: {output_path}")
+        sys.exit(0)
+
+    if args.roster is not None:
+        with open(args.roster, 'r', encoding='utf-8') as f:
+            roster_ids = [line.strip() for line in f if line.strip()]
+    else:
+        roster_ids = [f"roster_student_{index:06d}" for index in range(args.synthetic_roster)]
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING) # Per-student INFO logs would dominate a roster run
+    roster_start = time.perf_counter()
+    roster_paths = generate_interfaces_for_roster(
+        roster_ids, workers=args.workers, batch_size=args.batch_size, session=args.session
+    )
+    roster_elapsed = time.perf_counter() - roster_start
+    print(f"Generated {len(roster_paths)} interfaces in {roster_elapsed:.2f}s "
+          f"({len(roster_paths) / roster_elapsed if roster_elapsed > 0 else 0.0:.1f} pages/s)")
 
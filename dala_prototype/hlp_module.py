@@ -14,93 +14,181 @@ This module contains the logic for:
 7.  Badge and achievement system (Stage 2).
 """
 
+import hashlib
 import random
 import time
-import sys
 import inspect
 import datetime # Added for timestamping earned badges
 import logging # Added for structured logging
-from typing import Optional, List, Set, Tuple, Dict, Any # Updated for Dict, Any
+from typing import Optional, List, Set, Tuple, Dict, Any, FrozenSet, Callable, Iterable # Updated for Dict, Any
 
-# Import and setup logging from config.py
-from config import setup_logging
-setup_logging() # Initialize logging configuration
+# Import logging setup from config.py
+from config import setup_logging, RECENT_CONTENT_HISTORY_SIZE
+from instrumentation_module import increment, instrumented
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
 # --- Badge Definitions ---
 # Defines all available badges, their properties, and how to check their criteria.
+# "depends_on" lists the profile fields (as reported by LearnerProfileBase._notify_change) that
+# the criteria read; the BadgeEngine only re-evaluates a badge when one of them changes.
 BADGE_DEFINITIONS = {
     "trailblazer": {
         "id": "trailblazer",
         "name": "Trailblazer",
         "description": "You've taken the first step on your learning adventure! (Completed HLP Introduction)",
         "image_url": "assets/badges/trailblazer_badge.png",
-        "criteria_check_function": "check_trailblazer_badge"
+        "criteria_check_function": "check_trailblazer_badge",
+        "depends_on": ["learning_preferences", "interests"]
     },
     "topic_tackler_numeria_novice": {
         "id": "topic_tackler_numeria_novice",
         "name": "Numeria Novice Tackler",
         "description": "Well done! You've successfully navigated the initial challenges of Numeria!",
         "image_url": "assets/badges/topic_tackler_badge.png", # Using generic Topic Tackler image
-        "criteria_check_function": "check_topic_tackler_numeria_novice_badge"
+        "criteria_check_function": "check_topic_tackler_numeria_novice_badge",
+        "depends_on": ["completed_los"]
     },
     "quest_completer_intro": {
         "id": "quest_completer_intro",
         "name": "Introductory Quest Completer",
         "description": "You've completed your first full quest! Adventure awaits!",
         "image_url": "assets/badges/quest_completer_badge.png",
-        "criteria_check_function": "check_quest_completer_intro_badge"
+        "criteria_check_function": "check_quest_completer_intro_badge",
+        "depends_on": ["completed_los"]
     },
     "curiosity_spark": {
         "id": "curiosity_spark",
         "name": "Curiosity Spark",
         "description": "Your curiosity is shining bright! You've explored beyond the beaten path!",
         "image_url": "assets/badges/curiosity_spark_badge.png",
-        "criteria_check_function": "check_curiosity_spark_badge"
+        "criteria_check_function": "check_curiosity_spark_badge",
+        "depends_on": ["cognitive_metrics"]
     },
     "helping_hand": {
         "id": "helping_hand",
         "name": "Helping Hand",
         "description": "Well done for identifying areas to grow! Understanding your learning is a superpower!",
         "image_url": "assets/badges/helping_hand_badge.png",
-        "criteria_check_function": "check_helping_hand_badge"
+        "criteria_check_function": "check_helping_hand_badge",
+        "depends_on": ["struggle_areas"]
     }
 }
 
-class LearnerProfile:
-    """Represents a learner's profile, storing their preferences, progress, and achievements.
+class RecentContentHistory:
+    """A fixed-size ring buffer of the content IDs most recently served to a learner.
+
+    Recording an ID overwrites the oldest one once the buffer is full. The sequence number of
+    each ID's latest recording is kept alongside, which makes `content_id in history` and
+    `served_order` O(1) checks, so pathway selection can skip recently served items without
+    scanning the learner's activity history.
 
     Attributes:
-        student_id (str): The unique identifier for the student.
-        learning_preferences (dict): Stores preferences like {"visual_task_1": "visual"}.
-        interests (list): A list of the learner's interests.
-        struggle_areas (list): A list of areas where the learner struggles.
-        cognitive_metrics (dict): Stores metrics from diagnostic tasks, e.g., {"story_weaver": {"accuracy": 0.8}}.
-        completed_los (set): A set of completed Learning Objective IDs.
-        current_learning_objective_id (str | None): The ID of the current LO the learner is working on.
-        earned_badges_data (dict): Stores detailed data for earned badges, keyed by badge_id.
+        capacity (int): Maximum number of IDs remembered.
     """
-    def __init__(self, student_id: str):
-        """Initializes the LearnerProfile with a student ID.
+    __slots__ = ("capacity", "_buffer", "_recorded", "_latest")
+
+    def __init__(self, capacity: int = RECENT_CONTENT_HISTORY_SIZE, content_ids: Iterable[str] = ()):
+        """Initializes the history, optionally with previously served IDs.
 
         Args:
-            student_id (str): The unique identifier for the student.
+            capacity (int, optional): Maximum number of IDs remembered. Defaults to RECENT_CONTENT_HISTORY_SIZE.
+            content_ids (Iterable[str], optional): IDs to record, oldest first (e.g. from `to_list`). Defaults to ().
         """
-        self.student_id = student_id
-        self.learning_preferences = {} # Stores preferences like {"visual_task_1": "visual"}
-        self.interests = []
-        self.struggle_areas = []
-        self.cognitive_metrics = {} # For new diagnostic tasks e.g. {"story_weaver": {"accuracy": 0.8}}
-        self.completed_los = set()  # For tracking completed Learning Objectives
-        self.current_learning_objective_id = None # Added for pathway tracking
-        self.game_scores = {} # Added to resolve AttributeError
-        # Stores detailed data for earned badges, keyed by badge_id
-        # Example: {"trailblazer": {"id": "trailblazer", "name": "Trailblazer", ..., "date_earned": "..."}}
-        self.earned_badges_data = {} 
-        logger.info(f"LearnerProfile initialized for student_id: {student_id}")
-        
+        self.capacity = max(1, capacity)
+        self._buffer: List[str] = []
+        self._recorded = 0 # IDs recorded so far; the n-th is stored in slot n % capacity
+        self._latest: Dict[str, int] = {} # content ID -> sequence number of its latest recording
+        for content_id in content_ids:
+            self.record(content_id)
+
+    def record(self, content_id: str) -> None:
+        """Records a served content ID, evicting the oldest one if the history is full.
+
+        Args:
+            content_id (str): The content ID.
+        """
+        slot = self._recorded % self.capacity
+        if len(self._buffer) < self.capacity:
+            self._buffer.append(content_id)
+        else:
+            evicted = self._buffer[slot]
+            if self._latest[evicted] == self._recorded - self.capacity: # Not recorded again since
+                del self._latest[evicted]
+            self._buffer[slot] = content_id
+        self._latest[content_id] = self._recorded
+        self._recorded += 1
+
+    def served_order(self, content_id: str) -> int:
+        """Returns when an ID was last recorded, for ordering repeats (least recently served first).
+
+        Args:
+            content_id (str): The content ID.
+
+        Returns:
+            int: A number that is larger the more recently the ID was recorded; -1 if it is not in the history.
+        """
+        return self._latest.get(content_id, -1)
+
+    def __contains__(self, content_id: object) -> bool:
+        return content_id in self._latest
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def to_list(self) -> List[str]:
+        """Returns the remembered IDs, oldest first.
+
+        Returns:
+            List[str]: The content IDs.
+        """
+        oldest = self._recorded % self.capacity if len(self._buffer) == self.capacity else 0
+        return self._buffer[oldest:] + self._buffer[:oldest]
+
+
+class LearnerProfileBase:
+    """Behaviour shared by `LearnerProfile` and `CompactLearnerProfile`.
+
+    Subclasses provide the `student_id`, `learning_preferences`, `cognitive_metrics`,
+    `earned_badges_data` and `recent_content` attributes; everything that only reads or writes
+    those lives here.
+
+    Every mutating method reports the name of the `to_dict` field it changed to the class's
+    `badge_engine` and then to the profile's change listeners (see `add_change_listener`), which
+    is how badges get awarded and persistence stores know what to write without callers having
+    to tell them.
+    """
+    __slots__ = ("_change_listeners",)
+
+    badge_engine: Optional["BadgeEngine"] = None
+    """Engine re-evaluating subscribed badges after each mutation (set to `default_badge_engine`
+    once it is defined below); None disables automatic badge awards."""
+
+    def add_change_listener(self, listener: Callable[["LearnerProfileBase", str], None]) -> None:
+        """Registers a callable invoked as `listener(profile, field_name)` after every mutation.
+
+        Args:
+            listener (Callable[[LearnerProfileBase, str], None]): The callable to register.
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners = self._change_listeners + (listener,)
+
+    def remove_change_listener(self, listener: Callable[["LearnerProfileBase", str], None]) -> None:
+        """Unregisters a change listener; does nothing if it was not registered.
+
+        Args:
+            listener (Callable[[LearnerProfileBase, str], None]): The callable to remove.
+        """
+        self._change_listeners = tuple(registered for registered in self._change_listeners if registered != listener)
+
+    def _notify_change(self, field_name: str) -> None:
+        """Reports a mutation of `field_name` to the badge engine and every registered change listener."""
+        if self.badge_engine is not None:
+            self.badge_engine.on_profile_changed(self, field_name)
+        for listener in self._change_listeners:
+            listener(self, field_name)
+
     @property
     def learner_id(self) -> str:
         """Returns the student_id as learner_id for compatibility with other modules.
@@ -119,6 +207,86 @@ class LearnerProfile:
         """
         return self.earned_badges_data
 
+    def update_preference(self, task_name: str, preference: str) -> None:
+        """Updates a learning preference based on a diagnostic task.
+
+        Args:
+            task_name (str): The name of the diagnostic task (e.g., "visual_preference_task_1").
+            preference (str): The preference identified (e.g., "visual", "non-visual").
+        """
+        self.learning_preferences[task_name] = preference
+        logger.info("Profile for %s: Preference for %s updated to %s", self.student_id, task_name, preference)
+        self._notify_change("learning_preferences")
+
+    def add_cognitive_metric(self, task_name: str, metric_name: str, value: Any) -> None:
+        """Adds a metric from a sophisticated diagnostic task or simple preference tasks.
+
+        Args:
+            task_name (str): The name of the task (e.g., "story_weaver").
+            metric_name (str): The name of the metric (e.g., "accuracy", "attempts").
+            value (Any): The value of the metric.
+        """
+        if task_name not in self.cognitive_metrics:
+            self.cognitive_metrics[task_name] = {}
+        self.cognitive_metrics[task_name][metric_name] = value
+        logger.info("Profile for %s: Cognitive metric for %s - %s updated to %s", self.student_id, task_name, metric_name, value)
+        self._notify_change("cognitive_metrics")
+
+    def add_badge(self, badge_id: str) -> bool:
+        """Adds a badge to the profile if not already earned, storing its details.
+
+        If the badge is successfully added (i.e., it was not already earned and the
+        badge definition exists), its details (including name, description, image URL,
+        and earned date) are stored in `self.earned_badges_data`.
+
+        Args:
+            badge_id (str): The unique identifier of the badge to add (e.g., "trailblazer").
+
+        Returns:
+            bool: True if the badge was successfully added, False otherwise (e.g., if already
+                  earned or badge definition not found).
+        """
+        if badge_id not in self.earned_badges_data:
+            badge_definition = BADGE_DEFINITIONS.get(badge_id)
+            if not badge_definition:
+                logger.error("Badge definition for %s not found.", badge_id)
+                return False
+            
+            earned_badge_info = badge_definition.copy() # Start with all definition info
+            earned_badge_info["date_earned"] = datetime.datetime.utcnow().isoformat() + "Z"
+            
+            self.earned_badges_data[badge_id] = earned_badge_info
+            logger.info("Profile for %s: Badge '%s' earned!", self.student_id, earned_badge_info['name'])
+            self._notify_change("earned_badges_data")
+            return True
+        return False
+
+    def record_served_content(self, content_ids: Iterable[str]) -> None:
+        """Adds content IDs served to the learner (e.g. in a new pathway) to their recent history.
+
+        Args:
+            content_ids (Iterable[str]): The served content IDs, in the order they were served.
+        """
+        content_ids = list(content_ids)
+        if not content_ids:
+            return
+        if self.recent_content is None:
+            self.recent_content = RecentContentHistory()
+        for content_id in content_ids:
+            self.recent_content.record(content_id)
+        self._notify_change("recent_content_ids")
+
+    def has_badge(self, badge_id: str) -> bool:
+        """Checks if a specific badge has been earned by the learner.
+
+        Args:
+            badge_id (str): The unique identifier of the badge to check.
+
+        Returns:
+            bool: True if the badge has been earned, False otherwise.
+        """
+        return badge_id in self.earned_badges_data
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the learner profile for serialization.
 
@@ -133,20 +301,74 @@ class LearnerProfile:
             "interests": self.interests,
             "struggle_areas": self.struggle_areas,
             "cognitive_metrics": self.cognitive_metrics,
-            "completed_los": list(self.completed_los),  # Convert set to list for JSON
+            "completed_los": sorted(self.completed_los),  # Sorted list for JSON, so the output does not depend on set order
             "current_learning_objective_id": self.current_learning_objective_id,
-            "earned_badges_data": self.earned_badges_data
+            "earned_badges_data": self.earned_badges_data,
+            "recent_content_ids": self.recent_content.to_list() if self.recent_content is not None else []
         }
 
-    def update_preference(self, task_name: str, preference: str) -> None:
-        """Updates a learning preference based on a diagnostic task.
+
+class LearnerProfile(LearnerProfileBase):
+    """Represents a learner's profile, storing their preferences, progress, and achievements.
+
+    Attributes:
+        student_id (str): The unique identifier for the student.
+        learning_preferences (dict): Stores preferences like {"visual_task_1": "visual"}.
+        interests (list): A list of the learner's interests.
+        struggle_areas (list): A list of areas where the learner struggles.
+        cognitive_metrics (dict): Stores metrics from diagnostic tasks, e.g., {"story_weaver": {"accuracy": 0.8}}.
+        completed_los (set): A set of completed Learning Objective IDs.
+        current_learning_objective_id (str | None): The ID of the current LO the learner is working on.
+        earned_badges_data (dict): Stores detailed data for earned badges, keyed by badge_id.
+        eligibility_tracker (EligibilityTracker | None): Incremental prerequisite tracker attached by the
+                                                         DCW-APG module; kept in step by `mark_lo_completed`.
+        recent_content (RecentContentHistory | None): Content recently served to the learner; created by
+                                                      the first `record_served_content` call.
+    """
+    def __init__(self, student_id: str):
+        """Initializes the LearnerProfile with a student ID.
 
         Args:
-            task_name (str): The name of the diagnostic task (e.g., "visual_preference_task_1").
-            preference (str): The preference identified (e.g., "visual", "non-visual").
+            student_id (str): The unique identifier for the student.
         """
-        self.learning_preferences[task_name] = preference
-        logger.info(f"Profile for {self.student_id}: Preference for {task_name} updated to {preference}")
+        self.student_id = student_id
+        self.learning_preferences = {} # Stores preferences like {"visual_task_1": "visual"}
+        self.interests = []
+        self.struggle_areas = []
+        self.cognitive_metrics = {} # For new diagnostic tasks e.g. {"story_weaver": {"accuracy": 0.8}}
+        self.completed_los = set()  # For tracking completed Learning Objectives
+        self.current_learning_objective_id = None # Added for pathway tracking
+        self.game_scores = {} # Added to resolve AttributeError
+        # Stores detailed data for earned badges, keyed by badge_id
+        # Example: {"trailblazer": {"id": "trailblazer", "name": "Trailblazer", ..., "date_earned": "..."}}
+        self.earned_badges_data = {} 
+        self.recent_content = None
+        # Not serialized: rebuilt on demand from completed_los and the curriculum's prerequisite graph
+        self.eligibility_tracker = None
+        self._change_listeners = ()
+        logger.info("LearnerProfile initialized for student_id: %s", student_id)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LearnerProfile":
+        """Rebuilds a learner profile from the output of `to_dict`.
+
+        Args:
+            data (Dict[str, Any]): A dictionary as produced by `to_dict`.
+
+        Returns:
+            LearnerProfile: The restored profile.
+        """
+        profile = cls(data["student_id"])
+        profile.learning_preferences = dict(data.get("learning_preferences", {}))
+        profile.interests = list(data.get("interests", []))
+        profile.struggle_areas = list(data.get("struggle_areas", []))
+        profile.cognitive_metrics = {task: dict(metrics) for task, metrics in data.get("cognitive_metrics", {}).items()}
+        profile.completed_los = set(data.get("completed_los", []))
+        profile.current_learning_objective_id = data.get("current_learning_objective_id")
+        profile.earned_badges_data = dict(data.get("earned_badges_data", {}))
+        if data.get("recent_content_ids"):
+            profile.recent_content = RecentContentHistory(content_ids=data["recent_content_ids"])
+        return profile
 
     def add_interest(self, interest: str) -> None:
         """Adds an interest to the profile if it's not already present.
@@ -156,7 +378,8 @@ class LearnerProfile:
         """
         if interest not in self.interests:
             self.interests.append(interest)
-            logger.info(f"Profile for {self.student_id}: Interest '{interest}' added.")
+            logger.info("Profile for %s: Interest '%s' added.", self.student_id, interest)
+            self._notify_change("interests")
 
     def add_struggle_area(self, area: str) -> None:
         """Adds a struggle area to the profile if it's not already present.
@@ -166,35 +389,25 @@ class LearnerProfile:
         """
         if area not in self.struggle_areas:
             self.struggle_areas.append(area)
-            logger.info(f"Profile for {self.student_id}: Struggle area '{area}' added.")
-
-    def add_cognitive_metric(self, task_name: str, metric_name: str, value: Any) -> None:
-        """Adds a metric from a sophisticated diagnostic task or simple preference tasks.
-
-        Args:
-            task_name (str): The name of the task (e.g., "story_weaver").
-            metric_name (str): The name of the metric (e.g., "accuracy", "attempts").
-            value (Any): The value of the metric.
-        """
-        if task_name not in self.cognitive_metrics:
-            self.cognitive_metrics[task_name] = {}
-        self.cognitive_metrics[task_name][metric_name] = value
-        logger.info(f"Profile for {self.student_id}: Cognitive metric for {task_name} - {metric_name} updated to {value}")
+            logger.info("Profile for %s: Struggle area '%s' added.", self.student_id, area)
+            self._notify_change("struggle_areas")
 
     def mark_lo_completed(self, lo_id: str) -> None:
         """Marks a Learning Objective (LO) as completed for the learner.
 
-        If the LO is successfully marked as completed, it also triggers a check
-        for any relevant badges that might be awarded due to this completion.
+        If the LO is successfully marked as completed, it also unlocks its dependents in the
+        attached eligibility tracker (if any) and reports the change, so the badge engine
+        re-evaluates the badges that depend on completed LOs.
 
         Args:
             lo_id (str): The unique identifier of the Learning Objective to mark as completed.
         """
         if lo_id not in self.completed_los:
             self.completed_los.add(lo_id)
-            logger.info(f"Profile for {self.student_id}: Learning Objective \'{lo_id}\' marked as completed.")
-            # Potentially trigger badge check here
-            check_and_award_all_relevant_badges(self) # Assuming curriculum_store might be needed later
+            if self.eligibility_tracker is not None:
+                self.eligibility_tracker.mark_completed(lo_id)
+            logger.info("Profile for %s: Learning Objective '%s' marked as completed.", self.student_id, lo_id)
+            self._notify_change("completed_los") # Lets the badge engine check LO-based badges
 
     def has_completed_lo(self, lo_id: str) -> bool:
         """Checks if a specific Learning Objective (LO) has been completed by the learner.
@@ -207,63 +420,254 @@ class LearnerProfile:
         """
         return lo_id in self.completed_los
 
-    def add_badge(self, badge_id: str) -> bool:
-        """Adds a badge to the profile if not already earned, storing its details.
+    def __str__(self) -> str:
+        """Returns a string representation of the LearnerProfile object.
 
-        If the badge is successfully added (i.e., it was not already earned and the
-        badge definition exists), its details (including name, description, image URL,
-        and earned date) are stored in `self.earned_badges_data`.
+        This is primarily for debugging and logging purposes.
+
+        Returns:
+            str: A string summarizing the learner profile's attributes.
+        """
+        earned_badges_summary = {bid: data.get('name', bid) for bid, data in self.earned_badges_data.items()}
+        return (
+            f"LearnerProfile(student_id='{self.student_id}', "
+            f"preferences={self.learning_preferences}, "
+            f"interests={self.interests}, "
+            f"struggle_areas={self.struggle_areas}, "
+            f"cognitive_metrics={self.cognitive_metrics}, "
+            f"completed_los={self.completed_los}, "
+            f"earned_badges_data={earned_badges_summary})"
+        )
+
+class CompactLearnerProfile(LearnerProfileBase):
+    """A memory-compact learner profile for large rosters held in memory.
+
+    Behaves like `LearnerProfile` for pathway generation and badge checks, but stores its state
+    in `__slots__` and packs the bulky parts:
+
+    * Interests and struggle areas are stored as byte strings of indices into
+      `PREDEFINED_INTERESTS` / `PREDEFINED_STRUGGLE_AREAS`.
+    * Completed LOs are stored as an integer bitset keyed by each LO's index in `lo_catalog`
+      (usually the content store's `PrerequisiteGraph`), which lists eligible LOs for the bitset
+      directly (`PrerequisiteGraph.eligible_lo_ids_for_bits`).
+
+    Values outside those catalogues (custom interests, LOs from another curriculum) are kept in
+    a small overflow dictionary that only exists when needed. `interests`, `struggle_areas` and
+    `completed_los` are decoded on access and are read-only; use the `add_*`/`mark_*` methods.
+
+    Attributes:
+        student_id (str): The unique identifier for the student.
+        learning_preferences (dict): Stores preferences like {"visual_task_1": "visual"}.
+        cognitive_metrics (dict): Stores metrics from diagnostic tasks.
+        completed_lo_bits (int): Bitset of completed LOs, indexed by `lo_catalog.lo_index`.
+        lo_catalog (Any): Object exposing `lo_ids` and `lo_index` (e.g. a `PrerequisiteGraph`).
+        current_learning_objective_id (str | None): The ID of the current LO the learner is working on.
+        earned_badges_data (dict): Stores detailed data for earned badges, keyed by badge_id.
+        eligibility_tracker (EligibilityTracker | None): Incremental prerequisite tracker, if attached.
+        recent_content (RecentContentHistory | None): Content recently served to the learner, if any.
+    """
+    __slots__ = (
+        "student_id", "learning_preferences", "cognitive_metrics", "completed_lo_bits", "lo_catalog",
+        "current_learning_objective_id", "earned_badges_data", "eligibility_tracker", "recent_content",
+        "_interest_codes", "_struggle_codes", "_overflow"
+    )
+
+    def __init__(self, student_id: str, lo_catalog: Any):
+        """Initializes an empty compact profile.
 
         Args:
-            badge_id (str): The unique identifier of the badge to add (e.g., "trailblazer").
+            student_id (str): The unique identifier for the student.
+            lo_catalog (Any): Object exposing `lo_ids` (list) and `lo_index` (dict of LO ID to position),
+                              shared by every profile of the roster.
+        """
+        self.student_id = student_id
+        self.learning_preferences: Dict[str, str] = {}
+        self.cognitive_metrics: Dict[str, Dict[str, Any]] = {}
+        self.completed_lo_bits = 0
+        self.lo_catalog = lo_catalog
+        self.current_learning_objective_id: Optional[str] = None
+        self.earned_badges_data: Dict[str, Any] = {}
+        self.eligibility_tracker = None
+        self.recent_content: Optional[RecentContentHistory] = None
+        self._change_listeners = ()
+        self._interest_codes = b""
+        self._struggle_codes = b""
+        self._overflow: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], lo_catalog: Any) -> "CompactLearnerProfile":
+        """Builds a compact profile from the output of `to_dict` (of either profile class).
+
+        Args:
+            data (Dict[str, Any]): A dictionary as produced by `to_dict`.
+            lo_catalog (Any): The LO catalogue to index completed LOs against.
 
         Returns:
-            bool: True if the badge was successfully added, False otherwise (e.g., if already
-                  earned or badge definition not found).
+            CompactLearnerProfile: The compact profile.
         """
-        if badge_id not in self.earned_badges_data:
-            badge_definition = BADGE_DEFINITIONS.get(badge_id)
-            if not badge_definition:
-                logger.error(f"Badge definition for {badge_id} not found.")
+        profile = cls(data["student_id"], lo_catalog)
+        profile.learning_preferences = dict(data.get("learning_preferences", {}))
+        profile.cognitive_metrics = {task: dict(metrics) for task, metrics in data.get("cognitive_metrics", {}).items()}
+        profile.current_learning_objective_id = data.get("current_learning_objective_id")
+        profile.earned_badges_data = dict(data.get("earned_badges_data", {}))
+        if data.get("recent_content_ids"):
+            profile.recent_content = RecentContentHistory(content_ids=data["recent_content_ids"])
+        for interest in data.get("interests", []):
+            profile._add_coded_value("interests", interest, INTEREST_CODES)
+        for area in data.get("struggle_areas", []):
+            profile._add_coded_value("struggle_areas", area, STRUGGLE_AREA_CODES)
+        for lo_id in data.get("completed_los", []):
+            profile._set_lo_completed(lo_id)
+        return profile
+
+    @classmethod
+    def from_profile(cls, profile: LearnerProfile, lo_catalog: Any) -> "CompactLearnerProfile":
+        """Converts a `LearnerProfile` into a compact profile.
+
+        Args:
+            profile (LearnerProfile): The profile to convert.
+            lo_catalog (Any): The LO catalogue to index completed LOs against.
+
+        Returns:
+            CompactLearnerProfile: The compact profile.
+        """
+        return cls.from_dict(profile.to_dict(), lo_catalog)
+
+    def to_profile(self) -> LearnerProfile:
+        """Expands this profile back into a regular `LearnerProfile`.
+
+        Returns:
+            LearnerProfile: An equivalent regular profile.
+        """
+        return LearnerProfile.from_dict(self.to_dict())
+
+    def _overflow_list(self, field: str) -> List[Any]:
+        """Returns the overflow list for `field`, creating the overflow dictionary if needed."""
+        if self._overflow is None:
+            self._overflow = {}
+        return self._overflow.setdefault(field, [])
+
+    def _add_coded_value(self, field: str, value: str, codes: Dict[str, int]) -> bool:
+        """Adds an interest or struggle area as a code, or to the overflow if it has no code.
+
+        Returns:
+            bool: True if the value was added, False if it was already present.
+        """
+        code = codes.get(value)
+        attribute = "_interest_codes" if field == "interests" else "_struggle_codes"
+        if code is not None and code < 256: # Codes must fit in a byte
+            current = getattr(self, attribute)
+            if code in current:
                 return False
-            
-            earned_badge_info = badge_definition.copy() # Start with all definition info
-            earned_badge_info["date_earned"] = datetime.datetime.utcnow().isoformat() + "Z"
-            
-            self.earned_badges_data[badge_id] = earned_badge_info
-            logger.info(f"Profile for {self.student_id}: Badge '{earned_badge_info['name']}' earned!")
+            setattr(self, attribute, current + bytes((code,)))
             return True
-        return False
+        overflow = self._overflow_list(field)
+        if value in overflow:
+            return False
+        overflow.append(value)
+        return True
+
+    def _set_lo_completed(self, lo_id: str) -> bool:
+        """Records a completed LO in the bitset (or overflow). Returns True if it was newly completed."""
+        index = self.lo_catalog.lo_index.get(lo_id)
+        if index is not None:
+            bit = 1 << index
+            if self.completed_lo_bits & bit:
+                return False
+            self.completed_lo_bits |= bit
+            return True
+        overflow = self._overflow_list("completed_los")
+        if lo_id in overflow:
+            return False
+        overflow.append(lo_id)
+        return True
 
-    def has_badge(self, badge_id: str) -> bool:
-        """Checks if a specific badge has been earned by the learner.
+    @property
+    def interests(self) -> List[str]:
+        """List[str]: The learner's interests (decoded copy)."""
+        decoded = [PREDEFINED_INTERESTS[code] for code in self._interest_codes]
+        if self._overflow and "interests" in self._overflow:
+            decoded.extend(self._overflow["interests"])
+        return decoded
+
+    @property
+    def struggle_areas(self) -> List[str]:
+        """List[str]: The learner's struggle areas (decoded copy)."""
+        decoded = [PREDEFINED_STRUGGLE_AREAS[code] for code in self._struggle_codes]
+        if self._overflow and "struggle_areas" in self._overflow:
+            decoded.extend(self._overflow["struggle_areas"])
+        return decoded
+
+    @property
+    def completed_los(self) -> FrozenSet[str]:
+        """FrozenSet[str]: IDs of the completed LOs (decoded copy)."""
+        bits = self.completed_lo_bits
+        lo_ids = self.lo_catalog.lo_ids
+        completed = [lo_ids[index] for index in range(bits.bit_length()) if bits >> index & 1]
+        if self._overflow and "completed_los" in self._overflow:
+            completed.extend(self._overflow["completed_los"])
+        return frozenset(completed)
+
+    def add_interest(self, interest: str) -> None:
+        """Adds an interest to the profile if it's not already present.
 
         Args:
-            badge_id (str): The unique identifier of the badge to check.
+            interest (str): The interest to add (e.g., "Space Exploration").
+        """
+        if self._add_coded_value("interests", interest, INTEREST_CODES):
+            logger.info("Profile for %s: Interest '%s' added.", self.student_id, interest)
+            self._notify_change("interests")
+
+    def add_struggle_area(self, area: str) -> None:
+        """Adds a struggle area to the profile if it's not already present.
+
+        Args:
+            area (str): The struggle area to add (e.g., "Understanding fractions").
+        """
+        if self._add_coded_value("struggle_areas", area, STRUGGLE_AREA_CODES):
+            logger.info("Profile for %s: Struggle area '%s' added.", self.student_id, area)
+            self._notify_change("struggle_areas")
+
+    def mark_lo_completed(self, lo_id: str) -> None:
+        """Marks a Learning Objective (LO) as completed, then updates eligibility and reports the change.
+
+        Args:
+            lo_id (str): The unique identifier of the Learning Objective to mark as completed.
+        """
+        if self._set_lo_completed(lo_id):
+            if self.eligibility_tracker is not None:
+                self.eligibility_tracker.mark_completed(lo_id)
+            logger.info("Profile for %s: Learning Objective '%s' marked as completed.", self.student_id, lo_id)
+            self._notify_change("completed_los")
+
+    def has_completed_lo(self, lo_id: str) -> bool:
+        """Checks if a specific Learning Objective (LO) has been completed by the learner.
+
+        Args:
+            lo_id (str): The unique identifier of the Learning Objective to check.
 
         Returns:
-            bool: True if the badge has been earned, False otherwise.
+            bool: True if the LO has been completed, False otherwise.
         """
-        return badge_id in self.earned_badges_data
+        index = self.lo_catalog.lo_index.get(lo_id)
+        if index is not None:
+            return bool(self.completed_lo_bits >> index & 1)
+        return bool(self._overflow) and lo_id in self._overflow.get("completed_los", ())
 
-    def __str__(self) -> str:
-        """Returns a string representation of the LearnerProfile object.
+    def has_completed_all(self, lo_mask: int) -> bool:
+        """Checks if every LO in a bitmask (e.g. a prerequisite mask) has been completed.
 
-        This is primarily for debugging and logging purposes.
+        Args:
+            lo_mask (int): Bitmask of LO indices in `lo_catalog`.
 
         Returns:
-            str: A string summarizing the learner profile's attributes.
+            bool: True if all LOs in the mask are completed.
         """
-        earned_badges_summary = {bid: data.get('name', bid) for bid, data in self.earned_badges_data.items()}
-        return (
-            f"LearnerProfile(student_id='{self.student_id}', "
-            f"preferences={self.learning_preferences}, "
-            f"interests={self.interests}, "
-            f"struggle_areas={self.struggle_areas}, "
-            f"cognitive_metrics={self.cognitive_metrics}, "
-            f"completed_los={self.completed_los}, "
-            f"earned_badges_data={earned_badges_summary})"
-        )
+        return self.completed_lo_bits & lo_mask == lo_mask
+
+    def __str__(self) -> str:
+        """Returns a string representation of the profile for debugging and logging purposes."""
+        return f"CompactLearnerProfile(student_id='{self.student_id}', completed_los={len(self.completed_los)}, badges={list(self.earned_badges_data)})"
 
 # --- Badge Criteria Checking Functions ---
 
@@ -349,10 +753,127 @@ def check_helping_hand_badge(learner_profile: LearnerProfile, curriculum_store:
     """
     return bool(learner_profile.struggle_areas)
 
+# --- Badge Criteria Registry ---
+
+class BadgeCriteriaError(ValueError):
+    """Raised when a badge definition names a criteria function that is not registered."""
+
+
+class BoundBadgeCriteria:
+    """A criteria function resolved once, with whether it takes a `curriculum_store` already known.
+
+    Calling it evaluates the criteria; exceptions raised by the function are logged and count as
+    "criteria not met", as they always have.
+
+    Attributes:
+        name (str): The registered name (the `criteria_check_function` value in badge definitions).
+        function (Callable[..., bool]): The criteria function.
+        accepts_curriculum_store (bool): Whether `function` takes a `curriculum_store` argument.
+    """
+    __slots__ = ("name", "function", "accepts_curriculum_store")
+
+    def __init__(self, name: str, function: Callable[..., bool]):
+        self.name = name
+        self.function = function
+        self.accepts_curriculum_store = "curriculum_store" in inspect.signature(function).parameters
+
+    def __call__(self, learner_profile: LearnerProfileBase, curriculum_store: Optional[Any] = None) -> bool:
+        try:
+            if self.accepts_curriculum_store:
+                return self.function(learner_profile, curriculum_store=curriculum_store)
+            return self.function(learner_profile)
+        except Exception as e:
+            logger.error("Error executing badge criteria function %s: %s", self.name, e)
+            return False
+
+
+class BadgeCriteriaRegistry:
+    """Dispatch table from `criteria_check_function` names to ready-to-call `BoundBadgeCriteria`.
+
+    Functions are inspected once when registered, and `bind_definitions` resolves a whole badge
+    catalogue up front, so a definition naming a missing function fails at startup rather than
+    being logged (and skipped) on every evaluation.
+    """
+
+    def __init__(self):
+        self._criteria: Dict[str, BoundBadgeCriteria] = {}
+
+    def register(self, function: Callable[..., bool], name: Optional[str] = None) -> BoundBadgeCriteria:
+        """Registers a criteria function, replacing any previous one with the same name.
+
+        Args:
+            function (Callable[..., bool]): Takes the learner profile and, optionally, `curriculum_store`.
+            name (Optional[str], optional): The name badge definitions refer to. Defaults to `function.__name__`.
+
+        Returns:
+            BoundBadgeCriteria: The bound criteria.
+        """
+        bound = BoundBadgeCriteria(name or function.__name__, function)
+        self._criteria[bound.name] = bound
+        return bound
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._criteria
+
+    def get(self, name: str) -> BoundBadgeCriteria:
+        """Returns the bound criteria registered under `name`.
+
+        Raises:
+            BadgeCriteriaError: If no criteria function is registered under `name`.
+        """
+        bound = self._criteria.get(name)
+        if bound is None:
+            raise BadgeCriteriaError(f"Criteria check function '{name}' is not registered.")
+        return bound
+
+    def bind_definitions(self, badge_definitions: Dict[str, Dict[str, Any]]) -> Dict[str, BoundBadgeCriteria]:
+        """Resolves the criteria function of every badge in a catalogue.
+
+        Badges without a `criteria_check_function` are skipped with a warning (they can only be
+        awarded explicitly).
+
+        Args:
+            badge_definitions (Dict[str, Dict[str, Any]]): The badge catalogue.
+
+        Returns:
+            Dict[str, BoundBadgeCriteria]: The bound criteria by badge ID.
+
+        Raises:
+            BadgeCriteriaError: If any badge names an unregistered criteria function.
+        """
+        bound_by_badge: Dict[str, BoundBadgeCriteria] = {}
+        missing = []
+        for badge_id, definition in badge_definitions.items():
+            name = definition.get("criteria_check_function")
+            if not name:
+                logger.warning("No criteria_check_function defined for badge '%s'; it will never be awarded.", badge_id)
+            elif name in self._criteria:
+                bound_by_badge[badge_id] = self._criteria[name]
+            else:
+                missing.append(f"{badge_id} -> {name}")
+        if missing:
+            raise BadgeCriteriaError(f"Badge definitions name unregistered criteria functions: {', '.join(missing)}")
+        return bound_by_badge
+
+
+badge_criteria_registry = BadgeCriteriaRegistry()
+for _criteria_function in (
+    check_trailblazer_badge,
+    check_topic_tackler_numeria_novice_badge,
+    check_quest_completer_intro_badge,
+    check_curiosity_spark_badge,
+    check_helping_hand_badge
+):
+    badge_criteria_registry.register(_criteria_function)
+badge_criteria_registry.bind_definitions(BADGE_DEFINITIONS) # Fail at import if a definition names a missing function
+
 # --- Badge Awarding Logic ---
 
+# Criteria function names already reported as unregistered, so each is only warned about once
+_reported_unregistered_criteria: Set[str] = set()
+
 def _execute_badge_criteria_check(check_function_name: str, learner_profile: LearnerProfile, curriculum_store: Optional[Any] = None) -> bool:
-    """Dynamically executes a badge criteria checking function.
+    """Executes a registered badge criteria checking function by name.
 
     Args:
         check_function_name (str): The name of the criteria checking function.
@@ -360,25 +881,117 @@ def _execute_badge_criteria_check(check_function_name: str, learner_profile: Lea
         curriculum_store (Optional[Any]): The curriculum store, passed if needed by the check function.
 
     Returns:
-        bool: True if criteria are met, False otherwise or if the function is not found.
+        bool: True if criteria are met, False otherwise or if the function is not registered.
     """
-    if not hasattr(sys.modules[__name__], check_function_name):
-        logger.warning(f"Criteria check function '{check_function_name}' not found in module.")
+    if check_function_name not in badge_criteria_registry:
+        if check_function_name not in _reported_unregistered_criteria:
+            _reported_unregistered_criteria.add(check_function_name)
+            logger.warning("Criteria check function '%s' is not registered.", check_function_name)
+        else:
+            logger.debug("Criteria check function '%s' is not registered.", check_function_name)
         return False
+    return badge_criteria_registry.get(check_function_name)(learner_profile, curriculum_store)
 
-    check_function = getattr(sys.modules[__name__], check_function_name)
-    sig = inspect.signature(check_function)
+class BadgeEngine:
+    """Awards badges in response to profile mutations instead of re-checking the whole catalogue.
 
-    try:
-        # Check if 'curriculum_store' is an expected parameter by the specific check_function
-        if "curriculum_store" in sig.parameters:
-            return check_function(learner_profile, curriculum_store=curriculum_store)
-        else:
-            # If 'curriculum_store' is not a parameter, call without it
-            return check_function(learner_profile)
-    except Exception as e:
-        logger.error(f"Error executing badge criteria function {check_function_name}: {e}")
-        return False
+    The badge catalogue is indexed once by the profile fields listed in each definition's
+    `depends_on`, so a mutation only re-evaluates the not-yet-earned badges subscribed to the
+    field that changed: the cost of a mutation grows with that field's subscribers, not with
+    the size of the catalogue.
+    Badges without `depends_on` are re-evaluated after every mutation.
+
+    Attributes:
+        badge_definitions (Dict[str, Dict[str, Any]]): The badge catalogue.
+        curriculum_store (Optional[Any]): Passed to criteria functions that accept one.
+        criteria_registry (BadgeCriteriaRegistry): Registry the criteria functions were bound from.
+        criteria_by_badge (Dict[str, BoundBadgeCriteria]): Bound criteria per badge ID.
+        badges_by_field (Dict[str, Tuple[str, ...]]): Badge IDs to re-evaluate per changed field,
+                                                      including the unscoped badges.
+        unscoped_badges (Tuple[str, ...]): Badge IDs without `depends_on`.
+    """
+
+    def __init__(
+        self,
+        badge_definitions: Optional[Dict[str, Dict[str, Any]]] = None,
+        curriculum_store: Optional[Any] = None,
+        criteria_registry: Optional[BadgeCriteriaRegistry] = None
+    ):
+        """Binds each badge's criteria and indexes the catalogue by the fields each badge depends on.
+
+        Args:
+            badge_definitions (Optional[Dict[str, Dict[str, Any]]], optional): The badge catalogue.
+                                                                             Defaults to BADGE_DEFINITIONS.
+            curriculum_store (Optional[Any], optional): Passed to criteria functions. Defaults to None.
+            criteria_registry (Optional[BadgeCriteriaRegistry], optional): Resolves criteria function names.
+                                                                          Defaults to badge_criteria_registry.
+
+        Raises:
+            BadgeCriteriaError: If a badge names an unregistered criteria function.
+        """
+        self.badge_definitions = BADGE_DEFINITIONS if badge_definitions is None else badge_definitions
+        self.curriculum_store = curriculum_store
+        self.criteria_registry = badge_criteria_registry if criteria_registry is None else criteria_registry
+        self.criteria_by_badge = self.criteria_registry.bind_definitions(self.badge_definitions)
+
+        scoped: Dict[str, List[str]] = {}
+        unscoped: List[str] = []
+        for badge_id in self.criteria_by_badge:
+            depends_on = self.badge_definitions[badge_id].get("depends_on")
+            if not depends_on:
+                unscoped.append(badge_id)
+                continue
+            for field_name in depends_on:
+                scoped.setdefault(field_name, []).append(badge_id)
+
+        self.unscoped_badges: Tuple[str, ...] = tuple(unscoped)
+        self.badges_by_field: Dict[str, Tuple[str, ...]] = {
+            field_name: tuple(badge_ids) + self.unscoped_badges for field_name, badge_ids in scoped.items()
+        }
+
+    def on_profile_changed(self, learner_profile: LearnerProfileBase, field_name: str) -> None:
+        """Re-evaluates the badges subscribed to `field_name` (called by `LearnerProfileBase._notify_change`).
+
+        Args:
+            learner_profile (LearnerProfileBase): The profile that changed.
+            field_name (str): The name of the field that changed.
+        """
+        self.evaluate(learner_profile, self.badges_by_field.get(field_name, self.unscoped_badges))
+
+    @instrumented("badges.evaluate")
+    def evaluate(self, learner_profile: LearnerProfileBase, badge_ids: Iterable[str]) -> List[str]:
+        """Awards each of the given badges the learner has not earned yet and now qualifies for.
+
+        Args:
+            learner_profile (LearnerProfileBase): The profile to evaluate.
+            badge_ids (Iterable[str]): The badges to evaluate.
+
+        Returns:
+            List[str]: Names of the newly awarded badges.
+        """
+        awarded = []
+        for badge_id in badge_ids:
+            if learner_profile.has_badge(badge_id):
+                continue
+            increment("badges.criteria_checks")
+            if self.criteria_by_badge[badge_id](learner_profile, self.curriculum_store) and learner_profile.add_badge(badge_id):
+                increment("badges.awarded")
+                awarded.append(self.badge_definitions[badge_id]["name"])
+        return awarded
+
+    def evaluate_all(self, learner_profile: LearnerProfileBase) -> List[str]:
+        """Evaluates the whole catalogue, e.g. for a profile loaded from storage after the catalogue changed.
+
+        Args:
+            learner_profile (LearnerProfileBase): The profile to evaluate.
+
+        Returns:
+            List[str]: Names of the newly awarded badges.
+        """
+        return self.evaluate(learner_profile, self.criteria_by_badge)
+
+default_badge_engine = BadgeEngine()
+LearnerProfileBase.badge_engine = default_badge_engine
 
 def award_badge_if_criteria_met(learner_profile: LearnerProfile, badge_id: str, curriculum_store: Optional[Any] = None) -> Optional[Dict[str, Any]]:
     """Awards a specific badge if criteria are met and it hasn't been earned yet.
@@ -404,27 +1017,32 @@ def award_badge_if_criteria_met(learner_profile: LearnerProfile, badge_id: str,
 
     badge_info = BADGE_DEFINITIONS.get(badge_id)
     if not badge_info:
-        logger.warning(f"Badge ID '{badge_id}' not found in BADGE_DEFINITIONS.")
+        logger.warning("Badge ID '%s' not found in BADGE_DEFINITIONS.", badge_id)
         return None
 
     check_function_name = badge_info.get("criteria_check_function")
     if not check_function_name:
-        logger.warning(f"No criteria_check_function defined for badge '{badge_id}'.")
+        logger.warning("No criteria_check_function defined for badge '%s'.", badge_id)
         return None
 
+    increment("badges.criteria_checks")
     criteria_met = _execute_badge_criteria_check(check_function_name, learner_profile, curriculum_store)
             
     if criteria_met:
         if learner_profile.add_badge(badge_id):
+            increment("badges.awarded")
             return badge_info # Return definition of newly awarded badge
     return None
 
+@instrumented("badges.check_all")
 def check_and_award_all_relevant_badges(learner_profile: LearnerProfile, curriculum_store: Optional[Any] = None) -> List[str]:
     """Checks all defined badges and awards them if criteria are met.
 
     Iterates through all badges defined in `BADGE_DEFINITIONS`. For each badge,
     it calls `award_badge_if_criteria_met` to determine if the learner qualifies.
-    Logs newly awarded badges.
+    Logs newly awarded badges. Mutations are already handled incrementally by the
+    `BadgeEngine`; this full sweep is for profiles that did not go through it, e.g.
+    ones loaded from storage after the badge catalogue changed.
 
     Args:
         learner_profile (LearnerProfile): The profile of the learner.
@@ -435,107 +1053,132 @@ def check_and_award_all_relevant_badges(learner_profile: LearnerProfile, curricu
     Returns:
         List[str]: A list of names of badges that were newly awarded in this check.
     """
-    logger.info(f"Checking all relevant badges for {learner_profile.student_id}...")
+    logger.info("Checking all relevant badges for %s...", learner_profile.student_id)
     awarded_badges_in_this_check = []
     for badge_id in BADGE_DEFINITIONS.keys():
         awarded_badge_info = award_badge_if_criteria_met(learner_profile, badge_id, curriculum_store)
         if awarded_badge_info:
             awarded_badges_in_this_check.append(awarded_badge_info['name'])
     if awarded_badges_in_this_check:
-        logger.info(f"Newly awarded badges in this check: {', '.join(awarded_badges_in_this_check)}")
+        logger.info("Newly awarded badges in this check: %s", ', '.join(awarded_badges_in_this_check))
     else:
         logger.info("No new badges awarded in this check.")
     return awarded_badges_in_this_check
 
 # --- Diagnostic Mini-Tasks (Simplified Simulations) ---
 
-def run_visual_preference_task(profile: LearnerProfile) -> Dict[str, Any]:
+def make_session_rng(learner_id: str, session: Optional[str] = None) -> random.Random:
+    """Creates a random generator seeded from a learner ID and a session.
+
+    The seed is taken from a SHA-256 digest rather than `hash()`, so the same learner and session
+    give the same sequence in every process (regardless of PYTHONHASHSEED). Passing the generator
+    to the task simulators, `PathwayGenerator` and the interface generator makes their output
+    reproducible for that learner and session.
+
+    Args:
+        learner_id (str): The learner the request is for.
+        session (Optional[str], optional): Identifies the session or run (e.g. a date or a benchmark
+                                           baseline name). Defaults to None.
+
+    Returns:
+        random.Random: A generator private to this request.
+    """
+    digest = hashlib.sha256(f"{learner_id}\x00{session}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+def run_visual_preference_task(profile: LearnerProfile, rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Simulates a visual preference diagnostic task for the learner.
 
     A random choice is made between "visual" and "textual/auditory".
-    The learner's profile is updated with this preference, and badge checks are triggered.
+    The learner's profile is updated with this preference, which lets the badge engine react.
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         Dict[str, Any]: A dictionary containing a simulated score and the preference value.
                         Example: {"score": 10, "preference": "visual"}
     """
     task_id = "visual_preference_task_1"
-    logger.info(f"Running Visual Preference Task for {profile.student_id}...")
-    simulated_choice = random.choice(["visual", "textual/auditory"])
+    logger.info("Running Visual Preference Task for %s...", profile.student_id)
+    simulated_choice = (rng or random).choice(["visual", "textual/auditory"])
     preference_value = "visual" if simulated_choice == "visual" else "non-visual"
     profile.update_preference(task_id, preference_value)
-    # Trigger badge check after HLP tasks
-    check_and_award_all_relevant_badges(profile)
     return {"score": 10 if preference_value == "visual" else 5, "preference": preference_value}
 
-def run_textual_preference_task(profile: LearnerProfile) -> Dict[str, Any]:
+def run_textual_preference_task(profile: LearnerProfile, rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Simulates a textual preference diagnostic task for the learner.
 
     A random choice is made between "detailed_text" and "summary_bullets".
-    The learner's profile is updated with this preference, and badge checks are triggered.
+    The learner's profile is updated with this preference, which lets the badge engine react.
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         Dict[str, Any]: A dictionary containing a simulated score and the preference value.
                         Example: {"score": 10, "preference": "detailed_text"}
     """
     task_id = "textual_preference_task_1"
-    logger.info(f"Running Textual Preference Task for {profile.student_id}...")
-    simulated_choice = random.choice(["detailed_text", "summary_bullets"])
+    logger.info("Running Textual Preference Task for %s...", profile.student_id)
+    simulated_choice = (rng or random).choice(["detailed_text", "summary_bullets"])
     preference_value = "detailed_text" if simulated_choice == "detailed_text" else "concise_text"
     profile.update_preference(task_id, preference_value)
-    # Trigger badge check after HLP tasks
-    check_and_award_all_relevant_badges(profile)
     return {"score": 10 if preference_value == "detailed_text" else 5, "preference": preference_value}
 
-def capture_student_interests(profile: LearnerProfile, num_interests_to_select: int = 3) -> List[str]:
+def capture_student_interests(profile: LearnerProfile, num_interests_to_select: int = 3,
+                              rng: Optional[random.Random] = None) -> List[str]:
     """Simulates capturing student interests from a predefined list.
 
     Randomly selects a specified number of interests from `PREDEFINED_INTERESTS`
-    and adds them to the learner's profile. Triggers badge checks afterwards.
+    and adds them to the learner's profile (the badge engine reacts to the change).
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
         num_interests_to_select (int, optional): The number of interests to randomly select.
                                                  Defaults to 3.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         List[str]: A list of the selected interests that were added to the profile.
     """
-    logger.info(f"Capturing Interests for {profile.student_id}...")
-    selected_interests = random.sample(PREDEFINED_INTERESTS, k=min(num_interests_to_select, len(PREDEFINED_INTERESTS)))
+    logger.info("Capturing Interests for %s...", profile.student_id)
+    selected_interests = (rng or random).sample(PREDEFINED_INTERESTS, k=min(num_interests_to_select, len(PREDEFINED_INTERESTS)))
     for interest in selected_interests:
         profile.add_interest(interest)
-    # Trigger badge check after HLP tasks
-    check_and_award_all_relevant_badges(profile)
     return selected_interests
 
-def capture_student_struggles(profile: LearnerProfile, num_struggles_to_select: int = 2) -> List[str]:
+def capture_student_struggles(profile: LearnerProfile, num_struggles_to_select: int = 2,
+                              rng: Optional[random.Random] = None) -> List[str]:
     """Simulates capturing student-reported struggle areas from a predefined list.
 
     Randomly selects a specified number of struggle areas from `PREDEFINED_STRUGGLE_AREAS`
-    and adds them to the learner's profile. Triggers badge checks afterwards, which might
-    award the 'Helping Hand' badge.
+    and adds them to the learner's profile, which might make the badge engine award the
+    'Helping Hand' badge.
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
         num_struggles_to_select (int, optional): The number of struggle areas to randomly select.
                                                  Defaults to 2.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         List[str]: A list of the selected struggle areas that were added to the profile.
     """
-    logger.info(f"Capturing Struggle Areas for {profile.student_id}...")
-    selected_struggles = random.sample(PREDEFINED_STRUGGLE_AREAS, k=min(num_struggles_to_select, len(PREDEFINED_STRUGGLE_AREAS)))
+    logger.info("Capturing Struggle Areas for %s...", profile.student_id)
+    selected_struggles = (rng or random).sample(PREDEFINED_STRUGGLE_AREAS, k=min(num_struggles_to_select, len(PREDEFINED_STRUGGLE_AREAS)))
     for area in selected_struggles:
         profile.add_struggle_area(area)
-    # Trigger badge check for 'Helping Hand'
-    check_and_award_all_relevant_badges(profile)
     return selected_struggles
 
 PREDEFINED_INTERESTS = [
@@ -548,101 +1191,108 @@ PREDEFINED_STRUGGLE_AREAS = [
     "Solving word problems in math", "Staying focused during lectures", "Public speaking",
     "Learning new vocabulary", "Organizing my study time"
 ]
+INTEREST_CODES: Dict[str, int] = {interest: code for code, interest in enumerate(PREDEFINED_INTERESTS)}
+STRUGGLE_AREA_CODES: Dict[str, int] = {area: code for code, area in enumerate(PREDEFINED_STRUGGLE_AREAS)}
 
-def run_story_weaver_task(profile: LearnerProfile) -> Dict[str, Any]:
+def run_story_weaver_task(profile: LearnerProfile, rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Simulates the 'Story Weaver' sophisticated diagnostic task for the learner.
 
     This task might involve sequencing story panels. This simulation randomly determines
     the number of panels, accuracy, and attempts. The learner's profile is updated
-    with these cognitive metrics, and badge checks are triggered (e.g., for 'Curiosity Spark').
+    with these cognitive metrics, which the badge engine checks (e.g., for 'Curiosity Spark').
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         Dict[str, Any]: A dictionary containing the task name, simulated accuracy, and attempts.
                         Example: {"task_name": "story_weaver", "accuracy": 0.8, "attempts": 1}
     """
     task_name = "story_weaver"
-    logger.info(f"Running '{task_name}' Task for {profile.student_id}...")
-    num_panels = random.choice([3, 4, 5])
-    simulated_accuracy = random.choice([0.6, 0.8, 1.0])
-    simulated_attempts = random.randint(1, 3) if simulated_accuracy < 1.0 else 1
+    logger.info("Running '%s' Task for %s...", task_name, profile.student_id)
+    rng = rng or random
+    num_panels = rng.choice([3, 4, 5])
+    simulated_accuracy = rng.choice([0.6, 0.8, 1.0])
+    simulated_attempts = rng.randint(1, 3) if simulated_accuracy < 1.0 else 1
     profile.add_cognitive_metric(task_name, "num_panels", num_panels)
     profile.add_cognitive_metric(task_name, "accuracy", simulated_accuracy)
     profile.add_cognitive_metric(task_name, "attempts", simulated_attempts)
-    # Trigger badge check, e.g., for 'Curiosity Spark'
-    check_and_award_all_relevant_badges(profile)
     return {"task_name": task_name, "accuracy": simulated_accuracy, "attempts": simulated_attempts}
 
-def run_mind_mapper_task(profile: LearnerProfile) -> Dict[str, Any]:
+def run_mind_mapper_task(profile: LearnerProfile, rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Simulates the 'Mind Mapper' sophisticated diagnostic task for the learner.
 
     This task might involve generating ideas related to a central concept. This simulation
     randomly determines the number of ideas generated. The learner's profile is updated
-    with this cognitive metric, and badge checks are triggered.
+    with this cognitive metric.
 
     Args:
         profile (LearnerProfile): The profile of the learner to update.
+        rng (Optional[random.Random], optional): Random generator for the simulated outcome, e.g. from
+                                                 `make_session_rng`. Defaults to None, which uses the
+                                                 global `random` module.
 
     Returns:
         Dict[str, Any]: A dictionary containing the task name and other simulated metrics (if any).
                         Example: {"task_name": "mind_mapper", "ideas_generated": 5}
     """
     task_name = "mind_mapper"
-    logger.info(f"Running '{task_name}' Task for {profile.student_id}...")
+    logger.info("Running '%s' Task for %s...", task_name, profile.student_id)
     # ... (rest of the function as before, simplified for brevity) ...
-    profile.add_cognitive_metric(task_name, "ideas_generated", random.randint(3,8))
-    # Trigger badge check
-    check_and_award_all_relevant_badges(profile)
+    profile.add_cognitive_metric(task_name, "ideas_generated", (rng or random).randint(3,8))
     return {"task_name": task_name}
 
 # --- Main HLP Process Simulation (Example Usage) ---
 
-def run_full_hlp_assessment(student_id: str) -> LearnerProfile:
+@instrumented("hlp.assessment")
+def run_full_hlp_assessment(student_id: str, rng: Optional[random.Random] = None) -> LearnerProfile:
     """Simulates a full Holistic Learner Profiling (HLP) assessment process for a student.
 
     This function orchestrates the execution of various diagnostic tasks (both simple
     preference tasks and more sophisticated ones like Story Weaver and Mind Mapper),
     captures student interests and struggle areas, and simulates the completion of
     some Learning Objectives (LOs). A LearnerProfile object is created and populated
-    throughout this process. Badge checks are triggered at various points.
+    throughout this process, and the badge engine awards badges as their criteria are met.
 
     Args:
         student_id (str): The unique identifier for the student undergoing the assessment.
+        rng (Optional[random.Random], optional): Random generator shared by all simulated tasks, so
+                                                 that e.g. `make_session_rng(student_id, session)`
+                                                 reproduces the same profile. Defaults to None, which
+                                                 uses the global `random` module.
 
     Returns:
         LearnerProfile: The populated LearnerProfile object containing all gathered data
                         and earned badges from the simulated assessment.
     """
-    logger.info(f"--- Starting Full HLP Assessment for Student: {student_id} ---")
+    logger.info("--- Starting Full HLP Assessment for Student: %s ---", student_id)
     profile = LearnerProfile(student_id)
 
     # Initial HLP tasks (can trigger Trailblazer)
-    run_visual_preference_task(profile)
-    run_textual_preference_task(profile)
-    capture_student_interests(profile)
-    capture_student_struggles(profile) # Can trigger Helping Hand
+    run_visual_preference_task(profile, rng=rng)
+    run_textual_preference_task(profile, rng=rng)
+    capture_student_interests(profile, rng=rng)
+    capture_student_struggles(profile, rng=rng) # Can trigger Helping Hand
 
     # Sophisticated diagnostic tasks (can trigger Curiosity Spark)
-    run_story_weaver_task(profile)
-    run_mind_mapper_task(profile)
+    run_story_weaver_task(profile, rng=rng)
+    run_mind_mapper_task(profile, rng=rng)
 
     # Simulate completing some Learning Objectives (can trigger Topic Tackler, Quest Completer)
     # These LO IDs should align with curriculum_content_module.py if using real curriculum data
     profile.mark_lo_completed("MA4_N1a")
     profile.mark_lo_completed("MA4_N1b") # Trigger Topic Tackler Numeria Novice
     profile.mark_lo_completed("EN4_R1a") # To help trigger Quest Completer Intro (needs 3)
-    
-    # Final check for any badges that might now be awardable
-    # curriculum_store could be passed if needed by any badge criteria
-    check_and_award_all_relevant_badges(profile, curriculum_store=None) 
 
-    logger.info(f"--- Completed Full HLP Assessment for Student: {student_id} ---")
-    logger.info(f"Final Profile: {profile}")
+    logger.info("--- Completed Full HLP Assessment for Student: %s ---", student_id)
+    logger.info("Final Profile: %s", profile)
     return profile
 
 if __name__ == '__main__':
+    setup_logging() # Configure logging only when run as a script
     # Example of how to run the HLP assessment and see the profile
     test_student_id = "test_student_007"
     final_profile = run_full_hlp_assessment(test_student_id)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Instrumentation Module
+
+This module contains:
+1.  Spans (`span`, `instrumented`) that time a block or function, and counters (`increment`)
+    that count calls, used on the hot paths of the other DALA modules.
+2.  A pluggable, process-wide sink receiving every span and counter. The default sink ignores
+    them, and while no sink or request recording is active a span costs one flag check.
+3.  Per-request recording (`record_request`), which collects the spans and counters of the
+    code run inside it (in the current thread or asyncio task) for export as a dictionary.
+
+Span and counter names are dotted, e.g. "content_store.build" or "interface.template".
+"""
+
+import time
+import threading
+import functools
+import contextlib
+import logging
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from config import setup_logging
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class InstrumentationSink:
+    """Receives spans and counters. This base class ignores them and is the default sink.
+
+    Subclasses that record anything set `enabled` to True; spans are only timed while the
+    process-wide sink is enabled or a request is being recorded.
+    """
+
+    enabled: bool = False
+
+    def record_span(self, name: str, seconds: float) -> None:
+        """Called when a span ends.
+
+        Args:
+            name (str): The span's name.
+            seconds (float): The span's duration.
+        """
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Called when a counter is incremented.
+
+        Args:
+            name (str): The counter's name.
+            count (int, optional): The increment. Defaults to 1.
+        """
+
+
+class RecordingSink(InstrumentationSink):
+    """Aggregates spans (call count, total and maximum duration) and counters in memory.
+
+    Safe to share between threads, e.g. as the process-wide sink of a multi-threaded service.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        """Initializes an empty recording."""
+        self._lock = threading.Lock()
+        # span name -> [count, total seconds, max seconds]
+        self._spans: Dict[str, list] = {}
+        self._counters: Dict[str, int] = {}
+
+    def record_span(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                self._spans[name] = [1, seconds, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+                if seconds > stats[2]:
+                    stats[2] = seconds
+
+    def increment(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + count
+
+    def export(self) -> Dict[str, Any]:
+        """Returns the recording as a JSON-serialisable dictionary.
+
+        Returns:
+            Dict[str, Any]: `spans` maps each span name to its `count`, `total_ms` and `max_ms`;
+                            `counters` maps each counter name to its value.
+        """
+        with self._lock:
+            return {
+                "spans": {
+                    name: {"count": count, "total_ms": round(total * 1000, 3), "max_ms": round(longest * 1000, 3)}
+                    for name, (count, total, longest) in sorted(self._spans.items())
+                },
+                "counters": dict(sorted(self._counters.items()))
+            }
+
+    def reset(self) -> None:
+        """Discards everything recorded so far."""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+
+class LoggingSink(InstrumentationSink):
+    """Writes every span and counter to this module's logger at DEBUG level."""
+
+    enabled = True
+
+    def record_span(self, name: str, seconds: float) -> None:
+        logger.debug("span %s %.3f ms", name, seconds * 1000)
+
+    def increment(self, name: str, count: int = 1) -> None:
+        logger.debug("counter %s +%d", name, count)
+
+
+NULL_SINK = InstrumentationSink()
+"""The default, no-op process-wide sink."""
+
+_sink: InstrumentationSink = NULL_SINK
+_request_sink: ContextVar[Optional[RecordingSink]] = ContextVar("dala_request_sink", default=None)
+_state_lock = threading.Lock()
+_recording_requests = 0
+# True while the process-wide sink is enabled or any request is being recorded
+_active = False
+
+
+def _update_active() -> None:
+    global _active
+    _active = _sink.enabled or _recording_requests > 0
+
+
+def set_sink(sink: Optional[InstrumentationSink]) -> InstrumentationSink:
+    """Installs the process-wide sink.
+
+    Args:
+        sink (Optional[InstrumentationSink]): The new sink; None restores the no-op default.
+
+    Returns:
+        InstrumentationSink: The previously installed sink.
+    """
+    global _sink
+    with _state_lock:
+        previous = _sink
+        _sink = sink if sink is not None else NULL_SINK
+        _update_active()
+    return previous
+
+
+def get_sink() -> InstrumentationSink:
+    """Returns the process-wide sink."""
+    return _sink
+
+
+class _Span:
+    """Times a block and reports it to the process-wide sink and the current request's recording."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        seconds = time.perf_counter() - self.start
+        request = _request_sink.get()
+        if request is not None:
+            request.record_span(self.name, seconds)
+        if _sink.enabled:
+            _sink.record_span(self.name, seconds)
+
+
+class _NullSpan:
+    """The span used while instrumentation is inactive."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str) -> Any:
+    """Returns a context manager timing the block it wraps as the span `name`.
+
+    Args:
+        name (str): The span's name.
+
+    Returns:
+        A context manager; a shared no-op one while instrumentation is inactive.
+    """
+    if not _active:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def increment(name: str, count: int = 1) -> None:
+    """Increments the counter `name` in the process-wide sink and the current request's recording.
+
+    Args:
+        name (str): The counter's name.
+        count (int, optional): The increment. Defaults to 1.
+    """
+    if not _active:
+        return
+    request = _request_sink.get()
+    if request is not None:
+        request.increment(name, count)
+    if _sink.enabled:
+        _sink.increment(name, count)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator recording every call of a function as the span `name`.
+
+    Args:
+        name (str): The span's name.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _active:
+                return function(*args, **kwargs)
+            with _Span(name):
+                return function(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+@contextlib.contextmanager
+def record_request() -> Iterator[RecordingSink]:
+    """Records the spans and counters of the code run inside the block, e.g. one page request.
+
+    The recording follows the current context, so it covers this thread or asyncio task (and
+    tasks created from it) but not work handed to other threads or processes. Requests can be
+    recorded concurrently and alongside the process-wide sink.
+
+    Yields:
+        RecordingSink: The request's recording; call `export()` on it after the block.
+    """
+    global _recording_requests
+    recording = RecordingSink()
+    token = _request_sink.set(recording)
+    with _state_lock:
+        _recording_requests += 1
+        _update_active()
+    try:
+        yield recording
+    finally:
+        _request_sink.reset(token)
+        with _state_lock:
+            _recording_requests -= 1
+            _update_active()
+
+
+if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
+    with record_request() as demo_recording:
+        for _ in range(3):
+            with span("demo.block"):
+                increment("demo.iterations")
+    logger.info(f"Recorded request: {demo_recording.export()}")
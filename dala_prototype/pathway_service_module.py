@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Pathway Service Module
+
+This module contains:
+1.  `PathwayService`, an asyncio service that generates learning pathways on request. Concurrent
+    requests for the same learner (and options) share one in-flight generation, and all pathway
+    generation runs in an executor so the event loop stays responsive.
+2.  `LatencyMetrics`, a rolling window of request latencies reporting p50/p99.
+3.  `LocalPathwayClient`, an in-process client returning the request/response dictionaries a
+    networked client would, for tests, scripts and notebooks.
+"""
+
+import math
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    setup_logging,
+    DEFAULT_TARGET_LO_COUNT,
+    DEFAULT_MAX_ACTIVITIES_PER_LO,
+    PATHWAY_SERVICE_MAX_WORKERS,
+    PATHWAY_SERVICE_BATCH_CHUNK_SIZE,
+    PATHWAY_SERVICE_LATENCY_WINDOW
+)
+from hlp_module import LearnerProfileBase, run_full_hlp_assessment, make_session_rng
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import (
+    PathwayGenerator, PathwayPrecomputation, PathwayCache, default_pathway_cache, generate_pathways_for_cohort
+)
+from profile_persistence_module import LearnerProfileStore
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+# A pathway request: (learner ID, target LO count, max activities per LO, session)
+PathwayRequestKey = Tuple[str, int, int, Optional[str]]
+Pathway = List[Dict[str, Any]]
+
+
+class LatencyMetrics:
+    """Latencies of the most recent requests of one operation, with nearest-rank percentiles.
+
+    Attributes:
+        count (int): Requests recorded since the service started.
+        errors (int): Requests that raised an exception.
+    """
+
+    def __init__(self, window: int = PATHWAY_SERVICE_LATENCY_WINDOW):
+        """Initializes an empty window.
+
+        Args:
+            window (int, optional): Number of most recent latencies kept. Defaults to PATHWAY_SERVICE_LATENCY_WINDOW.
+        """
+        self._samples: deque = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        """Records the latency of one request."""
+        self._samples.append(seconds)
+        self.count += 1
+        if failed:
+            self.errors += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Returns the nearest-rank percentile of the window in seconds, or None if it is empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the request count, error count and p50/p99/max latency in milliseconds."""
+        def milliseconds(seconds: Optional[float]) -> Optional[float]:
+            return round(seconds * 1000, 3) if seconds is not None else None
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "p50_ms": milliseconds(self.percentile(50)),
+            "p99_ms": milliseconds(self.percentile(99)),
+            "max_ms": milliseconds(max(self._samples) if self._samples else None)
+        }
+
+
+class PathwayService:
+    """Serves learning pathways to concurrent asyncio callers.
+
+    Pathways are generated in an executor (a thread pool by default) so the event loop only
+    coordinates requests. A request for a learner whose pathway, with the same options and
+    session, is already being generated awaits that generation instead of starting another; coalesced
+    callers receive the same pathway object, which must be treated as read-only. Batch requests
+    are split into chunks generated with `generate_pathways_for_cohort`, sharing one
+    `PathwayPrecomputation` per content store.
+
+    The content store is fetched from `content_store_provider` for every generation, so a
+    provider backed by `content_store_registry` serves hot-reloaded content while each
+    generation runs against one consistent store.
+
+    Attributes:
+        content_store_provider (Callable[[], CurriculumContentStore]): Returns the store to generate from.
+        profile_store (Optional[LearnerProfileStore]): Where learner profiles are loaded from.
+        pathway_cache (Optional[PathwayCache]): Cache of generated pathways shared with other callers.
+        batch_chunk_size (int): Learners per executor job in batch requests.
+        metrics_by_operation (Dict[str, LatencyMetrics]): Latencies of "pathway" and "batch" requests.
+        coalesced_requests (int): Requests that joined an in-flight generation.
+        session (Optional[str]): Default session of requests; if set, each generation draws from
+            `make_session_rng(learner_id, session)`.
+        record_history (bool): Whether served pathways are added to the learners' recent content history.
+    """
+
+    def __init__(
+        self,
+        content_store_provider: Callable[[], CurriculumContentStore],
+        profile_store: Optional[LearnerProfileStore] = None,
+        pathway_cache: Optional[PathwayCache] = default_pathway_cache,
+        executor: Optional[Executor] = None,
+        max_workers: int = PATHWAY_SERVICE_MAX_WORKERS,
+        batch_chunk_size: int = PATHWAY_SERVICE_BATCH_CHUNK_SIZE,
+        latency_window: int = PATHWAY_SERVICE_LATENCY_WINDOW,
+        session: Optional[str] = None,
+        record_history: bool = False
+    ):
+        """Initializes the service.
+
+        Args:
+            content_store_provider (Callable[[], CurriculumContentStore]): Returns the store to generate
+                pathways from, e.g. `generate_interface.build_combined_content_store`.
+            profile_store (Optional[LearnerProfileStore], optional): Store to load learner profiles from;
+                the HLP assessment is only run for learners without a stored profile. Defaults to None,
+                in which case the assessment is run for every generation.
+            pathway_cache (Optional[PathwayCache], optional): Cache of generated pathways, checked before
+                generating. Defaults to `default_pathway_cache`; None disables caching.
+            executor (Optional[Executor], optional): Executor for pathway generation. Defaults to None,
+                in which case the service creates (and owns) a thread pool of `max_workers` threads.
+            max_workers (int, optional): Size of the service's own thread pool. Defaults to PATHWAY_SERVICE_MAX_WORKERS.
+            batch_chunk_size (int, optional): Learners per executor job in batch requests.
+                                              Defaults to PATHWAY_SERVICE_BATCH_CHUNK_SIZE.
+            latency_window (int, optional): Latencies kept per operation. Defaults to PATHWAY_SERVICE_LATENCY_WINDOW.
+            session (Optional[str], optional): Seeds every generation (HLP simulation and LO selection)
+                from the learner ID and this session, so a learner's pathway is reproducible, e.g. for
+                load-test baselines. Defaults to None, which uses the global `random` module.
+            record_history (bool, optional): Adds the content of every served pathway to the learner's
+                recent history (see `LearnerProfileBase.record_served_content`), which `profile_store`
+                persists, so a learner's next pathway favours other content. Defaults to False.
+        """
+        self.content_store_provider = content_store_provider
+        self.profile_store = profile_store
+        self.pathway_cache = pathway_cache
+        self.batch_chunk_size = max(1, batch_chunk_size)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PathwayService")
+        self._in_flight: Dict[PathwayRequestKey, asyncio.Future] = {}
+        self._precomputation: Optional[PathwayPrecomputation] = None
+        self.metrics_by_operation: Dict[str, LatencyMetrics] = {
+            "pathway": LatencyMetrics(latency_window),
+            "batch": LatencyMetrics(latency_window)
+        }
+        self.coalesced_requests = 0
+        self.session = session
+        self.record_history = record_history
+
+    # --- Public API ---
+
+    async def get_pathway(
+        self,
+        learner_id: str,
+        target_lo_count: int = DEFAULT_TARGET_LO_COUNT,
+        max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+        session: Optional[str] = None
+    ) -> Pathway:
+        """Returns a learner's initial pathway, joining an identical in-flight request if there is one.
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+            target_lo_count (int, optional): Target number of LOs. Defaults to DEFAULT_TARGET_LO_COUNT.
+            max_activities_per_lo (int, optional): Maximum activities per LO. Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            session (Optional[str], optional): Session seeding the generation (see `make_session_rng`).
+                                               Defaults to None, which uses the service's `session`.
+
+        Returns:
+            List[Dict[str, Any]]: The pathway, as returned by `PathwayGenerator.generate_initial_pathway`.
+        """
+        start = time.perf_counter()
+        key = (learner_id, target_lo_count, max_activities_per_lo, session if session is not None else self.session)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced_requests += 1
+        else:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, self._generate_pathway, key)
+            self._track(key, future)
+        failed = True
+        try:
+            # Shielded so one caller giving up does not cancel the generation for the others
+            pathway = await asyncio.shield(future)
+            failed = False
+            return pathway
+        finally:
+            self.metrics_by_operation["pathway"].record(time.perf_counter() - start, failed)
+
+    async def get_pathways(
+        self,
+        learner_ids: Iterable[str],
+        target_lo_count: int = DEFAULT_TARGET_LO_COUNT,
+        max_activities_per_lo: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+        session: Optional[str] = None
+    ) -> Dict[str, Pathway]:
+        """Returns the initial pathways of several learners, generated in chunks in the executor.
+
+        Learners with an identical request already in flight join it; the others are registered as
+        in flight too, so single requests arriving meanwhile join the batch.
+
+        Args:
+            learner_ids (Iterable[str]): The learners' unique identifiers (duplicates are ignored).
+            target_lo_count (int, optional): Target number of LOs. Defaults to DEFAULT_TARGET_LO_COUNT.
+            max_activities_per_lo (int, optional): Maximum activities per LO. Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            session (Optional[str], optional): Session seeding the generation (see `make_session_rng`).
+                                               Defaults to None, which uses the service's `session`.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The pathway of each learner, keyed by learner ID.
+        """
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        session = session if session is not None else self.session
+        futures: Dict[str, asyncio.Future] = {}
+        to_generate: List[str] = []
+        for learner_id in dict.fromkeys(learner_ids):
+            future = self._in_flight.get((learner_id, target_lo_count, max_activities_per_lo, session))
+            if future is not None:
+                self.coalesced_requests += 1
+                futures[learner_id] = future
+            else:
+                to_generate.append(learner_id)
+
+        for offset in range(0, len(to_generate), self.batch_chunk_size):
+            chunk = to_generate[offset:offset + self.batch_chunk_size]
+            members = {}
+            for learner_id in chunk:
+                member = members[learner_id] = futures[learner_id] = loop.create_future()
+                self._track((learner_id, target_lo_count, max_activities_per_lo, session), member)
+            chunk_future = loop.run_in_executor(
+                self._executor, self._generate_pathways, chunk, target_lo_count, max_activities_per_lo, session
+            )
+            chunk_future.add_done_callback(lambda done, members=members: self._resolve_members(done, members))
+
+        failed = True
+        try:
+            pathways = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+            failed = False
+            return dict(zip(futures, pathways))
+        finally:
+            self.metrics_by_operation["batch"].record(time.perf_counter() - start, failed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the service's latency percentiles and request counters.
+
+        Returns:
+            Dict[str, Any]: Per-operation latency snapshots (see `LatencyMetrics.snapshot`), the
+                            number of coalesced requests and of generations currently in flight,
+                            and the pathway cache's hit/miss counts if the service has a cache.
+        """
+        metrics = {
+            **{operation: metrics.snapshot() for operation, metrics in self.metrics_by_operation.items()},
+            "coalesced_requests": self.coalesced_requests,
+            "in_flight": len(self._in_flight)
+        }
+        if self.pathway_cache is not None:
+            metrics["pathway_cache"] = {
+                "hits": self.pathway_cache.hits,
+                "misses": self.pathway_cache.misses,
+                "entries": len(self.pathway_cache)
+            }
+        return metrics
+
+    async def close(self) -> None:
+        """Waits for in-flight generations and shuts down the service's own executor."""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self) -> "PathwayService":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    # --- In-flight bookkeeping (event loop thread) ---
+
+    def _track(self, key: PathwayRequestKey, future: asyncio.Future) -> None:
+        self._in_flight[key] = future
+
+        def release(done: asyncio.Future) -> None:
+            if self._in_flight.get(key) is done:
+                del self._in_flight[key]
+            if not done.cancelled() and done.exception() is not None:
+                # Marks the exception as retrieved even if every caller has gone away
+                logger.debug("Pathway generation for %s failed: %s", key[0], done.exception())
+
+        future.add_done_callback(release)
+
+    @staticmethod
+    def _resolve_members(chunk_future: asyncio.Future, members: Dict[str, asyncio.Future]) -> None:
+        error = chunk_future.exception() if not chunk_future.cancelled() else asyncio.CancelledError()
+        pathways = chunk_future.result() if error is None else {}
+        for learner_id, member in members.items():
+            if member.done():
+                continue
+            if error is not None:
+                member.set_exception(error)
+            elif learner_id in pathways:
+                member.set_result(pathways[learner_id])
+            else:
+                member.set_exception(KeyError(f"No pathway was generated for learner {learner_id}"))
+
+    # --- Generation (executor threads) ---
+
+    def _precomputation_for(self, content_store: CurriculumContentStore) -> PathwayPrecomputation:
+        precomputation = self._precomputation
+        if precomputation is None or precomputation.content_store is not content_store:
+            precomputation = self._precomputation = PathwayPrecomputation(content_store)
+        return precomputation
+
+    @staticmethod
+    def _rng_for(learner_id: str, session: Optional[str]) -> Optional[random.Random]:
+        return make_session_rng(learner_id, session) if session is not None else None
+
+    def _load_profile(self, learner_id: str, rng: Optional[random.Random] = None) -> LearnerProfileBase:
+        if self.profile_store is not None:
+            return self.profile_store.get_or_create_profile(
+                learner_id, lambda new_learner_id: run_full_hlp_assessment(new_learner_id, rng=rng)
+            )
+        return run_full_hlp_assessment(learner_id, rng=rng)
+
+    def _generate_pathway(self, key: PathwayRequestKey) -> Pathway:
+        learner_id, target_lo_count, max_activities_per_lo, session = key
+        content_store = self.content_store_provider()
+        # Fresh generators for the assessment and the selection, matching `generate_pathways_for_cohort`
+        generator = PathwayGenerator(
+            self._load_profile(learner_id, self._rng_for(learner_id, session)), content_store,
+            precomputation=self._precomputation_for(content_store), pathway_cache=self.pathway_cache,
+            session=session
+        )
+        return generator.generate_initial_pathway(
+            target_lo_count=target_lo_count, max_activities_per_lo=max_activities_per_lo,
+            record_history=self.record_history
+        )
+
+    def _generate_pathways(
+        self, learner_ids: List[str], target_lo_count: int, max_activities_per_lo: int, session: Optional[str]
+    ) -> Dict[str, Pathway]:
+        content_store = self.content_store_provider()
+        if self.profile_store is not None:
+            stored = {profile.learner_id: profile for profile in self.profile_store.get_profiles(learner_ids)}
+            profiles = [
+                stored.get(learner_id) or self._load_profile(learner_id, self._rng_for(learner_id, session))
+                for learner_id in learner_ids
+            ]
+        else:
+            profiles = [run_full_hlp_assessment(learner_id, rng=self._rng_for(learner_id, session)) for learner_id in learner_ids]
+        return generate_pathways_for_cohort(
+            profiles, content_store, target_lo_count=target_lo_count, max_activities_per_lo=max_activities_per_lo,
+            precomputation=self._precomputation_for(content_store), pathway_cache=self.pathway_cache,
+            session=session, record_history=self.record_history
+        )
+
+
+class LocalPathwayClient:
+    """An in-process client for a `PathwayService`.
+
+    Methods return the JSON-serialisable response dictionaries a networked client would receive,
+    with a `status` of "ok" or "error", so callers and tests do not depend on the service's
+    exceptions.
+    """
+
+    def __init__(self, service: PathwayService):
+        """Binds the client to a service.
+
+        Args:
+            service (PathwayService): The service to call.
+        """
+        self.service = service
+
+    async def request_pathway(self, learner_id: str, **options: Any) -> Dict[str, Any]:
+        """Requests a learner's pathway.
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+            **options (Any): `target_lo_count`, `max_activities_per_lo` and/or `session`.
+
+        Returns:
+            Dict[str, Any]: `{"status": "ok", "learner_id": ..., "pathway": [...]}`, or
+                            `{"status": "error", "learner_id": ..., "error": "..."}`.
+        """
+        try:
+            pathway = await self.service.get_pathway(learner_id, **options)
+        except Exception as e:
+            logger.error("Pathway request for %s failed: %s", learner_id, e)
+            return {"status": "error", "learner_id": learner_id, "error": str(e)}
+        return {"status": "ok", "learner_id": learner_id, "pathway": pathway}
+
+    async def request_pathways(self, learner_ids: List[str], **options: Any) -> Dict[str, Any]:
+        """Requests the pathways of several learners in one batch.
+
+        Args:
+            learner_ids (List[str]): The learners' unique identifiers.
+            **options (Any): `target_lo_count`, `max_activities_per_lo` and/or `session`.
+
+        Returns:
+            Dict[str, Any]: `{"status": "ok", "pathways": {learner_id: [...]}}`, or
+                            `{"status": "error", "error": "..."}`.
+        """
+        try:
+            pathways = await self.service.get_pathways(learner_ids, **options)
+        except Exception as e:
+            logger.error("Batch pathway request for %s learners failed: %s", len(learner_ids), e)
+            return {"status": "error", "error": str(e)}
+        return {"status": "ok", "pathways": pathways}
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Returns the service's metrics (see `PathwayService.metrics`)."""
+        return {"status": "ok", "metrics": self.service.metrics()}
+
+
+# --- Main execution for testing ---
+if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
+    from generate_interface import build_combined_content_store
+
+    async def _demo() -> None:
+        async with PathwayService(build_combined_content_store) as service:
+            client = LocalPathwayClient(service)
+            # 20 concurrent requests for 5 learners: duplicates join the in-flight generation
+            responses = await asyncio.gather(*(client.request_pathway(f"service_student_{index % 5}") for index in range(20)))
+            logger.info(f"{sum(response['status'] == 'ok' for response in responses)} of {len(responses)} requests succeeded.")
+            batch = await client.request_pathways([f"service_student_{index}" for index in range(10)])
+            logger.info(f"Batch returned {len(batch.get('pathways', {}))} pathways.")
+            logger.info(f"Metrics: {(await client.get_metrics())['metrics']}")
+
+    asyncio.run(_demo())
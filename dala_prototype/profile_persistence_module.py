@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Learner Profile Persistence Module
+
+This module contains:
+1.  `LearnerProfileStore`, the storage-independent profile repository: lazy loading on first
+    access, an LRU of hot profiles, and dirty tracking with batched, interval-based flushing.
+2.  `JSONLearnerProfileStore`, which persists one `{learner_id}.json` file per learner as
+    described in docs/data_persistence_model.md, using atomic (temp file + rename) writes.
+3.  `SQLiteLearnerProfileStore`, a single-database backend for large rosters (WAL mode,
+    batched upserts, indexed lookups by student and by LO).
+"""
+
+import os
+import abc
+import json
+import math
+import sqlite3
+import time
+import datetime
+import tempfile
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from config import (
+    setup_logging,
+    LEARNERS_DATA_DIR,
+    LEARNERS_SQLITE_DB_FILE,
+    PROFILE_STORE_CACHE_SIZE,
+    PROFILE_STORE_FLUSH_INTERVAL_SECONDS,
+    PROFILE_SCHEMA_VERSION,
+    DEFAULT_STUDENT_ID
+)
+from hlp_module import LearnerProfile, LearnerProfileBase, run_full_hlp_assessment
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+
+def serialise_profile(profile: LearnerProfileBase) -> Dict[str, Any]:
+    """Converts a profile into the persisted dictionary form (its `to_dict()` plus metadata).
+
+    Args:
+        profile (LearnerProfileBase): The profile to serialise.
+
+    Returns:
+        Dict[str, Any]: The JSON-serialisable profile data.
+    """
+    data = profile.to_dict()
+    data["metadata"] = {
+        "version": PROFILE_SCHEMA_VERSION,
+        "last_updated": datetime.datetime.utcnow().isoformat() + "Z"
+    }
+    return data
+
+
+def atomic_write_json(file_path: str, data: Any) -> None:
+    """Writes JSON to `file_path` so that readers only ever see the old or the new complete file.
+
+    The data is written to a temporary file in the same directory, flushed to disk and then
+    renamed over the target with `os.replace`, which is atomic on POSIX and Windows.
+
+    Args:
+        file_path (str): The destination path.
+        data (Any): The JSON-serialisable data to write.
+    """
+    directory = os.path.dirname(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class LearnerProfileStore(abc.ABC):
+    """Storage-independent repository of learner profiles.
+
+    Profiles are loaded lazily on first access and kept in an LRU of at most `cache_size` hot
+    profiles. The store registers itself as a change listener on every profile it hands out, so
+    mutations such as `add_interest` or `mark_lo_completed` only mark the profile dirty. Dirty
+    profiles are written together by a background timer, armed when a profile becomes dirty, at
+    most `flush_interval_seconds` after the last flush (immediately if a mutation arrives after
+    that), on `flush()`/`close()`, or when a dirty profile is evicted from the LRU. An infinite
+    interval disables timed flushes.
+
+    A profile evicted from the LRU is detached from the store; callers should fetch profiles
+    from the store when they need them rather than holding on to them indefinitely.
+
+    Subclasses implement `_read_profile_data`, `_write_profiles` and `list_learners`.
+
+    Attributes:
+        cache_size (int): Maximum number of profiles held in memory.
+        flush_interval_seconds (float): Minimum time between automatic flushes.
+        profile_factory (Callable[[Dict[str, Any]], LearnerProfileBase]): Builds a profile from stored data.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = PROFILE_STORE_CACHE_SIZE,
+        flush_interval_seconds: float = PROFILE_STORE_FLUSH_INTERVAL_SECONDS,
+        profile_factory: Callable[[Dict[str, Any]], LearnerProfileBase] = LearnerProfile.from_dict
+    ):
+        """Initializes the in-memory state shared by all store implementations.
+
+        Args:
+            cache_size (int, optional): Maximum number of profiles held in memory.
+                                        Defaults to PROFILE_STORE_CACHE_SIZE.
+            flush_interval_seconds (float, optional): Minimum time between automatic flushes.
+                                                      Defaults to PROFILE_STORE_FLUSH_INTERVAL_SECONDS.
+            profile_factory (Callable[[Dict[str, Any]], LearnerProfileBase], optional): Builds a profile
+                from stored data, e.g. a `CompactLearnerProfile.from_dict` partial for large rosters.
+                Defaults to LearnerProfile.from_dict.
+        """
+        self.cache_size = max(1, cache_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.profile_factory = profile_factory
+        self._cache: "OrderedDict[str, LearnerProfileBase]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        self._listener = self._on_profile_changed
+        self._flush_timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    # --- Storage hooks implemented by subclasses ---
+
+    @abc.abstractmethod
+    def _read_profile_data(self, learner_id: str) -> Optional[Dict[str, Any]]:
+        """Reads the stored data of one learner, or returns None if there is none."""
+
+    def _read_many_profile_data(self, learner_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Reads the stored data of several learners; backends with batched reads override this.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stored data by learner ID, omitting learners with no stored profile.
+        """
+        found = {}
+        for learner_id in learner_ids:
+            data = self._read_profile_data(learner_id)
+            if data is not None:
+                found[learner_id] = data
+        return found
+
+    @abc.abstractmethod
+    def _write_profiles(self, profiles: List[LearnerProfileBase]) -> None:
+        """Persists a batch of profiles."""
+
+    @abc.abstractmethod
+    def list_learners(self) -> List[str]:
+        """Lists the IDs of all learners with a stored profile.
+
+        Returns:
+            List[str]: The learner IDs, sorted.
+        """
+
+    # --- Public API ---
+
+    def get_profile(self, learner_id: str) -> Optional[LearnerProfileBase]:
+        """Returns a learner's profile, loading it from storage on first access.
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+
+        Returns:
+            Optional[LearnerProfileBase]: The profile, or None if the learner has no stored profile.
+        """
+        with self._lock:
+            profile = self._cache.get(learner_id)
+            if profile is not None:
+                self._cache.move_to_end(learner_id)
+                return profile
+            data = self._read_profile_data(learner_id)
+            if data is None:
+                return None
+            profile = self.profile_factory(data)
+            self._cache_profile(profile)
+            return profile
+
+    def get_profiles(self, learner_ids: List[str]) -> List[LearnerProfileBase]:
+        """Returns the profiles of several learners, reading the uncached ones from storage in one batch.
+
+        Intended for cohort reports; profiles beyond `cache_size` are returned but not kept cached.
+
+        Args:
+            learner_ids (List[str]): The learners' unique identifiers.
+
+        Returns:
+            List[LearnerProfileBase]: The profiles, in the order of `learner_ids`, skipping learners
+                                      with no stored profile.
+        """
+        with self._lock:
+            missing_ids = [learner_id for learner_id in learner_ids if learner_id not in self._cache]
+            loaded = {
+                learner_id: self.profile_factory(data)
+                for learner_id, data in self._read_many_profile_data(missing_ids).items()
+            }
+            profiles = []
+            for learner_id in learner_ids:
+                profile = self._cache.get(learner_id) or loaded.get(learner_id)
+                if profile is not None:
+                    self._cache_profile(profile)
+                    profiles.append(profile)
+            return profiles
+
+    def get_or_create_profile(self, learner_id: str, create_profile: Callable[[str], LearnerProfileBase]) -> LearnerProfileBase:
+        """Returns a learner's stored profile, or creates, stores and returns a new one.
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+            create_profile (Callable[[str], LearnerProfileBase]): Builds a new profile from the learner ID,
+                                                                  e.g. `run_full_hlp_assessment`.
+
+        Returns:
+            LearnerProfileBase: The existing or newly created profile.
+        """
+        with self._lock:
+            profile = self.get_profile(learner_id)
+            if profile is None:
+                profile = create_profile(learner_id)
+                self.save_profile(profile)
+            return profile
+
+    def save_profile(self, profile: LearnerProfileBase) -> None:
+        """Adds or replaces a profile in the store and schedules it to be written.
+
+        Args:
+            profile (LearnerProfileBase): The profile to store.
+        """
+        with self._lock:
+            previous = self._cache.get(profile.learner_id)
+            if previous is not None and previous is not profile:
+                previous.remove_change_listener(self._listener)
+            self._cache_profile(profile)
+            self._mark_dirty_and_maybe_flush(profile.learner_id)
+
+    def mark_dirty(self, learner_id: str) -> None:
+        """Schedules a cached profile to be written, for changes made outside its mutating methods
+        (e.g. assigning `current_learning_objective_id` directly).
+
+        Args:
+            learner_id (str): The learner's unique identifier.
+        """
+        with self._lock:
+            if learner_id in self._cache:
+                self._mark_dirty_and_maybe_flush(learner_id)
+
+    def flush(self) -> int:
+        """Writes every dirty profile in one batch.
+
+        Returns:
+            int: The number of profiles written.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            profiles = [self._cache[learner_id] for learner_id in self._dirty if learner_id in self._cache]
+            if profiles:
+                self._write_profiles(profiles)
+                logger.info("%s flushed %s profile(s).", type(self).__name__, len(profiles))
+            self._dirty.clear()
+            self._last_flush = time.monotonic()
+            return len(profiles)
+
+    def close(self) -> None:
+        """Flushes pending changes and stops the flush timer. The store must not be used afterwards."""
+        with self._lock:
+            self.flush()
+            self._closed = True
+
+    def __enter__(self) -> "LearnerProfileStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # --- Internal helpers ---
+
+    def _cache_profile(self, profile: LearnerProfileBase) -> None:
+        """Puts a profile at the most-recently-used end of the LRU and evicts beyond `cache_size`."""
+        self._cache[profile.learner_id] = profile
+        self._cache.move_to_end(profile.learner_id)
+        profile.add_change_listener(self._listener)
+        while len(self._cache) > self.cache_size:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            if evicted_id in self._dirty:
+                self._write_profiles([evicted])
+                self._dirty.discard(evicted_id)
+            evicted.remove_change_listener(self._listener)
+
+    def _mark_dirty_and_maybe_flush(self, learner_id: str) -> None:
+        """Marks a profile dirty and flushes now if the flush interval has elapsed, or arms the flush timer."""
+        self._dirty.add(learner_id)
+        elapsed = time.monotonic() - self._last_flush
+        if elapsed >= self.flush_interval_seconds:
+            self.flush()
+        elif self._flush_timer is None and not self._closed and math.isfinite(self.flush_interval_seconds):
+            self._flush_timer = threading.Timer(self.flush_interval_seconds - elapsed, self._flush_from_timer)
+            self._flush_timer.name = f"{type(self).__name__}Flush"
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """Flush timer callback: writes the profiles that became dirty since the last flush."""
+        with self._lock:
+            if self._closed or self._flush_timer is not threading.current_thread():
+                return # Closed, or superseded by a flush since the timer was armed
+            try:
+                self.flush()
+            except Exception as e:
+                self._flush_timer = None
+                logger.error("Background flush of %s failed: %s", type(self).__name__, e)
+
+    def _on_profile_changed(self, profile: LearnerProfileBase, field_name: str) -> None:
+        """Change listener registered on every cached profile."""
+        with self._lock:
+            if self._cache.get(profile.learner_id) is profile:
+                self._mark_dirty_and_maybe_flush(profile.learner_id)
+
+
+class JSONLearnerProfileStore(LearnerProfileStore):
+    """Profile store persisting one `{learner_id}.json` file per learner.
+
+    Attributes:
+        learners_dir (str): Directory holding the profile files.
+    """
+
+    def __init__(self, learners_dir: str = LEARNERS_DATA_DIR, **store_options: Any):
+        """Initializes the store, creating the profile directory if needed.
+
+        Args:
+            learners_dir (str, optional): Directory holding the profile files. Defaults to LEARNERS_DATA_DIR.
+            **store_options (Any): Options passed to `LearnerProfileStore` (cache size, flush interval, factory).
+        """
+        super().__init__(**store_options)
+        self.learners_dir = learners_dir
+        os.makedirs(self.learners_dir, exist_ok=True)
+
+    def _profile_path(self, learner_id: str) -> str:
+        """Returns the file path for a learner ID, rejecting IDs that would escape `learners_dir`."""
+        if not learner_id or learner_id.startswith(".") or "/" in learner_id or os.sep in learner_id:
+            raise ValueError(f"Invalid learner ID for file storage: {learner_id!r}")
+        return os.path.join(self.learners_dir, f"{learner_id}.json")
+
+    def _read_profile_data(self, learner_id: str) -> Optional[Dict[str, Any]]:
+        file_path = self._profile_path(learner_id)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as e:
+            logger.error("Error decoding learner profile JSON from %s: %s", file_path, e)
+            return None
+
+    def _write_profiles(self, profiles: List[LearnerProfileBase]) -> None:
+        for profile in profiles:
+            atomic_write_json(self._profile_path(profile.learner_id), serialise_profile(profile))
+
+    def list_learners(self) -> List[str]:
+        return sorted(
+            name[:-len(".json")] for name in os.listdir(self.learners_dir)
+            if name.endswith(".json") and not name.startswith(".")
+        )
+
+
+class SQLiteLearnerProfileStore(LearnerProfileStore):
+    """Profile store keeping every learner in one SQLite database, for rosters of tens of thousands.
+
+    Scalar profile fields (and the short recent-content history, as JSON) live in a `learners`
+    table; completed LOs, earned badges and cognitive metrics live in child tables keyed by
+    student so they can be queried directly (e.g. which learners completed an LO) without
+    loading profiles. The database runs in WAL mode so cohort
+    reports can read while profiles are being flushed, and each flush writes its whole batch of
+    dirty profiles in one transaction with `executemany` upserts.
+
+    Attributes:
+        db_path (str): Path of the SQLite database file.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS learners (
+            student_id TEXT PRIMARY KEY,
+            learning_preferences TEXT NOT NULL,
+            interests TEXT NOT NULL,
+            struggle_areas TEXT NOT NULL,
+            current_learning_objective_id TEXT,
+            recent_content_ids TEXT NOT NULL DEFAULT '[]',
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS completed_los (
+            student_id TEXT NOT NULL,
+            lo_id TEXT NOT NULL,
+            PRIMARY KEY (student_id, lo_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_completed_los_lo_id ON completed_los (lo_id);
+        CREATE TABLE IF NOT EXISTS earned_badges (
+            student_id TEXT NOT NULL,
+            badge_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (student_id, badge_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_earned_badges_badge_id ON earned_badges (badge_id);
+        CREATE TABLE IF NOT EXISTS cognitive_metrics (
+            student_id TEXT NOT NULL,
+            task_name TEXT NOT NULL,
+            metric_name TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (student_id, task_name, metric_name)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, db_path: str = LEARNERS_SQLITE_DB_FILE, **store_options: Any):
+        """Opens (and if needed creates) the database.
+
+        Args:
+            db_path (str, optional): Path of the SQLite database file. Defaults to LEARNERS_SQLITE_DB_FILE.
+            **store_options (Any): Options passed to `LearnerProfileStore` (cache size, flush interval, factory).
+        """
+        super().__init__(**store_options)
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Access is serialised by the store lock, so the connection may be shared across threads
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self._SCHEMA)
+        learner_columns = {row[1] for row in self._connection.execute("PRAGMA table_info(learners)")}
+        if "recent_content_ids" not in learner_columns: # Databases created before the column existed
+            self._connection.execute("ALTER TABLE learners ADD COLUMN recent_content_ids TEXT NOT NULL DEFAULT '[]'")
+        self._connection.commit()
+
+    _READ_CHUNK_SIZE = 500
+    """Learner IDs per `IN (...)` query, below SQLite's bound-parameter limit."""
+
+    def _read_profile_data(self, learner_id: str) -> Optional[Dict[str, Any]]:
+        return self._read_many_profile_data([learner_id]).get(learner_id)
+
+    def _read_many_profile_data(self, learner_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        cursor = self._connection.cursor()
+        for start in range(0, len(learner_ids), self._READ_CHUNK_SIZE):
+            chunk = learner_ids[start:start + self._READ_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            for student_id, preferences, interests, struggle_areas, current_lo_id, recent_content_ids in cursor.execute(
+                "SELECT student_id, learning_preferences, interests, struggle_areas, current_learning_objective_id, "
+                f"recent_content_ids FROM learners WHERE student_id IN ({placeholders})", chunk
+            ):
+                found[student_id] = {
+                    "student_id": student_id,
+                    "learning_preferences": json.loads(preferences),
+                    "interests": json.loads(interests),
+                    "struggle_areas": json.loads(struggle_areas),
+                    "cognitive_metrics": {},
+                    "completed_los": [],
+                    "current_learning_objective_id": current_lo_id,
+                    "earned_badges_data": {},
+                    "recent_content_ids": json.loads(recent_content_ids)
+                }
+            for student_id, lo_id in cursor.execute(
+                f"SELECT student_id, lo_id FROM completed_los WHERE student_id IN ({placeholders})", chunk
+            ):
+                found[student_id]["completed_los"].append(lo_id)
+            for student_id, badge_id, badge_data in cursor.execute(
+                f"SELECT student_id, badge_id, data FROM earned_badges WHERE student_id IN ({placeholders})", chunk
+            ):
+                found[student_id]["earned_badges_data"][badge_id] = json.loads(badge_data)
+            for student_id, task_name, metric_name, value in cursor.execute(
+                "SELECT student_id, task_name, metric_name, value FROM cognitive_metrics "
+                f"WHERE student_id IN ({placeholders})", chunk
+            ):
+                found[student_id]["cognitive_metrics"].setdefault(task_name, {})[metric_name] = json.loads(value)
+        return found
+
+    def _write_profiles(self, profiles: List[LearnerProfileBase]) -> None:
+        updated_at = datetime.datetime.utcnow().isoformat() + "Z"
+        learner_rows: List[Tuple[Any, ...]] = []
+        completed_rows: List[Tuple[str, str]] = []
+        badge_rows: List[Tuple[str, str, str]] = []
+        metric_rows: List[Tuple[str, str, str, str]] = []
+        for profile in profiles:
+            data = profile.to_dict()
+            student_id = data["student_id"]
+            learner_rows.append((
+                student_id, json.dumps(data["learning_preferences"]), json.dumps(data["interests"]),
+                json.dumps(data["struggle_areas"]), data["current_learning_objective_id"],
+                json.dumps(data["recent_content_ids"]), updated_at
+            ))
+            completed_rows.extend((student_id, lo_id) for lo_id in data["completed_los"])
+            badge_rows.extend((student_id, badge_id, json.dumps(badge)) for badge_id, badge in data["earned_badges_data"].items())
+            metric_rows.extend(
+                (student_id, task_name, metric_name, json.dumps(value))
+                for task_name, metrics in data["cognitive_metrics"].items()
+                for metric_name, value in metrics.items()
+            )
+        student_ids = [(row[0],) for row in learner_rows]
+
+        with self._connection: # One transaction per batch
+            self._connection.executemany(
+                "INSERT INTO learners (student_id, learning_preferences, interests, struggle_areas, "
+                "current_learning_objective_id, recent_content_ids, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(student_id) DO UPDATE SET learning_preferences = excluded.learning_preferences, "
+                "interests = excluded.interests, struggle_areas = excluded.struggle_areas, "
+                "current_learning_objective_id = excluded.current_learning_objective_id, "
+                "recent_content_ids = excluded.recent_content_ids, updated_at = excluded.updated_at",
+                learner_rows
+            )
+            # Child rows are replaced wholesale so removals are persisted too
+            for table in ("completed_los", "earned_badges", "cognitive_metrics"):
+                self._connection.executemany(f"DELETE FROM {table} WHERE student_id = ?", student_ids)
+            self._connection.executemany("INSERT INTO completed_los (student_id, lo_id) VALUES (?, ?)", completed_rows)
+            self._connection.executemany("INSERT INTO earned_badges (student_id, badge_id, data) VALUES (?, ?, ?)", badge_rows)
+            self._connection.executemany(
+                "INSERT INTO cognitive_metrics (student_id, task_name, metric_name, value) VALUES (?, ?, ?, ?)", metric_rows
+            )
+
+    def list_learners(self) -> List[str]:
+        with self._lock:
+            return [student_id for (student_id,) in self._connection.execute("SELECT student_id FROM learners ORDER BY student_id")]
+
+    def learners_who_completed(self, lo_id: str) -> List[str]:
+        """Lists the learners who have completed an LO, using the LO index (pending changes are flushed first).
+
+        Args:
+            lo_id (str): The LO ID to look up.
+
+        Returns:
+            List[str]: The learner IDs, sorted.
+        """
+        with self._lock:
+            self.flush()
+            return [student_id for (student_id,) in self._connection.execute(
+                "SELECT student_id FROM completed_los WHERE lo_id = ? ORDER BY student_id", (lo_id,)
+            )]
+
+    def completion_counts_by_lo(self) -> Dict[str, int]:
+        """Counts how many learners have completed each LO (pending changes are flushed first).
+
+        Returns:
+            Dict[str, int]: Number of learners per LO ID.
+        """
+        with self._lock:
+            self.flush()
+            return dict(self._connection.execute("SELECT lo_id, COUNT(*) FROM completed_los GROUP BY lo_id"))
+
+    def close(self) -> None:
+        """Flushes pending changes, stops the flush timer and closes the database connection."""
+        with self._lock:
+            super().close()
+            self._connection.close()
+
+
+# --- Main execution for testing ---
+if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
+    logger.info("--- Learner Profile Persistence (Standalone Test) ---")
+    demo_dir = os.path.join(tempfile.gettempdir(), "dala_learners_demo")
+    with JSONLearnerProfileStore(demo_dir, flush_interval_seconds=60.0) as store:
+        profile = store.get_or_create_profile(DEFAULT_STUDENT_ID, run_full_hlp_assessment)
+        profile.add_interest("Robotics")
+        profile.mark_lo_completed("Y4MD_LO1")
+        logger.info(f"Stored learners in {demo_dir}: {store.list_learners()}")
+    reloaded = JSONLearnerProfileStore(demo_dir).get_profile(DEFAULT_STUDENT_ID)
+    logger.info(f"Reloaded profile: {reloaded}")
+
+    with SQLiteLearnerProfileStore(os.path.join(demo_dir, "learners.sqlite3")) as sqlite_store:
+        sqlite_store.save_profile(reloaded)
+        logger.info(f"Learners who completed Y4MD_LO1: {sqlite_store.learners_who_completed('Y4MD_LO1')}")
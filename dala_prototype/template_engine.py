@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Template Engine Module
+
+This module contains:
+1.  `CompiledTemplate`, a `str.format`-style template parsed once into a list of literal and
+    field segments, rendered by a single list join.
+2.  `get_compiled_template`, which loads and compiles a template file once and only recompiles
+    it when the file's modification time changes.
+3.  `join_fragments`, the list-join helper used to build repeated HTML fragments.
+"""
+
+import os
+import string
+import threading
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import setup_logging
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """A template using `str.format` syntax, parsed once into precompiled segments.
+
+    `render(**values)` produces exactly what `source.format(**values)` would, but without
+    re-parsing the (large) template on every call. Plain `{name}` fields, conversions (`!r`,
+    `!s`, `!a`) and format specs are supported; dotted or indexed field names (`{a.b}`, `{a[0]}`)
+    are resolved through `string.Formatter.get_field`. Positional (`{}`/`{0}`) fields are not.
+
+    Attributes:
+        source (str): The template text.
+        field_names (Tuple[str, ...]): The field names in order of appearance (may repeat).
+    """
+    __slots__ = ("source", "field_names", "_segments")
+
+    def __init__(self, source: str):
+        """Parses the template text.
+
+        Args:
+            source (str): Template text in `str.format` syntax.
+
+        Raises:
+            ValueError: If the template is malformed or uses positional fields.
+        """
+        self.source = source
+        # Each segment is (literal_text, field_name, conversion, format_spec); field_name is None
+        # for the trailing literal. Nested replacement fields in a format spec are not supported.
+        segments: List[Tuple[str, Optional[str], Optional[str], str]] = []
+        for literal_text, field_name, format_spec, conversion in _FORMATTER.parse(source):
+            if field_name is not None:
+                if field_name == "" or field_name[0].isdigit():
+                    raise ValueError(f"Positional template field '{{{field_name}}}' is not supported.")
+                if "{" in (format_spec or ""):
+                    raise ValueError(f"Nested replacement field in format spec of '{{{field_name}}}' is not supported.")
+            segments.append((literal_text, field_name, conversion, format_spec or ""))
+        self._segments = tuple(segments)
+        self.field_names = tuple(segment[1] for segment in segments if segment[1] is not None)
+
+    def render(self, **values: Any) -> str:
+        """Renders the template.
+
+        Args:
+            **values (Any): Values for the template's fields.
+
+        Returns:
+            str: The rendered text.
+
+        Raises:
+            KeyError: If a field has no value, as with `str.format`.
+        """
+        parts: List[str] = []
+        append = parts.append
+        for literal_text, field_name, conversion, format_spec in self._segments:
+            if literal_text:
+                append(literal_text)
+            if field_name is None:
+                continue
+            if field_name in values:
+                value = values[field_name]
+            else:
+                value, _ = _FORMATTER.get_field(field_name, (), values)
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            append(value if type(value) is str and not format_spec else format(value, format_spec))
+        return "".join(parts)
+
+
+_template_cache: Dict[str, Tuple[int, CompiledTemplate]] = {}
+_template_cache_lock = threading.Lock()
+
+
+def get_compiled_template(template_path: str) -> CompiledTemplate:
+    """Returns the compiled template for a file, compiling it only when the file has changed.
+
+    Compiled templates are cached per path and keyed by the file's modification time, so edits
+    to a template are picked up on the next render without restarting the process.
+
+    Args:
+        template_path (str): Path to the template file.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+
+    Raises:
+        FileNotFoundError: If the template file doesn't exist.
+    """
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    cached = _template_cache.get(template_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with _template_cache_lock:
+        cached = _template_cache.get(template_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template = CompiledTemplate(f.read())
+        _template_cache[template_path] = (mtime_ns, template)
+        logger.info("Compiled HTML template from %s (%s fields)", template_path, len(template.field_names))
+        return template
+
+
+def clear_template_cache() -> None:
+    """Drops every cached compiled template."""
+    with _template_cache_lock:
+        _template_cache.clear()
+
+
+def join_fragments(items: Iterable[Any], render_item: Callable[[Any], str]) -> str:
+    """Renders each item to a fragment and joins the fragments once.
+
+    Args:
+        items (Iterable[Any]): The items to render.
+        render_item (Callable[[Any], str]): Renders one item.
+
+    Returns:
+        str: The concatenated fragments.
+    """
+    return "".join([render_item(item) for item in items])
+
+
+# --- Main execution for testing ---
+if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
+    demo = CompiledTemplate("<h1>{title}</h1><ul>{items_html}</ul><p>{count:>3}</p>")
+    rendered = demo.render(
+        title="Demo",
+        items_html=join_fragments(["a", "b"], lambda item: f"<li>{item}</li>"),
+        count=2
+    )
+    logger.info(f"Rendered: {rendered}")
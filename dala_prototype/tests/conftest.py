@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Test Fixtures
+
+Makes the DALA modules (and the synthetic data generators of the benchmarks) importable and
+provides small synthetic curricula, content stores and learner profiles.
+"""
+
+import os
+import sys
+import logging
+
+import pytest
+
+BENCHMARKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+if BENCHMARKS_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARKS_DIR)
+
+from bench_common import make_synthetic_curriculum, make_synthetic_content, make_synthetic_profiles  # noqa: E402
+from curriculum_content_module import CurriculumContentStore  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logging():
+    """Keeps the per-item INFO records of the modules out of the test output."""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def curriculum():
+    return make_synthetic_curriculum(40)
+
+
+@pytest.fixture
+def content_store(curriculum):
+    return CurriculumContentStore(curriculum, make_synthetic_content(40, 12))
+
+
+@pytest.fixture
+def profiles(curriculum):
+    return make_synthetic_profiles(30, curriculum)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""Field-scoped dispatch of the event-driven badge engine."""
+
+import pytest
+
+from hlp_module import (
+    BADGE_DEFINITIONS,
+    BadgeCriteriaError,
+    BadgeCriteriaRegistry,
+    BadgeEngine,
+    LearnerProfile,
+    LearnerProfileBase,
+)
+
+
+@pytest.fixture
+def counting_engine(monkeypatch):
+    """Installs an engine whose criteria record their calls: one scoped to struggle areas, one unscoped."""
+    calls = []
+    registry = BadgeCriteriaRegistry()
+    registry.register(lambda profile: calls.append("helping_hand") or bool(profile.struggle_areas), name="check_scoped")
+    registry.register(lambda profile: calls.append("curiosity_spark") or False, name="check_unscoped")
+    definitions = {
+        "helping_hand": dict(BADGE_DEFINITIONS["helping_hand"], criteria_check_function="check_scoped"),
+        "curiosity_spark": dict(BADGE_DEFINITIONS["curiosity_spark"], criteria_check_function="check_unscoped",
+                                depends_on=[]),
+    }
+    engine = BadgeEngine(definitions, criteria_registry=registry)
+    monkeypatch.setattr(LearnerProfileBase, "badge_engine", engine)
+    return engine, calls
+
+
+def test_catalogue_is_indexed_by_field(counting_engine):
+    engine, _ = counting_engine
+    assert engine.unscoped_badges == ("curiosity_spark",)
+    assert engine.badges_by_field == {"struggle_areas": ("helping_hand", "curiosity_spark")}
+
+
+def test_mutation_only_evaluates_subscribed_and_unscoped_badges(counting_engine):
+    _, calls = counting_engine
+    profile = LearnerProfile("engine_student")
+    profile.update_preference("task", "visual")
+    assert calls == ["curiosity_spark"]
+
+    calls.clear()
+    profile.add_struggle_area("fractions")
+    assert calls[:2] == ["helping_hand", "curiosity_spark"]
+    assert profile.has_badge("helping_hand")
+
+    calls.clear()
+    profile.add_struggle_area("decimals")
+    assert "helping_hand" not in calls # Earned badges are not re-evaluated
+
+
+def test_unregistered_criteria_fail_when_the_engine_is_built():
+    with pytest.raises(BadgeCriteriaError, match="check_missing"):
+        BadgeEngine({"helping_hand": dict(BADGE_DEFINITIONS["helping_hand"], criteria_check_function="check_missing")},
+                    criteria_registry=BadgeCriteriaRegistry())
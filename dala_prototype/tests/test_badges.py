@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+"""Badge criteria dispatch in `hlp_module`."""
+
+import logging
+
+from hlp_module import LearnerProfile, _execute_badge_criteria_check
+
+
+def test_unregistered_criteria_function_is_warned_about_once(caplog):
+    logging.disable(logging.NOTSET)
+    profile = LearnerProfile("badge_student")
+    with caplog.at_level(logging.WARNING, logger="hlp_module"):
+        for _ in range(3):
+            assert _execute_badge_criteria_check("check_missing_criteria_for_test", profile) is False
+    warnings = [record for record in caplog.records if "check_missing_criteria_for_test" in record.getMessage()]
+    assert len(warnings) == 1
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""Round trips between `LearnerProfile` and `CompactLearnerProfile`, pathway parity and bitset eligibility."""
+
+from curriculum_content_module import PrerequisiteGraph
+from dcw_apg_module import PathwayGenerator
+from hlp_module import CompactLearnerProfile, LearnerProfile, make_session_rng
+
+
+def _make_profile(learner_id="compact_student"):
+    profile = LearnerProfile(learner_id)
+    profile.update_preference("visual_task_1", "visual")
+    profile.add_interest("Robotics")
+    profile.add_interest("Not a predefined interest")
+    profile.mark_lo_completed("SYN_LO_0")
+    profile.mark_lo_completed("LO_OUTSIDE_THE_CURRICULUM")
+    profile.record_served_content(["SYN_CONT_1_0", "SYN_CONT_1_1"])
+    return profile
+
+
+def test_compact_round_trip(content_store):
+    profile = _make_profile()
+    compact = CompactLearnerProfile.from_profile(profile, content_store.prerequisite_graph)
+    assert compact.to_dict() == profile.to_dict()
+    assert compact.to_profile().to_dict() == profile.to_dict()
+    assert compact.has_completed_lo("SYN_LO_0") and compact.has_completed_lo("LO_OUTSIDE_THE_CURRICULUM")
+    assert compact.completed_lo_bits != 0
+
+
+def test_compact_profiles_get_the_same_pathways(content_store, profiles):
+    for profile in profiles:
+        compact = CompactLearnerProfile.from_profile(profile, content_store.prerequisite_graph)
+        pathways = [
+            PathwayGenerator(learner, content_store, rng=make_session_rng(profile.learner_id, "compact")).generate_initial_pathway()
+            for learner in (profile, compact)
+        ]
+        assert pathways[0] == pathways[1]
+
+
+def test_bitset_eligibility_matches_the_tracker():
+    curriculum = [
+        {"id": "A", "prerequisites": []},
+        {"id": "B", "prerequisites": ["A"]},
+        {"id": "C", "prerequisites": ["A", "B"]},
+        {"id": "D", "prerequisites": ["EXTERNAL"]},
+        {"id": "E", "prerequisites": ["C"]},
+    ]
+    graph = PrerequisiteGraph(curriculum)
+    for completed in ([], ["A"], ["A", "B"], ["B", "EXTERNAL"], ["A", "B", "C", "EXTERNAL"]):
+        profile = CompactLearnerProfile("bits_student", graph)
+        for lo_id in completed:
+            profile.mark_lo_completed(lo_id)
+        expected = graph.create_tracker(completed).get_eligible_lo_ids()
+        assert graph.eligible_lo_ids_for_bits(profile.completed_lo_bits, profile.has_completed_lo) == expected
+    assert graph.prerequisite_masks == {"A": 0, "B": 0b1, "C": 0b11, "D": None, "E": 0b100}
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""Recent-content hold-back: served pathways are recorded when the caller opts in, and for stored learners' pages."""
+
+from dcw_apg_module import PathwayGenerator, default_pathway_cache, pathway_content_ids
+from generate_interface import render_html_interface
+from hlp_module import make_session_rng
+from profile_persistence_module import JSONLearnerProfileStore
+
+
+def _pathway(profile, store, **options):
+    # The same session every time, so each request picks the same LOs
+    generator = PathwayGenerator(profile, store, rng=make_session_rng(profile.learner_id, "history"))
+    return generator.generate_initial_pathway(**options)
+
+
+def test_generation_does_not_record_history_by_default(content_store, profiles):
+    profile = profiles[0]
+    first = _pathway(profile, content_store)
+    assert profile.recent_content is None
+    assert _pathway(profile, content_store) == first
+
+
+def test_recorded_content_is_held_back(content_store, profiles):
+    for profile in profiles:
+        served = _pathway(profile, content_store, record_history=True)
+        assert all(content_id in profile.recent_content for content_id in pathway_content_ids(served))
+        following = _pathway(profile, content_store)
+        assert [lo["id"] for lo in following] == [lo["id"] for lo in served]
+        # Every synthetic LO has more content than one pathway selects, so nothing is repeated
+        assert not set(pathway_content_ids(following)) & set(pathway_content_ids(served))
+
+
+def test_rendered_pages_record_served_content(content_store, tmp_path):
+    served = []
+    with JSONLearnerProfileStore(str(tmp_path / "learners")) as profile_store:
+        for _ in range(2):
+            # A fresh cache, as for a page requested after the cached pathway expired
+            default_pathway_cache.clear()
+            render_html_interface("history_student", content_store, profile_store=profile_store, session="history")
+            served.append(profile_store.get_profile("history_student").recent_content.to_list())
+    default_pathway_cache.clear()
+    first_page, second_page = served[0], served[1][len(served[0]):]
+    assert first_page and second_page
+    assert not set(first_page) & set(second_page)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""The per-LO content index: difficulty order, type buckets and lookups through the store."""
+
+from curriculum_content_module import CurriculumContentStore, LOContentIndex, normalise_content_item
+
+
+def _record(content_id, content_type, difficulty):
+    return normalise_content_item({"id": content_id, "type": content_type, "difficulty": difficulty})
+
+
+def test_records_are_sorted_stably_and_bucketed_by_type():
+    records = [
+        _record("H1", "video", "hard"),
+        _record("M1", "game", "medium"),
+        _record("E1", "video", "easy"),
+        _record("U1", "game", "unknown"),
+        _record("M2", "video", "medium"),
+        _record("E2", "game", "easy"),
+    ]
+    index = LOContentIndex(records)
+    assert [record.content_id for record in index.records] == ["E1", "E2", "M1", "M2", "H1", "U1"]
+    assert {content_type: [record.content_id for record in bucket] for content_type, bucket in index.by_type.items()} == {
+        "video": ["E1", "M2", "H1"], "game": ["E2", "M1", "U1"]
+    }
+    assert [item["id"] for item in index.sorted_items] == ["E1", "E2", "M1", "M2", "H1", "U1"]
+    assert LOContentIndex.from_sorted(index.records).by_type == index.by_type
+    assert len(index) == 6
+
+
+def test_first_unused_of_type_skips_used_records():
+    index = LOContentIndex([_record("V1", "video", "easy"), _record("V2", "video", "medium"), _record("G1", "game", "easy")])
+    assert index.first_unused_of_type("video", set()).content_id == "V1"
+    assert index.first_unused_of_type("video", {"V1"}).content_id == "V2"
+    assert index.first_unused_of_type("video", {"V1", "V2"}) is None
+    assert index.first_unused_of_type("worksheet_pdf", set()) is None
+
+
+def test_store_builds_an_index_per_lo():
+    curriculum = {"learning_objectives": [{"id": "LO1", "prerequisites": []}, {"id": "LO2", "prerequisites": []}]}
+    content = [
+        {"id": "C1", "type": "video", "difficulty": "hard", "learning_objectives_covered": ["LO1"]},
+        {"id": "C2", "type": "game", "difficulty": "easy", "learning_objectives_covered": ["LO1", "LO2"]},
+    ]
+    store = CurriculumContentStore(curriculum, content)
+    assert [item["id"] for item in store.get_content_index_for_lo("LO1").sorted_items] == ["C2", "C1"]
+    assert [item["id"] for item in store.get_content_index_for_lo("LO2").sorted_items] == ["C2"]
+    assert len(store.get_content_index_for_lo("LO_WITHOUT_CONTENT")) == 0
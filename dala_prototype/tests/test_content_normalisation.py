@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""Normalisation of content items that use alternative field names and difficulty labels."""
+
+import pytest
+
+from curriculum_content_module import CurriculumContentStore, normalise_content_item, normalise_difficulty
+
+
+def test_aliased_fields_are_mapped_onto_canonical_keys():
+    raw_item = {"content_id": "ALT_1", "activity_type": "game", "difficulty_level": "Intermediate",
+                "learning_objectives_covered": ["LO1"]}
+    record = normalise_content_item(raw_item)
+    assert (record.content_id, record.content_type, record.difficulty) == ("ALT_1", "game", "medium")
+    assert record.learning_objectives_covered == ("LO1",)
+    assert record.item is not raw_item
+    assert record.item["id"] == "ALT_1" and record.item["type"] == "game" and record.item["difficulty"] == "medium"
+    assert record.item["content_id"] == "ALT_1"
+    assert "id" not in raw_item
+
+
+def test_canonical_item_is_kept_by_identity():
+    raw_item = {"id": "C1", "type": "video", "difficulty": "easy"}
+    assert normalise_content_item(raw_item).item is raw_item
+
+
+@pytest.mark.parametrize("label, expected", [
+    ("Easy", "easy"), (" HARD ", "hard"), ("beginner", "easy"), ("Intermediate", "medium"),
+    ("advanced", "hard"), ("expert", "default"), (None, "default"), (3, "default"),
+])
+def test_difficulty_labels(label, expected):
+    assert normalise_difficulty(label) == expected
+
+
+def test_item_without_id_is_rejected_and_skipped_by_the_store():
+    with pytest.raises(ValueError, match="no ID field"):
+        normalise_content_item({"title": "Untitled", "type": "video"})
+    curriculum = {"learning_objectives": [{"id": "LO1", "prerequisites": []}]}
+    content = [
+        {"title": "Untitled", "type": "video", "learning_objectives_covered": ["LO1"]},
+        {"content_id": "ALT_1", "activity_type": "game", "learning_objectives_covered": ["LO1"]},
+    ]
+    store = CurriculumContentStore(curriculum, content)
+    assert list(store.content_library) == ["ALT_1"]
+    assert store.lo_to_content_map["LO1"] == ["ALT_1"]
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""Data file discovery, store sharing and incremental reloads of `ContentStoreRegistry`."""
+
+import json
+
+from curriculum_content_module import ContentStoreRegistry, discover_data_files
+
+
+def _write_json(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_discover_classifies_by_top_level_keys(tmp_path, curriculum):
+    curriculum_path = _write_json(tmp_path / "b_curriculum.json", curriculum)
+    # learning_objectives after a large value still makes a curriculum slice
+    late_key_path = _write_json(
+        tmp_path / "c_curriculum.json", {"notes": [{"text": "]}"}] * 50, "learning_objectives": []}
+    )
+    content_path = _write_json(tmp_path / "a_content.json", [{"id": "C1", "learning_objectives_covered": ["X"]}])
+    lines_path = tmp_path / "d_content.jsonl"
+    lines_path.write_text('{"id": "C2"}\n', encoding="utf-8")
+    _write_json(tmp_path / "e_settings.json", {"theme": "dark", "items": [1, 2, 3]})
+    (tmp_path / "f_broken.json").write_text('{"learning', encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not data", encoding="utf-8")
+
+    assert discover_data_files(str(tmp_path)) == ([curriculum_path, late_key_path], [content_path, str(lines_path)])
+
+
+def test_unchanged_sources_share_one_store(tmp_path, curriculum):
+    _write_json(tmp_path / "curriculum.json", curriculum)
+    _write_json(tmp_path / "content.json", [{"id": "C1", "learning_objectives_covered": ["SYN_LO_0"]}])
+    registry = ContentStoreRegistry()
+    store = registry.get_data_dir_store(str(tmp_path))
+    assert registry.get_data_dir_store(str(tmp_path)) is store
+    assert store.content_version is not None
+    assert [item["id"] for item in store.get_content_for_lo("SYN_LO_0")] == ["C1"]
+
+
+def _assert_matches_fresh_build(store, data_dir):
+    fresh = ContentStoreRegistry(use_content_hashes=True).get_data_dir_store(data_dir)
+    assert store.content_version == fresh.content_version
+    assert store.get_learning_objectives() == fresh.get_learning_objectives()
+    assert store.content_library == fresh.content_library
+    assert store.lo_to_content_map == fresh.lo_to_content_map
+    assert set(store.lo_details_map) == set(fresh.lo_details_map)
+    for lo_id in fresh.lo_details_map:
+        assert store.get_content_for_lo(lo_id) == fresh.get_content_for_lo(lo_id)
+        assert [record.item for record in store.get_content_index_for_lo(lo_id).records] == \
+               [record.item for record in fresh.get_content_index_for_lo(lo_id).records]
+    assert store.prerequisite_graph.topological_order == fresh.prerequisite_graph.topological_order
+
+
+def _content(content_id, lo_id, difficulty="medium", **fields):
+    return {"id": content_id, "type": "quiz", "difficulty": difficulty, "learning_objectives_covered": [lo_id], **fields}
+
+
+def test_incremental_reload_matches_a_fresh_build(tmp_path, curriculum, monkeypatch):
+    data_dir = str(tmp_path)
+    _write_json(tmp_path / "curriculum.json", curriculum)
+    first = [_content(f"A{i}", f"SYN_LO_{i % 5}", "easy" if i % 2 else "hard") for i in range(10)]
+    second = [_content(f"B{i}", f"SYN_LO_{i % 5}") for i in range(10)]
+    _write_json(tmp_path / "a_content.json", first)
+    _write_json(tmp_path / "b_content.json", second)
+    registry = ContentStoreRegistry(use_content_hashes=True)
+    original = registry.get_data_dir_store(data_dir)
+    rebuilds = []
+    build = registry._build
+    monkeypatch.setattr(registry, "_build", lambda *args: rebuilds.append(args[0]) or build(*args))
+
+    # Edit, move to another LO, remove and add items in one file
+    first[0]["title"] = "Edited"
+    first[1] = _content("A1", "SYN_LO_7", "hard")
+    del first[9]
+    first.append(_content("A_NEW", "SYN_LO_0", "easy"))
+    _write_json(tmp_path / "a_content.json", first)
+    assert registry.refresh() == 1
+    patched = registry.get_data_dir_store(data_dir)
+    assert patched is not original and not rebuilds
+    assert original.get_content_by_id("A0").get("title") is None  # the old store is left untouched
+    # LOs the edit did not touch share their content index with the previous store
+    assert patched.get_content_index_for_lo("SYN_LO_3") is original.get_content_index_for_lo("SYN_LO_3")
+    _assert_matches_fresh_build(patched, data_dir)
+
+    # An item the other file already defines: the earlier file wins (the store is rebuilt)
+    second.append(_content("A3", "SYN_LO_9", title="Shadowed"))
+    _write_json(tmp_path / "b_content.json", second)
+    assert registry.refresh() == 1
+    assert len(rebuilds) == 1
+    _assert_matches_fresh_build(registry.get_data_dir_store(data_dir), data_dir)
+
+    # Editing an ID that is also defined in another file (rebuilt as well)
+    a3_position = [item["id"] for item in first].index("A3")
+    first[a3_position]["title"] = "Edited twice"
+    _write_json(tmp_path / "a_content.json", first)
+    assert registry.refresh() == 1
+    assert len(rebuilds) == 2
+    assert registry.get_data_dir_store(data_dir).get_content_by_id("A3")["title"] == "Edited twice"
+    _assert_matches_fresh_build(registry.get_data_dir_store(data_dir), data_dir)
+
+    # Removing it from the winning file hands the ID to the other file
+    del first[a3_position]
+    _write_json(tmp_path / "a_content.json", first)
+    assert registry.refresh() == 1
+    reloaded = registry.get_data_dir_store(data_dir)
+    assert reloaded.get_content_by_id("A3")["title"] == "Shadowed"
+    _assert_matches_fresh_build(reloaded, data_dir)
+
+    # A curriculum change is patched in place
+    curriculum["learning_objectives"][6]["prerequisites"] = []
+    _write_json(tmp_path / "curriculum.json", curriculum)
+    assert registry.refresh() == 1
+    assert len(rebuilds) == 3
+    _assert_matches_fresh_build(registry.get_data_dir_store(data_dir), data_dir)
+    assert registry.refresh() == 0
+
+
+def test_malformed_edit_keeps_the_previous_store(tmp_path, curriculum):
+    _write_json(tmp_path / "curriculum.json", curriculum)
+    _write_json(tmp_path / "content.json", [_content("C1", "SYN_LO_0")])
+    registry = ContentStoreRegistry(use_content_hashes=True)
+    store = registry.get_data_dir_store(str(tmp_path))
+    (tmp_path / "content.json").write_text('[{"id": "C1"', encoding="utf-8")
+    assert registry.refresh() == 0
+    assert registry.get_data_dir_store(str(tmp_path)) is store
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""Lookup and pathway parity of a compiled content store snapshot, and its read-only guards."""
+
+import pytest
+
+from content_snapshot_module import compile_store_snapshot, load_store_snapshot
+from dcw_apg_module import PathwayGenerator
+from hlp_module import make_session_rng
+
+
+@pytest.fixture(params=[False, True], ids=["lazy", "preloaded"])
+def snapshot_store(request, content_store, tmp_path):
+    snapshot_path = compile_store_snapshot(content_store, str(tmp_path / "store.dalasnap"))
+    store = load_store_snapshot(snapshot_path, preload=request.param, hot_lo_ids=["SYN_LO_0"])
+    yield store
+    store.close()
+
+
+def test_snapshot_lookups_match_source(content_store, snapshot_store):
+    assert dict(snapshot_store.lo_to_content_map) == content_store.lo_to_content_map
+    assert dict(snapshot_store.content_library) == content_store.content_library
+    assert snapshot_store.get_learning_objectives() == content_store.get_learning_objectives()
+    assert snapshot_store.get_content_by_id("no such id") is None
+    for lo_id in content_store.lo_details_map:
+        assert snapshot_store.get_lo_by_id(lo_id) == content_store.get_lo_by_id(lo_id)
+        assert [record.item for record in snapshot_store.get_content_index_for_lo(lo_id).records] == \
+               [record.item for record in content_store.get_content_index_for_lo(lo_id).records]
+    assert snapshot_store.prerequisite_graph.topological_order == content_store.prerequisite_graph.topological_order
+
+
+def test_snapshot_pathways_match_source(content_store, snapshot_store, profiles):
+    for profile in profiles:
+        pathways = [
+            PathwayGenerator(profile, store, rng=make_session_rng(profile.learner_id, "snapshot")).generate_initial_pathway()
+            for store in (content_store, snapshot_store)
+        ]
+        assert pathways[0] == pathways[1]
+
+
+def test_snapshot_store_is_read_only(snapshot_store):
+    with pytest.raises(TypeError, match="read-only"):
+        snapshot_store.with_changes(removed_content_ids=["SYN_CONT_0_0"])
+    with pytest.raises(TypeError, match="read-only"):
+        snapshot_store._ingest_content([])
+    with pytest.raises(TypeError):
+        type(snapshot_store).from_content_files({}, [])
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""The streaming JSON readers agree with `json.load` at every chunk size and reject malformed files."""
+
+import json
+
+import pytest
+
+from curriculum_content_module import iter_json_array_items, iter_json_lines
+
+CHUNK_SIZES = [1, 2, 3, 7, 64]
+
+ARRAYS = [
+    [],
+    [1, -2.5e3, 0, True, False, None],
+    ["plain", "", "a]b", "c,d", 'quote " inside', "back\\slash", "\\\"", "ü{é}", " "],
+    [{"id": "C1", "tags": ["x]", "y,"]}, [[], {}], {"nested": {"deep": [1, [2, [3]]]}}],
+    [12345678901234567890, 1e-7, "end"],
+]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_array_items_match_json_load(tmp_path, chunk_size, indent):
+    path = tmp_path / "content.json"
+    for array in ARRAYS:
+        path.write_text(json.dumps(array, indent=indent, ensure_ascii=False), encoding="utf-8")
+        assert list(iter_json_array_items(str(path), chunk_size)) == json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text, message", [
+    ('{"id": 1}', "does not contain a JSON array"),
+    ("", "does not contain a JSON array"),
+    ("[1, 2", "Expected ',' or ']'"),
+    ('[{"id": "a"', "Malformed JSON array element"),
+    ('[{"id": "a"} {"id": "b"}]', "Expected ',' or ']'"),
+    ('[1, 2] 3', "Unexpected data after the JSON array"),
+    ("[] []", "Unexpected data after the JSON array"),
+    ('["unterminated]', "Malformed JSON array element"),
+    ("[1,, 2]", "Malformed JSON array element"),
+    ("[tru]", "Malformed JSON array element"),
+])
+def test_malformed_arrays_raise_value_error(tmp_path, chunk_size, text, message):
+    path = tmp_path / "broken.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array_items(str(path), chunk_size))
+
+
+def test_json_lines_skip_blank_lines(tmp_path):
+    path = tmp_path / "content.jsonl"
+    path.write_text('{"id": "C1"}\n\n  \n["a]", 2]\n"text"\n', encoding="utf-8")
+    assert list(iter_json_lines(str(path))) == [{"id": "C1"}, ["a]", 2], "text"]
+
+
+def test_malformed_json_line_reports_its_line_number(tmp_path):
+    path = tmp_path / "content.jsonl"
+    path.write_text('{"id": "C1"}\n\n{"id": \n', encoding="utf-8")
+    items = iter_json_lines(str(path))
+    assert next(items) == {"id": "C1"}
+    with pytest.raises(ValueError, match="line 3"):
+        next(items)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Eligibility tracking of `PathwayGenerator` when profiles are changed behind its back."""
+
+from curriculum_content_module import CurriculumContentStore
+from dcw_apg_module import PathwayGenerator
+from hlp_module import LearnerProfile
+
+
+def _store():
+    curriculum = {
+        "learning_objectives": [
+            {"id": "A", "prerequisites": []},
+            {"id": "B", "prerequisites": []},
+            {"id": "C", "prerequisites": ["A"]},
+            {"id": "D", "prerequisites": ["B"]},
+        ]
+    }
+    return CurriculumContentStore(curriculum, [])
+
+
+def test_tracker_follows_mark_lo_completed():
+    store = _store()
+    profile = LearnerProfile("eligibility_student")
+    generator = PathwayGenerator(profile, store)
+    assert generator._get_eligible_lo_ids() == ["A", "B"]
+    profile.mark_lo_completed("A")
+    assert generator._get_eligible_lo_ids() == ["B", "C"]
+
+
+def test_tracker_is_rebuilt_after_a_same_size_direct_change():
+    store = _store()
+    profile = LearnerProfile("eligibility_student")
+    profile.completed_los.add("A")
+    generator = PathwayGenerator(profile, store)
+    assert generator._get_eligible_lo_ids() == ["B", "C"]
+    # Swapping one completed LO for another keeps the count, which must not hide the change
+    profile.completed_los.clear()
+    profile.completed_los.add("B")
+    assert generator._get_eligible_lo_ids() == ["A", "D"]
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+"""Page rendering against a learner profile store: only the served content is recorded."""
+
+from generate_interface import render_html_interface
+from profile_persistence_module import JSONLearnerProfileStore
+
+
+def _without_history(profile_data):
+    return {field: value for field, value in profile_data.items() if field != "recent_content_ids"}
+
+
+def test_render_leaves_the_stored_progress_unchanged(content_store, tmp_path):
+    store_dir = str(tmp_path / "learners")
+    with JSONLearnerProfileStore(store_dir) as profile_store:
+        render_html_interface("render_student", content_store, profile_store=profile_store, session="render")
+        stored = _without_history(profile_store.get_profile("render_student").to_dict())
+        for _ in range(3):
+            page = render_html_interface("render_student", content_store, profile_store=profile_store, session="render")
+            assert "first_step" in page
+        assert _without_history(profile_store.get_profile("render_student").to_dict()) == stored
+    with JSONLearnerProfileStore(store_dir) as profile_store:
+        reloaded = _without_history(profile_store.get_profile("render_student").to_dict())
+    assert reloaded == stored
+    assert "first_step" not in reloaded["earned_badges_data"]
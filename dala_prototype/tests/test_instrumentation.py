@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""Per-request recording of spans and counters, and its isolation from other requests and threads."""
+
+import threading
+
+from dcw_apg_module import PathwayGenerator
+from hlp_module import make_session_rng
+from instrumentation_module import (
+    NULL_SINK,
+    RecordingSink,
+    get_sink,
+    increment,
+    instrumented,
+    record_request,
+    set_sink,
+    span,
+)
+
+
+@instrumented("test.double")
+def _double(value):
+    return value * 2
+
+
+def test_record_request_captures_spans_and_counters_inside_the_block():
+    increment("test.before") # Inactive: nothing is listening yet
+    with record_request() as recording:
+        with span("test.block"):
+            increment("test.counter", 2)
+            increment("test.counter")
+        assert _double(4) == 8
+    increment("test.after")
+
+    exported = recording.export()
+    assert exported["counters"] == {"test.counter": 3}
+    assert set(exported["spans"]) == {"test.block", "test.double"}
+    assert exported["spans"]["test.block"]["count"] == 1
+    assert exported["spans"]["test.block"]["max_ms"] <= exported["spans"]["test.block"]["total_ms"]
+
+
+def test_concurrent_requests_only_see_their_own_work():
+    recordings = {}
+
+    def request(name, calls):
+        with record_request() as recording:
+            for _ in range(calls):
+                increment(name)
+        recordings[name] = recording.export()["counters"]
+
+    threads = [threading.Thread(target=request, args=(f"test.thread_{calls}", calls)) for calls in (1, 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert recordings == {"test.thread_1": {"test.thread_1": 1}, "test.thread_5": {"test.thread_5": 5}}
+
+
+def test_process_wide_sink_receives_the_same_events_as_the_request():
+    process_sink = RecordingSink()
+    previous = set_sink(process_sink)
+    try:
+        with record_request() as recording:
+            increment("test.shared")
+        increment("test.process_only")
+    finally:
+        assert set_sink(previous) is process_sink
+    assert get_sink() is NULL_SINK
+    assert recording.export()["counters"] == {"test.shared": 1}
+    assert process_sink.export()["counters"] == {"test.process_only": 1, "test.shared": 1}
+
+
+def test_pathway_generation_is_recorded(content_store, profiles):
+    generator = PathwayGenerator(profiles[0], content_store, rng=make_session_rng(profiles[0].learner_id, "instrumented"))
+    with record_request() as recording:
+        generator.generate_initial_pathway()
+    exported = recording.export()
+    assert {"pathway.generate_initial", "pathway.eligible_los"} <= set(exported["spans"])
+    assert exported["counters"].get("content_store.get_lo_by_id", 0) > 0
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Lookahead planning over the prerequisite graph."""
+
+from curriculum_content_module import CurriculumContentStore, PrerequisiteGraph
+from dcw_apg_module import PathwayGenerator
+from hlp_module import LearnerProfile
+
+LEARNING_OBJECTIVES = [
+    {"id": "A", "prerequisites": []},
+    {"id": "B", "prerequisites": []},
+    {"id": "C", "prerequisites": ["A"]},
+    {"id": "D", "prerequisites": ["A", "B"]},
+    {"id": "E", "prerequisites": ["C", "D"]},
+    {"id": "F", "prerequisites": ["E"]},
+]
+
+
+def _assert_prerequisites_come_first(graph, plan, completed=()):
+    seen = set(completed)
+    for lo_id, _ in plan:
+        assert all(prereq_id in seen for prereq_id in graph.prerequisites[lo_id])
+        seen.add(lo_id)
+
+
+def test_plan_follows_prerequisites_and_reports_layers():
+    graph = PrerequisiteGraph(LEARNING_OBJECTIVES)
+    plan = graph.plan_lookahead(["A", "B"], lambda lo_id: False, 10)
+    assert dict(plan) == {"A": 0, "B": 0, "C": 1, "D": 1, "E": 2, "F": 3}
+    _assert_prerequisites_come_first(graph, plan)
+    # Among LOs available at the same point, the plan follows the topological order
+    assert [graph.topological_rank[lo_id] for lo_id, _ in plan] == sorted(graph.topological_rank[lo_id] for lo_id, _ in plan)
+
+
+def test_plan_is_capped_and_skips_completed_los():
+    graph = PrerequisiteGraph(LEARNING_OBJECTIVES)
+    completed = {"A", "C"}
+    plan = graph.plan_lookahead(["B"], completed.__contains__, 3)
+    assert plan == [("B", 0), ("D", 1), ("E", 2)]
+    _assert_prerequisites_come_first(graph, plan, completed)
+    assert graph.plan_lookahead(["A", "B"], lambda lo_id: False, 0) == []
+    assert [lo_id for lo_id, _ in graph.plan_lookahead(["A", "B"], lambda lo_id: False, 2)] == ["A", "B"]
+
+
+def test_lookahead_pathway_includes_unlocked_los():
+    store = CurriculumContentStore({"learning_objectives": LEARNING_OBJECTIVES}, [])
+    profile = LearnerProfile("lookahead_student")
+    profile.mark_lo_completed("A")
+    generator = PathwayGenerator(profile, store)
+    planned = generator._get_lookahead_los(4)
+    assert [(lo["id"], lo["lookahead_layer"]) for lo in planned] == [("B", 0), ("C", 0), ("D", 1), ("E", 2)]
+    assert "lookahead_layer" not in store.get_lo_by_id("B") # Planned LOs are copies
+    assert sorted(lo["id"] for lo in generator._get_eligible_next_los(4)) == ["B", "C"] # Without lookahead
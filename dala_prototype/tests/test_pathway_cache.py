@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""Keys, session separation and invalidation of the pathway cache."""
+
+import re
+
+import pytest
+
+from dcw_apg_module import PathwayCache, PathwayGenerator, default_pathway_cache
+from generate_interface import render_html_interface
+
+
+def _generate(profile, store, cache, session):
+    return PathwayGenerator(profile, store, pathway_cache=cache, session=session).generate_initial_pathway()
+
+
+def test_sessions_get_separate_entries(content_store, profiles):
+    profile = profiles[0]
+    assert PathwayCache.make_key(profile, content_store, 5, 3, session="a") != \
+           PathwayCache.make_key(profile, content_store, 5, 3, session="b")
+    cache = PathwayCache()
+    first = _generate(profile, content_store, cache, "a")
+    _generate(profile, content_store, cache, "b")
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+    assert _generate(profile, content_store, cache, "a") is first
+    assert cache.hits == 1
+
+
+def test_profile_changes_invalidate_entries(content_store, profiles):
+    profile = profiles[0]
+    cache = PathwayCache()
+    pathway = _generate(profile, content_store, cache, "a")
+    assert len(cache) == 1
+    profile.mark_lo_completed(pathway[0]["id"])
+    assert len(cache) == 0
+    assert pathway[0]["id"] not in [lo["id"] for lo in _generate(profile, content_store, cache, "a")]
+
+
+def test_content_store_version_is_part_of_the_key(content_store, profiles):
+    cache = PathwayCache()
+    _generate(profiles[0], content_store, cache, "a")
+    patched_store = content_store.with_changes(removed_content_ids=["SYN_CONT_0_0"])
+    _generate(profiles[0], patched_store, cache, "a")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.fixture
+def clean_default_cache():
+    default_pathway_cache.clear()
+    yield default_pathway_cache
+    default_pathway_cache.clear()
+
+
+def test_render_reuses_the_cached_pathway(content_store, clean_default_cache):
+    without_timestamps = lambda page: re.sub(r"\d{4}-\d\d-\d\dT[\d:.]+Z", "", page)
+    first = render_html_interface("cache_student", content_store, session="render")
+    hits = clean_default_cache.hits
+    second = render_html_interface("cache_student", content_store, session="render")
+    assert clean_default_cache.hits == hits + 1
+    assert without_timestamps(second) == without_timestamps(first)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""Request coalescing and in-flight bookkeeping of the asyncio pathway service."""
+
+import asyncio
+import threading
+
+from pathway_service_module import LocalPathwayClient, PathwayService
+
+
+class _GatedProvider:
+    """Content store provider that blocks generations until released and counts how many started."""
+
+    def __init__(self, content_store):
+        self.content_store = content_store
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(timeout=10)
+        return self.content_store
+
+
+async def _until(condition):
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("Condition was not reached")
+
+
+def test_identical_requests_share_one_generation(content_store):
+    provider = _GatedProvider(content_store)
+
+    async def scenario():
+        async with PathwayService(provider, pathway_cache=None, session="service") as service:
+            requests = [asyncio.ensure_future(service.get_pathway("SYN_STUDENT_A")) for _ in range(5)]
+            other = asyncio.ensure_future(service.get_pathway("SYN_STUDENT_A", target_lo_count=2))
+            await _until(lambda: provider.calls == 2)
+            assert service.metrics()["in_flight"] == 2
+            assert service.coalesced_requests == 4
+
+            provider.release.set()
+            pathways = await asyncio.gather(*requests)
+            await other
+            assert all(pathway is pathways[0] for pathway in pathways)
+            metrics = service.metrics()
+            assert metrics["in_flight"] == 0
+            assert metrics["pathway"]["count"] == 6
+        assert provider.calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_single_requests_join_an_in_flight_batch(content_store):
+    provider = _GatedProvider(content_store)
+
+    async def scenario():
+        async with PathwayService(provider, pathway_cache=None, batch_chunk_size=2, session="service") as service:
+            batch = asyncio.ensure_future(service.get_pathways(["L1", "L2", "L3", "L1"]))
+            await _until(lambda: service.metrics()["in_flight"] == 3)
+            single = asyncio.ensure_future(service.get_pathway("L3"))
+            await asyncio.sleep(0)
+            assert service.coalesced_requests == 1
+
+            provider.release.set()
+            pathways = await batch
+            assert list(pathways) == ["L1", "L2", "L3"]
+            assert await single is pathways["L3"]
+            assert service.metrics()["in_flight"] == 0
+        assert provider.calls == 2 # One per chunk of two learners
+
+    asyncio.run(scenario())
+
+
+def test_failed_generation_is_reported_to_every_caller():
+    def failing_provider():
+        raise RuntimeError("store unavailable")
+
+    async def scenario():
+        async with PathwayService(failing_provider, pathway_cache=None) as service:
+            client = LocalPathwayClient(service)
+            responses = await asyncio.gather(*(client.request_pathway("SYN_STUDENT_A") for _ in range(3)))
+            assert [response["status"] for response in responses] == ["error"] * 3
+            assert responses[0]["error"] == "store unavailable"
+            assert service.coalesced_requests == 2
+            metrics = service.metrics()
+            assert metrics["in_flight"] == 0
+            assert metrics["pathway"]["errors"] == 3
+
+    asyncio.run(scenario())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""Round trips and flushing of the learner profile stores."""
+
+import time
+from functools import partial
+
+import pytest
+
+from hlp_module import LearnerProfile, CompactLearnerProfile
+from profile_persistence_module import LearnerProfileStore, JSONLearnerProfileStore, SQLiteLearnerProfileStore
+
+
+def _make_profile(learner_id="store_student"):
+    profile = LearnerProfile(learner_id)
+    profile.update_preference("visual_task_1", "visual")
+    profile.add_interest("Robotics")
+    profile.mark_lo_completed("Y4MD_LO1")
+    profile.record_served_content(["CONT_A", "CONT_B"])
+    return profile
+
+
+def _open_store(kind, tmp_path, **options):
+    if kind == "json":
+        return JSONLearnerProfileStore(str(tmp_path / "learners"), **options)
+    return SQLiteLearnerProfileStore(str(tmp_path / "learners.db"), **options)
+
+
+def test_store_hooks_are_abstract():
+    with pytest.raises(TypeError):
+        LearnerProfileStore()
+
+
+@pytest.mark.parametrize("kind", ["json", "sqlite"])
+def test_profile_round_trip(kind, tmp_path):
+    profile = _make_profile()
+    with _open_store(kind, tmp_path) as store:
+        store.save_profile(profile)
+
+    with _open_store(kind, tmp_path) as store:
+        assert store.list_learners() == ["store_student"]
+        loaded = store.get_profile("store_student")
+    assert loaded.to_dict() == profile.to_dict()
+    assert loaded.recent_content.to_list() == ["CONT_A", "CONT_B"]
+
+
+@pytest.mark.parametrize("kind", ["json", "sqlite"])
+def test_compact_profiles_round_trip(kind, tmp_path, content_store):
+    profile = _make_profile()
+    profile.mark_lo_completed("SYN_LO_0")
+    with _open_store(kind, tmp_path) as store:
+        store.save_profile(profile)
+
+    factory = partial(CompactLearnerProfile.from_dict, lo_catalog=content_store.prerequisite_graph)
+    with _open_store(kind, tmp_path, profile_factory=factory) as store:
+        loaded = store.get_profile("store_student")
+    assert isinstance(loaded, CompactLearnerProfile)
+    assert loaded.to_dict() == profile.to_dict()
+
+
+@pytest.mark.parametrize("kind", ["json", "sqlite"])
+def test_mutations_are_flushed_in_the_background(kind, tmp_path):
+    store = _open_store(kind, tmp_path, flush_interval_seconds=0.05)
+    try:
+        store.save_profile(LearnerProfile("store_student"))
+        store.flush()
+        store.get_profile("store_student").mark_lo_completed("Y4MD_LO2")
+        deadline = time.monotonic() + 5
+        while store._dirty and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not store._dirty
+        with _open_store(kind, tmp_path) as reader:
+            assert reader.get_profile("store_student").has_completed_lo("Y4MD_LO2")
+    finally:
+        store.close()
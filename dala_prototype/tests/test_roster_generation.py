@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Bulk roster generation: batching, worker-count independence and output file names."""
+
+import re
+
+import pytest
+
+import generate_interface
+from config import ROSTER_OUTPUT_FILENAME_PATTERN
+from generate_interface import generate_interfaces_for_roster
+
+_DATE_EARNED = re.compile(r'"date_earned": "[^"]*"')
+
+STUDENT_IDS = ["roster_a", "roster_b", "roster_c", "roster_d", "roster_e"]
+
+
+def _generate(monkeypatch, output_dir, **kwargs):
+    output_dir.mkdir()
+    monkeypatch.setattr(generate_interface, "prepare_output_dir", lambda: str(output_dir))
+    return generate_interfaces_for_roster(STUDENT_IDS, batch_size=2, session="roster", **kwargs)
+
+
+def _read_page(path):
+    """Returns a generated page with badge award timestamps masked, as they are the only wall-clock values."""
+    with open(path, encoding="utf-8") as f:
+        return _DATE_EARNED.sub('"date_earned": ""', f.read())
+
+
+def test_roster_pages_do_not_depend_on_the_number_of_workers(monkeypatch, tmp_path):
+    sequential = _generate(monkeypatch, tmp_path / "sequential", workers=1)
+    parallel = _generate(monkeypatch, tmp_path / "parallel", workers=2)
+    assert [path.rsplit("/", 1)[1] for path in sequential] == [ROSTER_OUTPUT_FILENAME_PATTERN.format(student_id=student_id) for student_id in STUDENT_IDS]
+    assert [path.rsplit("/", 1)[1] for path in parallel] == [path.rsplit("/", 1)[1] for path in sequential]
+    for sequential_path, parallel_path in zip(sequential, parallel):
+        assert _read_page(sequential_path) == _read_page(parallel_path)
+
+
+@pytest.mark.parametrize("student_id", ["", ".hidden", "../escape", "a/b"])
+def test_student_ids_unusable_as_file_names_are_rejected(student_id):
+    with pytest.raises(ValueError, match="Invalid student ID"):
+        generate_interfaces_for_roster([student_id], workers=1)
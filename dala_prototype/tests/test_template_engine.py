@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Parity of compiled template rendering with `str.format`, and the mtime-keyed template cache."""
+
+import os
+
+import pytest
+
+from generate_interface import HTML_TEMPLATE_PATH
+from template_engine import CompiledTemplate, clear_template_cache, get_compiled_template, join_fragments
+
+
+@pytest.mark.parametrize("source, values", [
+    ("<p>{name}</p>{{literal}} {name}", {"name": "Ada"}),
+    ("{count:>4}|{ratio:.2f}|{label!r}", {"count": 7, "ratio": 0.125, "label": "x"}),
+    ("{profile[name]} / {profile[level]}", {"profile": {"name": "Ada", "level": 3}}),
+    ("no fields at all", {}),
+])
+def test_render_matches_str_format(source, values):
+    assert CompiledTemplate(source).render(**values) == source.format(**values)
+
+
+def test_student_interface_template_matches_str_format():
+    with open(HTML_TEMPLATE_PATH, "r", encoding="utf-8") as f:
+        source = f.read()
+    template = CompiledTemplate(source)
+    values = {name.split("[")[0].split(".")[0]: f"<{name}>" for name in template.field_names}
+    assert template.render(**values) == source.format(**values)
+
+
+def test_missing_field_and_positional_fields_are_rejected():
+    with pytest.raises(KeyError):
+        CompiledTemplate("{present}{absent}").render(present=1)
+    with pytest.raises(ValueError, match="Positional"):
+        CompiledTemplate("{} and {0}")
+
+
+def test_template_is_recompiled_when_the_file_changes(tmp_path):
+    clear_template_cache()
+    template_path = tmp_path / "page.html"
+    template_path.write_text("<h1>{title}</h1>", encoding="utf-8")
+    first = get_compiled_template(str(template_path))
+    assert get_compiled_template(str(template_path)) is first
+
+    template_path.write_text("<h2>{title}</h2>", encoding="utf-8")
+    stat = os.stat(template_path)
+    os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_compiled_template(str(template_path)).render(title="t") == "<h2>t</h2>"
+    clear_template_cache()
+
+
+def test_join_fragments():
+    assert join_fragments([1, 2], lambda item: f"<li>{item}</li>") == "<li>1</li><li>2</li>"
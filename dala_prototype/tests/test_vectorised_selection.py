@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""Parity of `VectorisedContentSelector` with the per-item selection of `PathwayGenerator`."""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dcw_apg_module import PathwayGenerator  # noqa: E402
+from hlp_module import RecentContentHistory  # noqa: E402
+from vectorised_selection_module import VectorisedContentSelector  # noqa: E402
+
+
+@pytest.mark.parametrize("max_activities", [1, 2, 3, 5])
+def test_single_learner_selection_matches_per_item_selection(content_store, profiles, max_activities):
+    selector = VectorisedContentSelector(content_store)
+    for profile in profiles:
+        generator = PathwayGenerator(profile, content_store)
+        types = generator._get_preferred_content_types()
+        for lo in content_store.get_learning_objectives():
+            expected = generator._select_content_from_index(
+                lo["id"], content_store.get_content_index_for_lo(lo["id"]), max_activities
+            )
+            assert selector.select_for_lo(lo["id"], types, max_activities) == expected
+
+
+@pytest.mark.parametrize("max_activities", [1, 3, 5])
+def test_selection_with_recent_history_matches_per_item_selection(content_store, profiles, max_activities):
+    rng = random.Random(0)
+    content_ids = sorted(content_store.content_records)
+    selector = VectorisedContentSelector(content_store)
+    for profile in profiles:
+        recent_ids = rng.sample(content_ids, len(content_ids) // 2)
+        profile.recent_content = RecentContentHistory(len(recent_ids), recent_ids)
+        generator = PathwayGenerator(profile, content_store)
+        types = generator._get_preferred_content_types()
+        for lo in content_store.get_learning_objectives():
+            expected = generator._select_content_from_index(
+                lo["id"], content_store.get_content_index_for_lo(lo["id"]), max_activities
+            )
+            selected = selector.select_for_lo(lo["id"], types, max_activities, recent_content=profile.recent_content)
+            assert selected == expected
+
+
+def test_batched_selection_matches_per_learner_selection(content_store, profiles):
+    selector = VectorisedContentSelector(content_store)
+    generators = [PathwayGenerator(profile, content_store) for profile in profiles]
+    type_lists = [generator._get_preferred_content_types() for generator in generators]
+    for lo in content_store.get_learning_objectives():
+        content_index = content_store.get_content_index_for_lo(lo["id"])
+        batched = selector.select_for_learners(lo["id"], type_lists, 3)
+        assert batched == [generator._select_content_from_index(lo["id"], content_index, 3) for generator in generators]
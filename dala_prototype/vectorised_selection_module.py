@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EdPsych Connect - Dynamic AI Learning Architect (DALA)
+Vectorised Selection Module
+
+This module contains:
+1.  `VectorisedContentSelector`, an alternative to the three-pass greedy activity selection of
+    `PathwayGenerator` (preference, then variety, then fallback) that encodes each LO's content
+    as NumPy arrays and picks activities with array operations, for one learner or for a batch
+    of learners at once. It selects exactly the activities `PathwayGenerator` selects.
+
+The selector is a standalone engine and is not wired into pathway generation: cohort runs
+already select once per preference combination and LO (`PathwayPrecomputation`), and that
+memoised per-item selection beat batched selection for 2,000 learners over 200 LOs
+(0.13 s vs 0.16 s). benchmarks/bench_vectorised_selection.py checks parity and compares the
+engines without memoisation.
+
+NumPy is an optional dependency: this module imports without it, and `NUMPY_AVAILABLE` tells
+callers whether the selector can be used.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError: # Optional dependency; VectorisedContentSelector raises if it is missing
+    np = None
+
+from config import setup_logging, CONTENT_TYPE_PRIORITY_FOR_VARIETY, DEFAULT_MAX_ACTIVITIES_PER_LO
+from curriculum_content_module import CurriculumContentStore, ContentRecord
+from instrumentation_module import instrumented
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+NUMPY_AVAILABLE: bool = np is not None
+"""Whether NumPy could be imported, i.e. whether `VectorisedContentSelector` can be used."""
+
+# Rank of a content type that is not in a preference or variety list; sorts after every real rank
+_UNRANKED = 1 << 30
+
+
+class _LOArrays:
+    """The content of one LO encoded for selection.
+
+    Attributes:
+        records (List[ContentRecord]): The LO's content, easiest first (as in its `LOContentIndex`).
+        type_codes (np.ndarray): The content type code of each record, in the same order.
+        head_positions (np.ndarray): Positions of the easiest record of each content type, ascending.
+        head_type_codes (np.ndarray): The content type code of each of those records.
+    """
+
+    __slots__ = ("records", "type_codes", "head_positions", "head_type_codes")
+
+    def __init__(self, records: List[ContentRecord], type_codes: Any):
+        self.records = records
+        self.type_codes = type_codes
+        _, first_positions = np.unique(type_codes, return_index=True)
+        self.head_positions = np.sort(first_positions)
+        self.head_type_codes = type_codes[self.head_positions]
+
+
+class VectorisedContentSelector:
+    """Selects activities for LOs with array operations instead of per-item Python loops.
+
+    Each LO's content is taken in the difficulty order of the store's `LOContentIndex` and encoded
+    once as an array of content type codes. A learner's ordered preferred content types become a
+    rank per type code, so the preference pass is an argsort of the ranks of each type's easiest
+    record; the variety pass does the same with `CONTENT_TYPE_PRIORITY_FOR_VARIETY`, and the
+    fallback pass takes the easiest records not picked yet. Learners are batched as a matrix with
+    one row per distinct preferred-type list. As in `PathwayGenerator`, content in a learner's
+    recent history is held back until the other content is exhausted; `select_for_lo` handles
+    that per learner on the subset of content not served recently.
+
+    As with `_derive_preferred_content_types`, each content type is expected at most once in a
+    preferred-type list.
+
+    Attributes:
+        content_store (CurriculumContentStore): The store the content is encoded from.
+        type_codes (Dict[Optional[str], int]): Code of each content type seen so far.
+    """
+
+    def __init__(self, content_store: CurriculumContentStore):
+        """Binds the selector to a content store; LOs are encoded the first time they are selected for.
+
+        Args:
+            content_store (CurriculumContentStore): Repository of curriculum and content data.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("VectorisedContentSelector requires NumPy; install it with 'pip install numpy'.")
+        self.content_store = content_store
+        self.type_codes: Dict[Optional[str], int] = {}
+        self._lo_arrays: Dict[str, _LOArrays] = {}
+        self._lock = threading.Lock()
+
+    def select_for_lo(
+        self,
+        lo_id: str,
+        preferred_types: Sequence[str],
+        max_activities: int = DEFAULT_MAX_ACTIVITIES_PER_LO,
+        recent_content: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Selects activities for one learner, as `PathwayGenerator._select_content_from_index` would.
+
+        Setting up the arrays costs more than the per-item passes save for a single learner, so
+        this is several times slower than `_select_content_from_index` and meant for parity
+        checks. Use `select_for_learners` for throughput.
+
+        Args:
+            lo_id (str): The ID of the learning objective.
+            preferred_types (Sequence[str]): The learner's content types, most preferred first.
+            max_activities (int, optional): Maximum number of activities to select.
+                                            Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+            recent_content (Optional[RecentContentHistory], optional): The learner's recently served content;
+                                                                       it only fills slots no other content
+                                                                       can. Defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: The selected content items.
+        """
+        if recent_content:
+            lo_arrays = self._arrays_for(lo_id)
+            fresh = np.fromiter(
+                (record.content_id not in recent_content for record in lo_arrays.records),
+                dtype=bool, count=len(lo_arrays.records)
+            )
+            if not fresh.all():
+                return self._select_avoiding_recent(lo_arrays, fresh, tuple(preferred_types), max_activities, recent_content)
+        return self.select_for_learners(lo_id, [preferred_types], max_activities)[0]
+
+    @instrumented("pathway.select_vectorised")
+    def select_for_learners(
+        self,
+        lo_id: str,
+        preferred_type_lists: Sequence[Sequence[str]],
+        max_activities: int = DEFAULT_MAX_ACTIVITIES_PER_LO
+    ) -> List[List[Dict[str, Any]]]:
+        """Selects activities for an LO for several learners at once.
+
+        Args:
+            lo_id (str): The ID of the learning objective.
+            preferred_type_lists (Sequence[Sequence[str]]): Each learner's content types, most preferred first.
+            max_activities (int, optional): Maximum number of activities per learner.
+                                            Defaults to DEFAULT_MAX_ACTIVITIES_PER_LO.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The selected content items of each learner, in input order.
+        """
+        lo_arrays = self._arrays_for(lo_id)
+        if not lo_arrays.records or max_activities <= 0:
+            return [[] for _ in preferred_type_lists]
+
+        # One matrix row per distinct preferred-type list
+        row_by_list: Dict[Tuple[str, ...], int] = {}
+        learner_rows = [row_by_list.setdefault(tuple(types), len(row_by_list)) for types in preferred_type_lists]
+        row_positions = self._select_rows(lo_arrays, list(row_by_list), max_activities)
+        row_items = [[lo_arrays.records[position].item for position in positions] for positions in row_positions]
+        return [list(row_items[row]) for row in learner_rows]
+
+    def _select_avoiding_recent(
+        self,
+        lo_arrays: _LOArrays,
+        fresh: Any,
+        preferred_types: Tuple[str, ...],
+        max_activities: int,
+        recent_content: Any
+    ) -> List[Dict[str, Any]]:
+        """Selects among the records not served recently, then fills open slots with recent ones."""
+        if max_activities <= 0:
+            return []
+        fresh_positions = np.flatnonzero(fresh)
+        positions: List[int] = []
+        if len(fresh_positions):
+            fresh_arrays = _LOArrays(
+                [lo_arrays.records[position] for position in fresh_positions], lo_arrays.type_codes[fresh_positions]
+            )
+            positions = fresh_positions[self._select_rows(fresh_arrays, [preferred_types], max_activities)[0]].tolist()
+        # Repeats only fill the slots no other content could, least recently served first
+        recent_positions = np.flatnonzero(~fresh)
+        served_orders = np.fromiter(
+            (recent_content.served_order(lo_arrays.records[position].content_id) for position in recent_positions),
+            dtype=np.int64, count=len(recent_positions)
+        )
+        repeat_order = np.argsort(served_orders, kind="stable")[:max_activities - len(positions)]
+        positions.extend(recent_positions[repeat_order].tolist())
+        return [lo_arrays.records[position].item for position in positions]
+
+    def _select_rows(self, lo_arrays: _LOArrays, type_lists: List[Tuple[str, ...]], max_activities: int) -> List[List[int]]:
+        """Returns the positions of the records selected for each preferred-type list."""
+        num_codes = len(self.type_codes)
+        preference_ranks = np.full((len(type_lists), num_codes), _UNRANKED, dtype=np.int64)
+        for row, types in enumerate(type_lists):
+            for rank, content_type in enumerate(types):
+                code = self.type_codes.get(content_type)
+                if code is not None and preference_ranks[row, code] == _UNRANKED:
+                    preference_ranks[row, code] = rank
+        variety_ranks = np.full(num_codes, _UNRANKED, dtype=np.int64)
+        for rank, content_type in enumerate(CONTENT_TYPE_PRIORITY_FOR_VARIETY):
+            code = self.type_codes.get(content_type)
+            if code is not None and variety_ranks[code] == _UNRANKED:
+                variety_ranks[code] = rank
+
+        # Preference pass: the easiest record of each preferred type, in preference order
+        head_scores = preference_ranks[:, lo_arrays.head_type_codes]
+        head_order = np.argsort(head_scores, axis=1, kind="stable")[:, :max_activities]
+        head_picked = np.take_along_axis(head_scores, head_order, axis=1) < _UNRANKED
+        head_variety_scores = variety_ranks[lo_arrays.head_type_codes]
+        num_records = len(lo_arrays.records)
+
+        selections = []
+        for row in range(len(type_lists)):
+            picked_heads = head_order[row][head_picked[row]]
+            positions = lo_arrays.head_positions[picked_heads].tolist()
+            if len(positions) < max_activities:
+                # Variety pass: the easiest record of each type not selected yet, in variety order
+                variety_scores = head_variety_scores.copy()
+                variety_scores[picked_heads] = _UNRANKED
+                variety_order = np.argsort(variety_scores, kind="stable")[:max_activities - len(positions)]
+                variety_heads = variety_order[variety_scores[variety_order] < _UNRANKED]
+                positions.extend(lo_arrays.head_positions[variety_heads].tolist())
+            if len(positions) < max_activities:
+                # Fallback pass: the easiest records not selected yet
+                unused = np.ones(num_records, dtype=bool)
+                unused[positions] = False
+                positions.extend(np.flatnonzero(unused)[:max_activities - len(positions)].tolist())
+            selections.append(positions)
+        return selections
+
+    def _arrays_for(self, lo_id: str) -> _LOArrays:
+        """Returns the encoded content of an LO, encoding it on first use."""
+        lo_arrays = self._lo_arrays.get(lo_id)
+        if lo_arrays is None:
+            records = self.content_store.get_content_index_for_lo(lo_id).records
+            with self._lock:
+                type_codes = np.fromiter(
+                    (self.type_codes.setdefault(record.content_type, len(self.type_codes)) for record in records),
+                    dtype=np.int64, count=len(records)
+                )
+            lo_arrays = self._lo_arrays[lo_id] = _LOArrays(records, type_codes)
+        return lo_arrays
+
+
+if __name__ == "__main__":
+    setup_logging() # Configure logging only when run as a script
+    if not NUMPY_AVAILABLE:
+        logger.warning("NumPy is not installed; the vectorised selector is unavailable.")
+    else:
+        from generate_interface import build_combined_content_store
+
+        demo_store = build_combined_content_store()
+        demo_selector = VectorisedContentSelector(demo_store)
+        for demo_lo in demo_store.get_learning_objectives()[:3]:
+            demo_items = demo_selector.select_for_lo(demo_lo["id"], ["game", "video", "worksheet_pdf"])
+            logger.info(f"{demo_lo['id']}: {[item.get('id') for item in demo_items]}")